@@ -0,0 +1,79 @@
+import argparse
+import json
+
+from palworld_save_pal.editor.batch_edit import edit_worlds, find_worlds, load_script
+from palworld_save_pal.utils.logging_config import create_logger, setup_logging
+
+logger = create_logger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="psp-batch-edit",
+        description="Applies a JSON edit script to one or more Palworld worlds without the UI",
+    )
+    parser.add_argument(
+        "path",
+        help="World directory containing Level.sav, or a directory of worlds",
+    )
+    parser.add_argument("--script", "-s", required=True, help="JSON edit script")
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=None,
+        help="Worlds to edit in parallel (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Apply the script without writing any world",
+    )
+    parser.add_argument(
+        "--no-backup",
+        action="store_true",
+        help="Do not snapshot Level.sav into the backup store before writing",
+    )
+    parser.add_argument("--report", help="Write per-world results as JSON")
+    parser.add_argument("--dev", action="store_true", help="Run in development mode")
+    args = parser.parse_args()
+
+    setup_logging(dev_mode=args.dev)
+
+    script = load_script(args.script)
+    worlds = find_worlds(args.path)
+    if not worlds:
+        logger.error("No Level.sav found under %s", args.path)
+        exit(1)
+    logger.info(
+        "Applying %s operations to %s worlds", len(script.operations), len(worlds)
+    )
+
+    results = edit_worlds(
+        worlds, script, jobs=args.jobs, dry_run=args.dry_run, backup=not args.no_backup
+    )
+    for result in results:
+        if result.ok:
+            logger.info(
+                "%s: %s operations, %s players, %s pals%s",
+                result.world,
+                result.applied,
+                result.players,
+                result.pals,
+                "" if result.written else " (not written)",
+            )
+        else:
+            logger.error("%s: %s", result.world, "; ".join(result.errors))
+
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump([r.model_dump() for r in results], f, indent=2)
+
+    failed = sum(1 for r in results if not r.ok)
+    logger.info("Edited %s/%s worlds", len(results) - failed, len(results))
+    if failed:
+        exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+import argparse
+
+from palworld_save_pal.utils.logging_config import create_logger, setup_logging
+from palworld_save_pal.utils.reference_bundle import BUNDLE_DIR, write_bundles
+from palworld_save_pal.utils.reference_data import DATA_DIR, get_languages
+
+logger = create_logger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="psp-bundle",
+        description="Builds precompressed per-language reference data bundles served by Palworld Save Pal",
+    )
+    parser.add_argument(
+        "--data-dir",
+        default=DATA_DIR,
+        help=f"Reference data directory (default: {DATA_DIR})",
+    )
+    parser.add_argument(
+        "--output",
+        "-o",
+        default=BUNDLE_DIR,
+        help=f"Output directory (default: {BUNDLE_DIR})",
+    )
+    parser.add_argument(
+        "--language",
+        "-l",
+        action="append",
+        help="Language to build, may be repeated (default: all languages)",
+    )
+    parser.add_argument("--dev", action="store_true", help="Run in development mode")
+    args = parser.parse_args()
+
+    setup_logging(dev_mode=args.dev)
+
+    available = get_languages(args.data_dir)
+    if not available:
+        logger.error("No languages found in %s", args.data_dir)
+        exit(1)
+    unknown = [lang for lang in args.language or [] if lang not in available]
+    if unknown:
+        logger.error("Unknown languages %s, expected any of %s", unknown, available)
+        exit(1)
+
+    manifest = write_bundles(args.output, args.language, args.data_dir)
+    logger.info("Wrote %s bundles to %s", len(manifest), args.output)
+
+
+if __name__ == "__main__":
+    main()
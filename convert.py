@@ -1,49 +1,32 @@
 import argparse
 import json
+import multiprocessing
 import os
 from collections import defaultdict
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Dict, Any, Set
-from deepdiff import DeepDiff
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Any, Optional, Set
 
 
+from palworld_save_pal.game.json_import import json_file_to_sav
 from palworld_save_pal.game.save_file import SaveFile
+from palworld_save_pal.game.save_validator import (
+    Severity,
+    ValidationReport,
+    validate_world_save_data,
+)
+from palworld_save_pal.utils.batch_convert import (
+    SUMMARY_FILE,
+    convert_files,
+    find_save_files,
+    source_root,
+)
+from palworld_save_pal.utils.json_stream import write_json
+from palworld_save_pal.utils.save_diff import diff_objects
 from palworld_save_pal.utils.logging_config import create_logger, setup_logging
 
-save_file = SaveFile()
 logger = create_logger(__name__)
 
 
-class ValidationResults:
-    def __init__(self):
-        self.unknown_character_ids: Set[str] = set()
-        self.unexpected_gender_values: Set[str] = set()
-        self.unknown_active_skills: Set[str] = set()
-        self.unknown_passive_skills: Set[str] = set()
-
-    def log_results(self):
-        if self.unknown_character_ids:
-            logger.warning(
-                "Unknown character IDs: %s",
-                ", ".join(sorted(self.unknown_character_ids)),
-            )
-        if self.unexpected_gender_values:
-            logger.warning(
-                "Unexpected gender values: %s",
-                ", ".join(sorted(self.unexpected_gender_values)),
-            )
-        if self.unknown_active_skills:
-            logger.warning(
-                "Unknown active skills: %s",
-                ", ".join(sorted(self.unknown_active_skills)),
-            )
-        if self.unknown_passive_skills:
-            logger.warning(
-                "Unknown passive skills: %s",
-                ", ".join(sorted(self.unknown_passive_skills)),
-            )
-
-
 class SaveComparison:
     TRACKED_OBJECTS = [
         "CharacterContainerSaveData",
@@ -53,6 +36,7 @@ class SaveComparison:
     ]
 
     def __init__(self, original_data: Dict, modified_data: Dict, output_dir: str):
+        # Both trees come straight from the loaded saves, not from JSON text
         self.original_data = self._extract_world_save_data(original_data)
         self.modified_data = self._extract_world_save_data(modified_data)
         self.differences = defaultdict(
@@ -115,50 +99,12 @@ class SaveComparison:
             if not original_obj and not modified_obj:
                 continue
 
-            diff = DeepDiff(original_obj, modified_obj, ignore_order=True)
-
-            # Process additions
-            self._process_additions(obj_name, diff)
-            # Process deletions
-            self._process_deletions(obj_name, diff)
-            # Process changes
-            self._process_changes(obj_name, diff)
-
-    def _process_additions(self, obj_name: str, diff: DeepDiff):
-        added_items = diff.get("dictionary_item_added", set())
-        if added_items:
-            for path in added_items:
-                clean_path = path.replace("root", "")
-                added_value = eval(f"self.modified_data['{obj_name}']{clean_path}")
-                self.differences[obj_name]["Added"].append(
-                    {"path": clean_path, "value": added_value}
-                )
+            report = diff_objects(original_obj, modified_obj)
+            for action, items in report.items():
+                self.differences[obj_name][action].extend(items)
 
-    def _process_deletions(self, obj_name: str, diff: DeepDiff):
-        deleted_items = diff.get("dictionary_item_removed", set())
-        if deleted_items:
-            for path in deleted_items:
-                clean_path = path.replace("root", "")
-                deleted_value = eval(f"self.original_data['{obj_name}']{clean_path}")
-                self.differences[obj_name]["Deleted"].append(
-                    {"path": clean_path, "value": deleted_value}
-                )
 
-    def _process_changes(self, obj_name: str, diff: DeepDiff):
-        changed_items = diff.get("values_changed", {})
-        if changed_items:
-            for path, change in changed_items.items():
-                clean_path = path.replace("root", "")
-                self.differences[obj_name]["Updated"].append(
-                    {
-                        "path": clean_path,
-                        "old_value": change["old_value"],
-                        "new_value": change["new_value"],
-                    }
-                )
-
-
-def write_json_object(key, value, output_dir, force):
+def write_json_object(key, value, output_dir, force, allow_nan=True):
     output_file = os.path.join(output_dir, f"{key}.json")
 
     if os.path.exists(output_file) and not force:
@@ -166,18 +112,44 @@ def write_json_object(key, value, output_dir, force):
         return False
 
     with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(value, f, indent=2)
+        write_json(value, f, indent=2, allow_nan=allow_nan)
     logger.info("Exported %s to %s", key, output_file)
     return True
 
 
+# Sections of the tree being split, inherited by forked workers so they
+# are never pickled
+_split_sections: Dict[str, Any] = {}
+
+
+def _write_section(key, output_dir, force, allow_nan, value=None):
+    if value is None:
+        value = _split_sections[key]
+    return write_json_object(key, value, output_dir, force, allow_nan)
+
+
+def _section_size(value: Any) -> int:
+    entries = value.get("value") if isinstance(value, dict) else None
+    if isinstance(entries, dict):
+        entries = entries.get("values", entries)
+    return len(entries) if isinstance(entries, (list, dict)) else 0
+
+
 def split_json_objects(
-    json_file: str, output_dir: str, force: bool, subfolder: str = ""
+    data: Dict[str, Any],
+    output_dir: str,
+    force: bool,
+    subfolder: str = "",
+    allow_nan: bool = True,
+    jobs: Optional[int] = None,
 ):
-    logger.info("Splitting JSON objects")
-    with open(json_file, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    """Write each worldSaveData section of a loaded tree to its own JSON file.
 
+    Sections are encoded by a process pool straight from the tree. Where
+    fork is available workers inherit the tree and only receive section
+    names, elsewhere each section is pickled to its worker.
+    """
+    logger.info("Splitting JSON objects")
     world_save_data = (
         data.get("properties", {}).get("worldSaveData", {}).get("value", {})
     )
@@ -195,81 +167,75 @@ def split_json_objects(
         os.makedirs(split_dir)
         logger.info("Created split objects directory: %s", split_dir)
 
-    with ThreadPoolExecutor() as executor:
-        futures = []
-        for key, value in world_save_data.items():
-            future = executor.submit(write_json_object, key, value, split_dir, force)
-            futures.append(future)
-
-        for future in as_completed(futures):
-            future.result()
-
-
-def load_json_data(file_path: str) -> Dict[str, Any]:
-    with open(file_path, "r", encoding="utf-8") as f:
-        return json.load(f)
-
-
-def validate_character_save_parameter_map(
-    character_data: Dict[str, Any],
-    pals: Dict[str, Any],
-    active_skills: Dict[str, Any],
-    passive_skills: Dict[str, Any],
-) -> ValidationResults:
-    logger.info("Validating CharacterSaveParameterMap")
-    results = ValidationResults()
-
-    for entry in character_data.get("value", []):
-        save_parameter = (
-            entry.get("value", {})
-            .get("RawData", {})
-            .get("value", {})
-            .get("object", {})
-            .get("SaveParameter", {})
-            .get("value", {})
-        )
-
-        if save_parameter.get("IsPlayer", {}).get("value") == True:
-            continue
-
-        character_id = save_parameter.get("CharacterID", {}).get("value")
-        character_id = character_id.replace("BOSS_", "")
-        if character_id and character_id not in pals:
-            results.unknown_character_ids.add(character_id)
-
-        gender = save_parameter.get("Gender", {}).get("value", {}).get("value")
-        if gender and gender not in ["EPalGenderType::Male", "EPalGenderType::Female"]:
-            results.unexpected_gender_values.add(gender)
-
-        for skill_list in ["EquipWaza", "MasteredWaza"]:
-            skills = (
-                save_parameter.get(skill_list, {}).get("value", {}).get("values", [])
-            )
-            for skill in skills:
-                if skill not in active_skills:
-                    results.unknown_active_skills.add(skill)
-
-        passive_skills_list = (
-            save_parameter.get("PassiveSkillList", {})
-            .get("value", {})
-            .get("values", [])
-        )
-        for passive_skill in passive_skills_list:
-            if passive_skill not in passive_skills:
-                results.unknown_passive_skills.add(passive_skill)
+    # Largest sections first so one big map doesn't start last
+    keys = sorted(
+        world_save_data, key=lambda k: _section_size(world_save_data[k]), reverse=True
+    )
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(keys)))
+    if jobs == 1:
+        for key in keys:
+            write_json_object(key, world_save_data[key], split_dir, force, allow_nan)
+        return
 
-    return results
+    fork = "fork" in multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("fork" if fork else None)
+    _split_sections.clear()
+    if fork:
+        _split_sections.update(world_save_data)
+    try:
+        with ProcessPoolExecutor(max_workers=jobs, mp_context=context) as executor:
+            futures = [
+                executor.submit(
+                    _write_section,
+                    key,
+                    split_dir,
+                    force,
+                    allow_nan,
+                    None if fork else world_save_data[key],
+                )
+                for key in keys
+            ]
+            for future in as_completed(futures):
+                future.result()
+    finally:
+        _split_sections.clear()
+
+
+def log_validation(report: ValidationReport, limit: int = 20):
+    """Log every error and the first few issues of each warning code"""
+    shown = defaultdict(int)
+    for issue in report.issues:
+        if issue.severity == Severity.ERROR:
+            logger.error("%s: %s", issue.code, issue.message)
+        elif shown[issue.code] < limit:
+            shown[issue.code] += 1
+            logger.warning("%s: %s", issue.code, issue.message)
+    counts = report.counts()
+    for code, count in sorted(counts.items()):
+        logger.info("%s: %s", code, count)
+    logger.info(
+        "Checked %s in %ss, %s",
+        ", ".join(f"{count} {section}" for section, count in report.checked.items()),
+        report.seconds,
+        "no errors" if report.ok else "errors found",
+    )
 
 
 def process_save_file(
     filename: str, output_path: str, minify: bool = False, convert_nan: bool = False
 ) -> Dict:
+    """Load a SAV and return its GVAS tree, writing it as JSON if output_path is set.
+
+    The returned tree is the loaded save itself, it is never encoded to JSON
+    and parsed back. UUIDs stay UUID objects and NaN stays a float.
+    """
     save = SaveFile()
     save.name = filename
 
     with open(filename, "rb") as f:
         data = f.read()
         save.load_level_sav(data)
+    del data
 
     if output_path:
         save.to_json_file(
@@ -278,7 +244,43 @@ def process_save_file(
             allow_nan=(not convert_nan),
         )
 
-    return json.loads(save.get_json(minify=minify, allow_nan=(not convert_nan)))
+    return save.dump()
+
+
+def get_world_save_data(data: Dict[str, Any]) -> Dict[str, Any]:
+    return data.get("properties", {}).get("worldSaveData", {}).get("value", {})
+
+
+def batch_convert(args) -> bool:
+    to_json = not args.from_json
+    files = find_save_files(args.filename, to_json)
+    if not files:
+        logger.error("No worlds found under %s", args.filename)
+        return False
+    root = source_root(args.filename)
+    summary_path = args.summary or os.path.join(args.output or root, SUMMARY_FILE)
+    os.makedirs(os.path.dirname(os.path.abspath(summary_path)), exist_ok=True)
+
+    summary = convert_files(
+        files,
+        summary_path,
+        root=root,
+        output_dir=args.output,
+        to_json=to_json,
+        jobs=args.jobs,
+        minify=args.minify_json,
+        allow_nan=not args.convert_nan_to_null,
+        force=args.force,
+    )
+    logger.info(
+        "Converted %s files, skipped %s, failed %s in %ss. Summary: %s",
+        summary.converted,
+        summary.skipped,
+        summary.failed,
+        summary.seconds,
+        summary_path,
+    )
+    return summary.failed == 0
 
 
 def main():
@@ -286,7 +288,9 @@ def main():
         prog="palworld-save-tools",
         description="Converts Palworld save files to and from JSON, with optional splitting, validation, and comparison",
     )
-    parser.add_argument("filename", help="Original save file")
+    parser.add_argument(
+        "filename", help="Original save file, or a directory or glob with --batch"
+    )
     parser.add_argument(
         "--modified-save",
         help="Modified save file to compare against the original",
@@ -301,10 +305,20 @@ def main():
         action="store_true",
         help="Override heuristics and convert JSON file to SAV",
     )
+    parser.add_argument(
+        "--to-bin",
+        action="store_true",
+        help="Convert SAV file to the compact binary format (<filename>.bin)",
+    )
+    parser.add_argument(
+        "--from-bin",
+        action="store_true",
+        help="Override heuristics and convert binary file to SAV",
+    )
     parser.add_argument(
         "--output",
         "-o",
-        help="Output file (default: <filename>.json or <filename>.sav)",
+        help="Output file (default: <filename>.json, <filename>.bin or <filename>.sav)",
     )
     parser.add_argument(
         "--force",
@@ -323,16 +337,39 @@ def main():
         "--split", action="store_true", help="Split JSON objects after conversion"
     )
     parser.add_argument(
-        "--validate", action="store_true", help="Validate data after splitting"
+        "--validate",
+        action="store_true",
+        help="Check pals, containers, items and guilds against data/json",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        help="Processes used to split sections or convert files (default: CPU count)",
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Convert every world under a directory or glob; --output is then a directory",
+    )
+    parser.add_argument(
+        "--summary",
+        help=f"Batch summary file used to resume (default: <output or source>/{SUMMARY_FILE})",
     )
     args = parser.parse_args()
 
     setup_logging(dev_mode=args.dev)
 
-    if args.to_json and args.from_json:
-        logger.error("Cannot specify both --to-json and --from-json")
+    if sum([args.to_json, args.from_json, args.to_bin, args.from_bin]) > 1:
+        logger.error("Specify only one of --to-json, --from-json, --to-bin, --from-bin")
         exit(1)
 
+    if args.batch:
+        if args.to_bin or args.from_bin:
+            logger.error("--batch converts between SAV and JSON only")
+            exit(1)
+        exit(0 if batch_convert(args) else 1)
+
     if not os.path.exists(args.filename):
         logger.error("%s does not exist", args.filename)
         exit(1)
@@ -387,32 +424,49 @@ def main():
         comparison.log_differences()
 
         # Split files into separate directories
+        allow_nan = not args.convert_nan_to_null
         split_json_objects(
-            original_output, os.path.dirname(original_output), args.force, "original"
+            original_data,
+            os.path.dirname(original_output),
+            args.force,
+            "original",
+            allow_nan,
+            args.jobs,
         )
         split_json_objects(
-            modified_output, os.path.dirname(modified_output), args.force, "modified"
+            modified_data,
+            os.path.dirname(modified_output),
+            args.force,
+            "modified",
+            allow_nan,
+            args.jobs,
         )
 
         if args.validate:
-            logger.info("Validating data")
-            data_dir = os.path.join(os.path.dirname(original_output), "data", "json")
-            character_data = load_json_data(
-                os.path.join(
-                    os.path.dirname(original_output),
-                    "split_objects",
-                    "CharacterSaveParameterMap.json",
-                )
-            )
-            pals = load_json_data(os.path.join(data_dir, "pals.json"))
-            active_skills = load_json_data(os.path.join(data_dir, "active_skills.json"))
-            passive_skills = load_json_data(
-                os.path.join(data_dir, "passive_skills.json")
-            )
-            validation_results = validate_character_save_parameter_map(
-                character_data, pals, active_skills, passive_skills
-            )
-            validation_results.log_results()
+            log_validation(validate_world_save_data(get_world_save_data(original_data)))
+
+    elif args.to_bin:
+        logger.info("Converting %s to bin", args.filename)
+        output_path = args.output or args.filename + ".bin"
+        save = SaveFile()
+        save.name = args.filename
+        with open(args.filename, "rb") as f:
+            save.load_level_sav(f.read())
+        save.to_bin_file(output_path)
+        logger.info("Wrote bin to %s", output_path)
+
+        if args.validate:
+            log_validation(save.validate())
+
+    elif args.from_bin or args.filename.endswith(".bin"):
+        logger.info("Converting %s to SAV", args.filename)
+        output_path = args.output or args.filename.removesuffix(".bin")
+        save = SaveFile()
+        save.name = args.filename
+        with open(args.filename, "rb") as f:
+            save.load_bin(f.read())
+        save.to_sav_file(output_path)
+        logger.info("Wrote SAV to %s", output_path)
 
     elif args.to_json or args.filename.endswith(".sav"):
         logger.info("Converting %s to JSON", args.filename)
@@ -421,34 +475,23 @@ def main():
         else:
             output_path = args.output
 
-        process_save_file(
+        data = process_save_file(
             args.filename, output_path, args.minify_json, args.convert_nan_to_null
         )
 
         if args.split:
             logger.info("Splitting JSON objects")
             output_dir = os.path.dirname(output_path)
-            split_json_objects(output_path, output_dir, args.force)
-
-            if args.validate:
-                logger.info("Validating data")
-                data_dir = os.path.join(os.path.dirname(output_dir), "data", "json")
-                character_data = load_json_data(
-                    os.path.join(
-                        output_dir, "split_objects", "CharacterSaveParameterMap.json"
-                    )
-                )
-                pals = load_json_data(os.path.join(data_dir, "pals.json"))
-                active_skills = load_json_data(
-                    os.path.join(data_dir, "active_skills.json")
-                )
-                passive_skills = load_json_data(
-                    os.path.join(data_dir, "passive_skills.json")
-                )
-                validation_results = validate_character_save_parameter_map(
-                    character_data, pals, active_skills, passive_skills
-                )
-                validation_results.log_results()
+            split_json_objects(
+                data,
+                output_dir,
+                args.force,
+                allow_nan=not args.convert_nan_to_null,
+                jobs=args.jobs,
+            )
+
+        if args.validate:
+            log_validation(validate_world_save_data(get_world_save_data(data)))
 
     elif args.from_json or args.filename.endswith(".json"):
         logger.info("Converting %s to SAV", args.filename)
@@ -456,12 +499,8 @@ def main():
             output_path = args.filename.replace(".json", "")
         else:
             output_path = args.output
-        logger.info("Loading JSON")
-        with open(args.filename, "rb") as f:
-            data = f.read()
-            save_file.load_json(data)
-        logger.info("Writing SAV to %s", output_path)
-        save_file.to_sav_file(output_path)
+        json_file_to_sav(args.filename, output_path)
+        logger.info("Wrote SAV to %s", output_path)
 
 
 if __name__ == "__main__":
@@ -1,5 +1,5 @@
+import asyncio
 import json
-from urllib.parse import quote
 import sys
 from pathlib import Path
 import multiprocessing
@@ -8,21 +8,34 @@ import time
 import webview
 import uvicorn
 from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect
-from fastapi.responses import FileResponse, RedirectResponse
 import psutil
 import argparse
+from contextlib import asynccontextmanager
 
 from palworld_save_pal.utils.file_manager import FileManager
+from palworld_save_pal.web import bundles
+from palworld_save_pal.web.static_assets import get_static_assets, serve_static_files
 from palworld_save_pal.ws.manager import ConnectionManager
 from palworld_save_pal.utils.logging_config import create_logger, setup_logging
 from palworld_save_pal.__version__ import __version__
 from palworld_save_pal.ws.messages import MessageType
-from palworld_save_pal.ws.utils import build_response
+from palworld_save_pal.ws.utils import build_response, send_response
 
 logger = create_logger(__name__)
 
-app = FastAPI(swagger_ui_parameters={"syntaxHighlight.theme": "monokai"})
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Index and precompress the UI before serving instead of on the first request
+    await asyncio.to_thread(get_static_assets().load)
+    yield
+
+
+app = FastAPI(
+    lifespan=lifespan, swagger_ui_parameters={"syntaxHighlight.theme": "monokai"}
+)
 manager = ConnectionManager()
+app.include_router(bundles.router)
 
 
 class AppState:
@@ -38,25 +51,9 @@ app_state = AppState()
 
 @app.middleware("http")
 async def static_files_middleware(request: Request, call_next):
-    path = request.url.path
-    if path.startswith("/ws"):
-        response = await call_next(request)
-        return response
-
-    file_path = Path("ui") / path.lstrip("/")
-    if file_path.is_dir():
-        index_path = file_path / "index.html"
-        if index_path.is_file():
-            return FileResponse(index_path)
-    elif file_path.is_file():
-        return FileResponse(file_path)
-
-    # If no static file matches the requested path, redirect to the root path with the
-    # original URL as a query parameter. This is to handle client-side routing in the SPA.
-    if path != "/":
-        encoded_path = quote(path)
-        return RedirectResponse(url=f"/?path={encoded_path}")
-    return await call_next(request)
+    return await serve_static_files(
+        request, call_next, passthrough=("/ws", bundles.BUNDLE_PATH)
+    )
 
 
 async def handle_file_selection(
@@ -65,7 +62,7 @@ async def handle_file_selection(
     result = FileManager.open_file_dialog(window, app_state.save_dir)
     if not result:
         response = build_response(MessageType.NO_FILE_SELECTED, "No file selected")
-        await websocket.send_json(response)
+        await send_response(websocket, response)
         return None, None
     save_dir = str(Path(result).parent)
     return save_dir, result
@@ -0,0 +1,83 @@
+import argparse
+import os
+
+from palworld_save_pal.game.save_file import SaveFile
+from palworld_save_pal.game.table_export import CHUNK_ROWS, TableFormat, export_tables
+from palworld_save_pal.utils.file_manager import FileManager
+from palworld_save_pal.utils.logging_config import create_logger, setup_logging
+
+logger = create_logger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="psp-export-tables",
+        description="Exports pals, players, guilds and inventories of a world as CSV or Parquet tables",
+    )
+    parser.add_argument("world", help="World directory containing Level.sav")
+    parser.add_argument(
+        "--output", "-o", help="Output directory (default: <world>/tables)"
+    )
+    parser.add_argument(
+        "--format",
+        choices=[f.value for f in TableFormat],
+        default=TableFormat.CSV.value,
+        help="Table file format, parquet needs pyarrow (default: csv)",
+    )
+    parser.add_argument(
+        "--chunk-rows",
+        type=int,
+        default=CHUNK_ROWS,
+        help=f"Rows written per chunk or Parquet row group (default: {CHUNK_ROWS})",
+    )
+    parser.add_argument(
+        "--no-inventories",
+        action="store_true",
+        help="Skip parsing player saves, item tables are then left empty",
+    )
+    parser.add_argument("--dev", action="store_true", help="Run in development mode")
+    args = parser.parse_args()
+
+    setup_logging(dev_mode=args.dev)
+
+    validation = FileManager.validate_steam_save_directory(
+        os.path.join(args.world, "Level.sav")
+    )
+    if not validation.valid:
+        logger.error("%s: %s", args.world, validation.error)
+        exit(1)
+    with open(validation.level_sav, "rb") as f:
+        level_sav = f.read()
+    level_meta = None
+    if validation.level_meta:
+        with open(validation.level_meta, "rb") as f:
+            level_meta = f.read()
+    save_file = SaveFile(name=validation.level_sav).load_sav_files(
+        level_sav,
+        {},
+        level_meta,
+        FileManager.get_player_save_paths(validation.players_dir),
+    )
+    del level_sav
+
+    try:
+        result = export_tables(
+            save_file,
+            args.output or os.path.join(args.world, "tables"),
+            TableFormat(args.format),
+            chunk_rows=args.chunk_rows,
+            load_players=not args.no_inventories,
+        )
+    except ValueError as e:
+        logger.error("%s", e)
+        exit(1)
+    logger.info(
+        "Exported %s to %s in %ss",
+        ", ".join(f"{rows} {name}" for name, rows in result.rows.items()),
+        result.output_dir,
+        result.seconds,
+    )
+
+
+if __name__ == "__main__":
+    main()
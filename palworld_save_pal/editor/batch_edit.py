@@ -0,0 +1,336 @@
+import asyncio
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Annotated, Any, Dict, Iterable, List, Literal, Optional, Union
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from palworld_save_pal.editor.preset_profile import PresetProfile
+from palworld_save_pal.editor.preset_store import get_preset_store
+from palworld_save_pal.game.item_container_slot import ItemContainerSlot
+from palworld_save_pal.game.save_file import SaveFile
+from palworld_save_pal.utils.backup_store import get_backup_store
+from palworld_save_pal.utils.file_manager import FileManager
+from palworld_save_pal.utils.logging_config import create_logger
+from palworld_save_pal.utils.reference_data import get_reference_data
+
+logger = create_logger(__name__)
+
+
+class PlayerTargets(BaseModel):
+    player_ids: Optional[List[UUID]] = None
+    guild_id: Optional[UUID] = None
+    all_players: bool = False
+
+
+class AddPalOperation(BaseModel):
+    op: Literal["add_pal"]
+    player_id: UUID
+    pal_code_name: str
+    nickname: Optional[str] = None
+    # Defaults to the player's pal box
+    container_id: Optional[UUID] = None
+    count: int = Field(default=1, ge=1)
+
+
+class ClonePalOperation(BaseModel):
+    op: Literal["clone_pal"]
+    pal_id: UUID
+    count: int = Field(default=1, ge=1)
+
+
+class DeletePalsOperation(BaseModel):
+    op: Literal["delete_pals"]
+    player_id: UUID
+    pal_ids: List[UUID]
+
+
+class MovePalOperation(BaseModel):
+    op: Literal["move_pal"]
+    player_id: UUID
+    pal_id: UUID
+    container_id: UUID
+
+
+class HealPalsOperation(BaseModel):
+    op: Literal["heal_pals"]
+    pal_ids: Optional[List[UUID]] = None
+    player_ids: Optional[List[UUID]] = None
+    all_pals: bool = False
+
+
+class SetInventoryOperation(PlayerTargets):
+    """Replace the listed containers; slots left out of a container are emptied"""
+
+    op: Literal["set_inventory"]
+    common_container: Optional[List[ItemContainerSlot]] = None
+    essential_container: Optional[List[ItemContainerSlot]] = None
+    weapon_load_out_container: Optional[List[ItemContainerSlot]] = None
+    player_equipment_armor_container: Optional[List[ItemContainerSlot]] = None
+    food_equip_container: Optional[List[ItemContainerSlot]] = None
+
+
+class ApplyPresetOperation(PlayerTargets):
+    op: Literal["apply_preset"]
+    preset_id: Optional[UUID] = None
+    preset: Optional[PresetProfile] = None
+    pal_ids: Optional[List[UUID]] = None
+
+
+EditOperation = Annotated[
+    Union[
+        AddPalOperation,
+        ClonePalOperation,
+        DeletePalsOperation,
+        MovePalOperation,
+        HealPalsOperation,
+        SetInventoryOperation,
+        ApplyPresetOperation,
+    ],
+    Field(discriminator="op"),
+]
+
+
+class EditScript(BaseModel):
+    language: str = "en"
+    # Stop at the first failing operation and leave the world untouched
+    stop_on_error: bool = True
+    operations: List[EditOperation] = Field(default_factory=list)
+
+
+class WorldResult(BaseModel):
+    world: str
+    ok: bool = True
+    written: bool = False
+    applied: int = 0
+    players: int = 0
+    pals: int = 0
+    backup_id: Optional[str] = None
+    errors: List[str] = Field(default_factory=list)
+    seconds: float = 0.0
+
+
+class BatchEditor:
+    """Applies an edit script to a loaded SaveFile using the editor models"""
+
+    def __init__(self, save_file: SaveFile, language: str = "en"):
+        self.save_file = save_file
+        self.language = language
+        self.changed_players = set()
+        self.changed_pals = set()
+
+    async def apply(self, script: EditScript, result: WorldResult) -> None:
+        for index, operation in enumerate(script.operations):
+            try:
+                await self._apply(operation)
+                result.applied += 1
+            except Exception as e:
+                message = f"Operation {index} ({operation.op}) failed: {e}"
+                logger.warning("%s: %s", result.world, message)
+                result.errors.append(message)
+                if script.stop_on_error:
+                    result.ok = False
+                    return
+        result.players = len(self.changed_players)
+        result.pals = len(self.changed_pals)
+
+    async def _apply(self, operation: EditOperation) -> None:
+        handler = getattr(self, f"_{operation.op}")
+        await handler(operation)
+
+    async def _add_pal(self, operation: AddPalOperation) -> None:
+        container_id = operation.container_id
+        if container_id is None:
+            player = self.save_file.load_player(operation.player_id)
+            container_id = player.pal_box_id
+        for _ in range(operation.count):
+            pal = self.save_file.add_pal(
+                operation.player_id,
+                operation.pal_code_name,
+                operation.nickname or operation.pal_code_name,
+                container_id,
+            )
+            if pal is None:
+                raise ValueError(f"Container {container_id} is full")
+            self.changed_pals.add(pal.instance_id)
+        self.changed_players.add(operation.player_id)
+
+    async def _clone_pal(self, operation: ClonePalOperation) -> None:
+        pal = self.save_file.get_pals().get(operation.pal_id)
+        if pal is None:
+            raise ValueError(f"Pal {operation.pal_id} not found in the save file.")
+        for _ in range(operation.count):
+            new_pal = self.save_file.clone_pal(pal)
+            if new_pal is None:
+                raise ValueError(f"No free slot to clone pal {operation.pal_id}")
+            self.changed_pals.add(new_pal.instance_id)
+        self.changed_players.add(pal.owner_uid)
+
+    async def _delete_pals(self, operation: DeletePalsOperation) -> None:
+        self.save_file.delete_pals(operation.player_id, operation.pal_ids)
+        self.changed_pals.update(operation.pal_ids)
+        self.changed_players.add(operation.player_id)
+
+    async def _move_pal(self, operation: MovePalOperation) -> None:
+        pal = self.save_file.move_pal(
+            operation.player_id, operation.pal_id, operation.container_id
+        )
+        if pal is None:
+            raise ValueError(f"Container {operation.container_id} is full")
+        self.changed_pals.add(pal.instance_id)
+        self.changed_players.add(operation.player_id)
+
+    async def _heal_pals(self, operation: HealPalsOperation) -> None:
+        pals = self.save_file.get_pals()
+        if operation.all_pals:
+            pal_ids = list(pals)
+        else:
+            pal_ids = list(operation.pal_ids or [])
+            owners = set(operation.player_ids or [])
+            pal_ids.extend(
+                pal_id for pal_id, pal in pals.items() if pal.owner_uid in owners
+            )
+        self.save_file.heal_pals(pal_ids)
+        self.changed_pals.update(pal_ids)
+
+    async def _set_inventory(self, operation: SetInventoryOperation) -> None:
+        preset = PresetProfile(
+            name="set_inventory",
+            type="inventory",
+            **operation.model_dump(exclude={"op", "player_ids", "guild_id", "all_players"}),
+        )
+        await self._apply_inventory(preset, operation)
+
+    async def _apply_preset(self, operation: ApplyPresetOperation) -> None:
+        preset = operation.preset
+        if preset is None:
+            if operation.preset_id is None:
+                raise ValueError("apply_preset needs a preset_id or a preset")
+            preset_data = get_preset_store().get(str(operation.preset_id))
+            if preset_data is None:
+                raise ValueError(f"Preset {operation.preset_id} not found")
+            preset = PresetProfile(**preset_data)
+
+        if preset.type == "inventory":
+            await self._apply_inventory(preset, operation)
+        elif preset.type in ("active_skills", "passive_skills"):
+            skills = preset.skills or []
+            pals = await self.save_file.apply_pal_skills(
+                operation.pal_ids or [],
+                active_skills=skills if preset.type == "active_skills" else None,
+                passive_skills=skills if preset.type == "passive_skills" else None,
+            )
+            self.changed_pals.update(pal.instance_id for pal in pals)
+        else:
+            raise ValueError(f"Unsupported preset type {preset.type}")
+
+    async def _apply_inventory(self, preset: PresetProfile, targets: PlayerTargets):
+        players = self.save_file.find_players(
+            targets.player_ids, targets.guild_id, targets.all_players
+        )
+        if not players:
+            raise ValueError("No players matched")
+        items = get_reference_data().get("items", self.language)
+        await self.save_file.apply_inventory(players, preset.container_slots(items))
+        self.changed_players.update(player.uid for player in players)
+
+
+def load_script(path: str) -> EditScript:
+    with open(path, "r", encoding="utf-8") as f:
+        return EditScript(**json.load(f))
+
+
+def find_worlds(root: str) -> List[str]:
+    """World directories under root, any directory holding a Level.sav"""
+    if os.path.isfile(os.path.join(root, "Level.sav")):
+        return [root]
+    worlds = []
+    for directory, dirnames, filenames in os.walk(root):
+        if "Level.sav" in filenames:
+            worlds.append(directory)
+            # A world's own subdirectories (Players, backups) never hold worlds
+            dirnames.clear()
+    return sorted(worlds)
+
+
+def edit_world(
+    world: str, script: Dict[str, Any], dry_run: bool = False, backup: bool = True
+) -> WorldResult:
+    """Load one world, apply the script and write Level.sav once.
+
+    Takes the script as a plain dict so it can be sent to worker processes.
+    Players are loaded lazily, only the saves of players the script touches
+    are parsed.
+    """
+    start = time.perf_counter()
+    result = WorldResult(world=world)
+    try:
+        edit_script = EditScript(**script)
+        validation = FileManager.validate_steam_save_directory(
+            os.path.join(world, "Level.sav")
+        )
+        if not validation.valid:
+            raise ValueError(validation.error)
+        with open(validation.level_sav, "rb") as f:
+            level_sav = f.read()
+        level_meta = None
+        if validation.level_meta:
+            with open(validation.level_meta, "rb") as f:
+                level_meta = f.read()
+        save_file = SaveFile(name=validation.level_sav).load_sav_files(
+            level_sav,
+            {},
+            level_meta,
+            FileManager.get_player_save_paths(validation.players_dir),
+        )
+
+        editor = BatchEditor(save_file, edit_script.language)
+        asyncio.run(editor.apply(edit_script, result))
+
+        if result.ok and result.applied and not dry_run:
+            if backup:
+                result.backup_id = get_backup_store().snapshot(validation.level_sav).id
+            save_file.to_sav_file(validation.level_sav)
+            result.written = True
+    except ValueError as e:
+        logger.error("Failed to edit %s: %s", world, e)
+        result.ok = False
+        result.errors.append(str(e))
+    except Exception as e:
+        logger.exception("Failed to edit %s", world)
+        result.ok = False
+        result.errors.append(str(e))
+    result.seconds = round(time.perf_counter() - start, 3)
+    return result
+
+
+def edit_worlds(
+    worlds: Iterable[str],
+    script: EditScript,
+    jobs: Optional[int] = None,
+    dry_run: bool = False,
+    backup: bool = True,
+) -> List[WorldResult]:
+    """Edit many worlds, one process per world up to jobs at a time"""
+    worlds = list(worlds)
+    script_data = script.model_dump(mode="json")
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(worlds) or 1))
+    if jobs == 1:
+        return [edit_world(world, script_data, dry_run, backup) for world in worlds]
+
+    results = []
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = {
+            executor.submit(edit_world, world, script_data, dry_run, backup): world
+            for world in worlds
+        }
+        for future in as_completed(futures):
+            result = future.result()
+            logger.info(
+                "%s: %s in %ss", result.world, "ok" if result.ok else "failed", result.seconds
+            )
+            results.append(result)
+    return sorted(results, key=lambda r: r.world)
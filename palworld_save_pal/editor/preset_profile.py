@@ -1,7 +1,25 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from pydantic import BaseModel
 
+from palworld_save_pal.game.dynamic_item import DynamicItem
 from palworld_save_pal.game.item_container_slot import ItemContainerSlot
+from palworld_save_pal.game.pal_objects import PalObjects
+
+CONTAINER_FIELDS = [
+    "common_container",
+    "essential_container",
+    "weapon_load_out_container",
+    "player_equipment_armor_container",
+    "food_equip_container",
+]
+
+DYNAMIC_ITEM_TYPES = {
+    "CommonWeapon": "weapon",
+    "CommonArmor": "armor",
+}
+# Several weapons and armor (decal guns, fishing rods, gas masks) have no
+# durability in items.json, the save format needs a number
+DEFAULT_DURABILITY = 0.0
 
 
 class PresetProfile(BaseModel):
@@ -13,3 +31,62 @@ class PresetProfile(BaseModel):
     weapon_load_out_container: Optional[List[ItemContainerSlot]] = None
     player_equipment_armor_container: Optional[List[ItemContainerSlot]] = None
     food_equip_container: Optional[List[ItemContainerSlot]] = None
+
+    def container_slots(
+        self, items: Dict[str, Any]
+    ) -> Dict[str, List[ItemContainerSlot]]:
+        """Slots per container with dynamic items resolved from item data
+
+        Weapons and armor get a fresh dynamic item from the item data, items
+        without one lose it. Anything else, e.g. eggs or items missing from
+        the item data, keeps the dynamic item stored in the preset.
+        """
+        containers = {}
+        for field in CONTAINER_FIELDS:
+            slots = getattr(self, field)
+            if slots is None:
+                continue
+            containers[field] = [
+                ItemContainerSlot(
+                    slot_index=slot.slot_index,
+                    count=slot.count,
+                    static_id=slot.static_id,
+                    dynamic_item=_dynamic_item(slot, items),
+                )
+                for slot in slots
+            ]
+        return containers
+
+
+def _dynamic_item(
+    slot: ItemContainerSlot, items: Dict[str, Any]
+) -> Optional[DynamicItem]:
+    stored = slot.dynamic_item
+    item = items.get(slot.static_id) if slot.static_id else None
+    if not item:
+        return stored
+    details = item.get("details", item)
+    dynamic = details.get("dynamic")
+    if not dynamic or details.get("type_a") == "Accessory":
+        return None
+    item_type = dynamic.get("type") or DYNAMIC_ITEM_TYPES.get(dynamic.get("class_name"))
+    if item_type not in ("weapon", "armor"):
+        return stored
+
+    durability = dynamic.get("durability")
+    if durability is None and stored is not None:
+        durability = stored.durability
+    if durability is None:
+        durability = DEFAULT_DURABILITY
+    if item_type == "weapon":
+        return DynamicItem(
+            local_id=PalObjects.EMPTY_UUID,
+            type=item_type,
+            durability=durability,
+            remaining_bullets=dynamic.get("magazine_size") or 0,
+        )
+    return DynamicItem(
+        local_id=PalObjects.EMPTY_UUID,
+        type=item_type,
+        durability=durability,
+    )
@@ -0,0 +1,152 @@
+import json
+import os
+import threading
+import uuid
+from typing import Any, Dict, Iterable, List, Optional
+
+from palworld_save_pal.utils.atomic import atomic_write
+from palworld_save_pal.utils.logging_config import create_logger
+
+logger = create_logger(__name__)
+
+PRESETS_FILE = "data/json/presets.json"
+JOURNAL_SUFFIX = ".journal"
+# Fold the journal back into the snapshot once it holds this many records
+COMPACT_AFTER = 200
+
+
+class PresetStore:
+    """Presets kept in memory and persisted as a snapshot plus a journal.
+
+    presets.json keeps its existing id => preset layout. Changes are appended
+    to presets.json.journal as one JSON line per operation, however many
+    presets it touches, and fsynced before returning. The journal is replayed
+    on load and periodically compacted into a new snapshot, which is written
+    to a temporary file and swapped in with os.replace so a crash never
+    leaves a half written presets.json behind.
+    """
+
+    def __init__(self, path: str = PRESETS_FILE):
+        self.path = path
+        self.journal_path = path + JOURNAL_SUFFIX
+        self._presets: Dict[str, Dict[str, Any]] = {}
+        self._journal_records = 0
+        self._lock = threading.Lock()
+        self._loaded = False
+
+    def all(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            self._ensure_loaded()
+            return dict(self._presets)
+
+    def get(self, preset_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            self._ensure_loaded()
+            return self._presets.get(preset_id)
+
+    def add(self, preset: Dict[str, Any]) -> str:
+        return self.add_many([preset])[0]
+
+    def add_many(self, presets: Iterable[Dict[str, Any]]) -> List[str]:
+        entries = {str(uuid.uuid4()): preset for preset in presets}
+        if entries:
+            self._commit({"op": "put", "presets": entries})
+        return list(entries)
+
+    def rename(self, preset_id: str, name: str) -> bool:
+        with self._lock:
+            self._ensure_loaded()
+            if preset_id not in self._presets:
+                return False
+            self._commit_locked({"op": "rename", "id": preset_id, "name": name})
+            return True
+
+    def delete(self, preset_ids: Iterable[str]) -> List[str]:
+        with self._lock:
+            self._ensure_loaded()
+            ids = [preset_id for preset_id in preset_ids if preset_id in self._presets]
+            if ids:
+                self._commit_locked({"op": "delete", "ids": ids})
+            return ids
+
+    def compact(self) -> None:
+        with self._lock:
+            self._ensure_loaded()
+            self._compact_locked()
+
+    def _commit(self, record: Dict[str, Any]) -> None:
+        with self._lock:
+            self._ensure_loaded()
+            self._commit_locked(record)
+
+    def _commit_locked(self, record: Dict[str, Any]) -> None:
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        with open(self.journal_path, "a", encoding="utf-8") as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+        self._apply(record)
+        self._journal_records += 1
+        if self._journal_records >= COMPACT_AFTER:
+            self._compact_locked()
+
+    def _apply(self, record: Dict[str, Any]) -> None:
+        op = record.get("op")
+        if op == "put":
+            self._presets.update(record["presets"])
+        elif op == "rename":
+            preset = self._presets.get(record["id"])
+            if preset is not None:
+                preset["name"] = record["name"]
+        elif op == "delete":
+            for preset_id in record["ids"]:
+                self._presets.pop(preset_id, None)
+        else:
+            logger.warning("Unknown preset journal operation %s", op)
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        if os.path.exists(self.path):
+            with open(self.path, "r", encoding="utf-8") as f:
+                self._presets = json.load(f)
+        replayed = self._replay()
+        self._loaded = True
+        logger.debug(
+            "Loaded %s presets (%s journal records)", len(self._presets), replayed
+        )
+        # Compacting also drops a torn last record, which the next append
+        # would otherwise extend into a line that hides every later record
+        if os.path.exists(self.journal_path) or not os.path.exists(self.path):
+            self._compact_locked()
+
+    def _replay(self) -> int:
+        if not os.path.exists(self.journal_path):
+            return 0
+        replayed = 0
+        with open(self.journal_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # Only the last record can be torn, by a crash mid-append
+                    logger.warning("Skipping incomplete preset journal record")
+                    break
+                self._apply(record)
+                replayed += 1
+        return replayed
+
+    def _compact_locked(self) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        atomic_write(self.path, json.dumps(self._presets, indent=2).encode("utf-8"))
+        # The snapshot now holds every journaled change
+        if os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+        self._journal_records = 0
+
+
+preset_store = PresetStore()
+
+
+def get_preset_store() -> PresetStore:
+    return preset_store
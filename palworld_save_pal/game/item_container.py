@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 from uuid import UUID
 import uuid
 from pydantic import BaseModel, Field, PrivateAttr
@@ -65,6 +65,75 @@ class ItemContainer(BaseModel):
                 self._clean_up_inventory(new_slots)
                 self._set_items()
 
+    def replace_slots(
+        self, new_slots: List[ItemContainerSlot], removed_items: Set[UUID]
+    ) -> None:
+        """Batched counterpart of update_from for bulk edits.
+
+        Every dynamic item in a replaced slot is dropped and new slots get
+        fresh dynamic items. Dropped local ids are collected in removed_items
+        instead of being removed here, so the caller can prune the shared
+        dynamic item save data in one pass via prune_dynamic_items.
+        """
+        logger.debug("%s (%s) => %s slots", self.type.value, self.id, len(new_slots))
+        current = {slot.slot_index: slot for slot in self.slots}
+        slot_data = {
+            PalObjects.get_nested(
+                PalObjects.get_value(entry["RawData"]), "slot_index"
+            ): entry
+            for entry in self._container_slots_data
+        }
+        cleared = set()
+        updated_slots: List[ItemContainerSlot] = []
+        for slot in new_slots:
+            existing = current.pop(slot.slot_index, None)
+            if existing and existing.dynamic_item:
+                removed_items.add(existing.dynamic_item.local_id)
+            if slot.static_id == "None":
+                cleared.add(slot.slot_index)
+                continue
+            if slot.dynamic_item:
+                slot.dynamic_item.local_id = uuid.uuid4()
+                new_item = PalObjects.DynamicItem(slot)
+                self._update_dynamic_item(slot, new_item)
+                self._dynamic_item_save_data.append(new_item)
+            entry = slot_data.get(slot.slot_index)
+            if entry is None:
+                self._container_slots_data.append(PalObjects.ItemContainerSlot(slot))
+            else:
+                self._update_container_slot(slot, entry)
+            updated_slots.append(slot)
+
+        if cleared:
+            self._container_slots_data[:] = [
+                entry
+                for entry in self._container_slots_data
+                if PalObjects.get_nested(
+                    PalObjects.get_value(entry["RawData"]), "slot_index"
+                )
+                not in cleared
+            ]
+        # Slots the caller did not mention are left untouched
+        updated_slots.extend(current.values())
+        self.slots = sorted(updated_slots, key=lambda slot: slot.slot_index)
+
+    @staticmethod
+    def prune_dynamic_items(
+        dynamic_item_save_data: List[Dict[str, Any]], removed_items: Set[UUID]
+    ) -> None:
+        if not removed_items:
+            return
+        dynamic_item_save_data[:] = [
+            item
+            for item in dynamic_item_save_data
+            if PalObjects.as_uuid(
+                PalObjects.get_nested(
+                    item, "RawData", "value", "id", "local_id_in_created_world"
+                )
+            )
+            not in removed_items
+        ]
+
     def _clean_up_inventory(self, new_slots: List[ItemContainerSlot]) -> None:
         logger.debug("%s (%s)", self.type.value, self.id)
         updated_slots: List[ItemContainerSlot] = []
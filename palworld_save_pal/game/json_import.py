@@ -0,0 +1,104 @@
+import base64
+from typing import Any, Dict, Optional
+
+from palworld_save_tools.archive import FArchiveWriter
+from palworld_save_tools.gvas import GvasHeader
+from palworld_save_tools.palsav import compress_gvas_to_sav
+
+from palworld_save_pal.game.save_file import CUSTOM_PROPERTIES, sav_save_type
+from palworld_save_pal.utils.atomic import atomic_write
+from palworld_save_pal.utils.json_stream import JsonPullReader
+from palworld_save_pal.utils.logging_config import create_logger
+
+logger = create_logger(__name__)
+
+# Struct types FArchiveWriter.struct_value writes as plain values, every other
+# struct holds a nested property bag
+VALUE_STRUCTS = {"Vector", "DateTime", "Guid", "Quat", "LinearColor"}
+
+
+def json_file_to_sav(
+    json_path: str,
+    output_path: str,
+    custom_properties: Optional[Dict[str, Any]] = None,
+) -> int:
+    """Convert a JSON export back to a SAV without loading it whole.
+
+    The top level structs (worldSaveData, a player's SaveData) are written
+    one member property at a time: each is parsed from the file, encoded
+    and dropped before the next is read. Peak memory is the encoded GVAS
+    plus the largest single property, instead of the JSON text, its parsed
+    tree and a deep copy of that tree. Returns the size of the SAV written.
+    """
+    if custom_properties is None:
+        custom_properties = CUSTOM_PROPERTIES
+    writer = FArchiveWriter(custom_properties)
+    header: Optional[GvasHeader] = None
+    trailer = b""
+
+    logger.info("Streaming %s to SAV", json_path)
+    with open(json_path, "r", encoding="utf-8") as f:
+        reader = JsonPullReader(f)
+        for key in reader.iter_object():
+            if key == "header":
+                header = GvasHeader.load(reader.read_value())
+                header.write(writer)
+            elif key == "properties":
+                if header is None:
+                    raise ValueError(f"{json_path}: properties come before header")
+                _write_properties(reader, writer, stream=True)
+            elif key == "trailer":
+                trailer = base64.b64decode(reader.read_value())
+            else:
+                reader.read_value()
+    if header is None:
+        raise ValueError(f"{json_path} has no GVAS header")
+    writer.write(trailer)
+
+    save_type = sav_save_type(header.save_game_class_name)
+    logger.info("Compressing GVAS to SAV with save type %s", save_type)
+    with writer.data.getbuffer() as gvas:
+        sav_file = compress_gvas_to_sav(gvas, save_type)
+    atomic_write(output_path, sav_file)
+    return len(sav_file)
+
+
+def _write_properties(reader: JsonPullReader, writer: FArchiveWriter, stream: bool):
+    for name in reader.iter_object():
+        writer.fstring(name)
+        if stream:
+            _stream_property(reader, writer, name)
+        else:
+            writer.property(reader.read_value())
+    writer.fstring("None")
+
+
+def _stream_property(reader: JsonPullReader, writer: FArchiveWriter, name: str):
+    # Same bytes as FArchiveWriter.property, but a struct's properties are
+    # encoded as they are read instead of from a complete tree
+    prop: Dict[str, Any] = {}
+    body: Optional[FArchiveWriter] = None
+    for key in reader.iter_object():
+        if (
+            key == "value"
+            and prop.get("struct_type") not in (None, *VALUE_STRUCTS)
+            and "custom_type" not in prop
+            and reader.peek() == "{"
+        ):
+            body = writer.copy()
+            _write_properties(reader, body, stream=False)
+        else:
+            prop[key] = reader.read_value()
+
+    if body is None:
+        writer.property(prop)
+        return
+    if prop.get("type") != "StructProperty" or "custom_type" in prop:
+        raise ValueError(f"{name} has a struct value but is not a plain StructProperty")
+    with body.data.getbuffer() as buffer:
+        writer.fstring("StructProperty")
+        writer.u64(len(buffer))
+        writer.fstring(prop["struct_type"])
+        writer.guid(prop["struct_id"])
+        writer.optional_guid(prop.get("id", None))
+        writer.write(buffer)
@@ -101,6 +101,18 @@ class Pal(BaseModel):
         self._update_storage_info()
         self.heal()
 
+    def set_skills(
+        self,
+        active_skills: Optional[List[str]] = None,
+        passive_skills: Optional[List[str]] = None,
+    ):
+        if active_skills is not None:
+            self.active_skills = list(active_skills)
+            self._update_equip_waza()
+        if passive_skills is not None:
+            self.passive_skills = list(passive_skills)
+            self._update_passive_skills()
+
     def update_from(self, other_pal: "Pal"):
         data = other_pal.model_dump()
         for key, value in data.items():
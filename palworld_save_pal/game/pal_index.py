@@ -0,0 +1,427 @@
+import bisect
+import operator
+from collections import defaultdict
+from typing import Any, Callable, Dict, FrozenSet, List, NamedTuple, Optional, Set, Tuple
+from uuid import UUID
+
+from palworld_save_pal.game.pal import Pal
+from palworld_save_pal.game.pal_query import (
+    RANGE_FIELDS,
+    And,
+    Comparison,
+    Not,
+    Or,
+    QueryNode,
+    normalize_species,
+    parse_query,
+)
+from palworld_save_pal.utils.logging_config import create_logger
+from palworld_save_pal.utils.reference_data import get_reference_data
+
+logger = create_logger(__name__)
+
+
+SORT_KEYS: Dict[str, Callable[[Pal], Any]] = {
+    "slot": lambda pal: pal.storage_slot,
+    "level": lambda pal: pal.level,
+    "rank": lambda pal: pal.rank,
+    "character_id": lambda pal: (pal.character_id or "").lower(),
+    "name": lambda pal: (pal.nickname or pal.character_id or "").lower(),
+}
+
+RANGE_OPERATORS = {
+    "=": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+_species_elements: Optional[Dict[str, List[str]]] = None
+
+
+def species_elements() -> Dict[str, List[str]]:
+    """Element types per normalized species, from the pals reference data"""
+    global _species_elements
+    if _species_elements is None:
+        try:
+            pals = get_reference_data().get("pals", "en")
+        except Exception as e:
+            logger.warning("Pal elements unavailable for queries: %s", e)
+            pals = {}
+        _species_elements = {
+            normalize_species(code_name): [
+                element.lower() for element in data.get("element_types") or []
+            ]
+            for code_name, data in pals.items()
+        }
+    return _species_elements
+
+
+class _IndexedFields(NamedTuple):
+    ordinal: int
+    owner_uid: Optional[UUID]
+    container_id: Optional[UUID]
+    species: str
+    elements: FrozenSet[str]
+    passives: FrozenSet[str]
+    actives: FrozenSet[str]
+    gender: str
+    lucky: bool
+    boss: bool
+    level: int
+    rank: int
+
+
+class PalIndex:
+    """Indexes pals by owner and container with cached sort orders.
+
+    Sorted views are built lazily per (owner, container, sort key) and dropped
+    whenever a pal in that owner's pals is added, removed or updated, so paging
+    through a container only sorts it once between edits.
+
+    Filter queries use inverted indexes from passive skill, active skill,
+    species, element and gender to pals, plus a sorted (level, pal) list
+    for level ranges. These hold small integer ordinals rather than UUIDs,
+    whose hashing would dominate set intersections on large worlds. The
+    fields a pal was indexed under are remembered so an update can unindex
+    the old values after the pal was edited in place.
+    """
+
+    def __init__(self):
+        self._pals: Dict[UUID, Pal] = {}
+        self._fields: Dict[UUID, _IndexedFields] = {}
+        self._ordinals: Dict[int, UUID] = {}
+        self._next_ordinal = 0
+        self._all: Set[int] = set()
+        self._by_owner: Dict[Optional[UUID], Set[UUID]] = defaultdict(set)
+        self._by_container: Dict[Optional[UUID], Set[UUID]] = defaultdict(set)
+        self._by_species: Dict[str, Set[int]] = defaultdict(set)
+        self._by_element: Dict[str, Set[int]] = defaultdict(set)
+        self._by_passive: Dict[str, Set[int]] = defaultdict(set)
+        self._by_active: Dict[str, Set[int]] = defaultdict(set)
+        self._by_gender: Dict[str, Set[int]] = defaultdict(set)
+        self._by_rank: Dict[int, Set[int]] = defaultdict(set)
+        self._lucky: Set[int] = set()
+        self._boss: Set[int] = set()
+        self._levels: List[Tuple[int, int]] = []
+        self._level_of: Dict[int, int] = {}
+        self._rank_of: Dict[int, int] = {}
+        self._search_text: Dict[UUID, str] = {}
+        self._sorted: Dict[Tuple[Optional[UUID], Optional[UUID], str], List[UUID]] = {}
+
+    def rebuild(self, pals: Dict[UUID, Pal]) -> None:
+        self.__init__()
+        for pal in pals.values():
+            self._insert(pal, sort_levels=False)
+        self._levels.sort()
+        logger.debug("Indexed %s pals", len(self._pals))
+
+    def add(self, pal: Pal) -> None:
+        self._insert(pal)
+        self._invalidate(pal.owner_uid)
+
+    def update(self, pal: Pal) -> None:
+        previous = self._fields.get(pal.instance_id)
+        if previous:
+            self._invalidate(previous.owner_uid)
+        self._discard(pal.instance_id)
+        self._insert(pal)
+        self._invalidate(pal.owner_uid)
+
+    def remove(self, pal_id: UUID) -> None:
+        previous = self._fields.get(pal_id)
+        if previous is None:
+            return
+        self._discard(pal_id)
+        self._invalidate(previous.owner_uid)
+
+    def owned_by(self, owner_uid: Optional[UUID]) -> Dict[UUID, Pal]:
+        return {
+            pal_id: self._pals[pal_id] for pal_id in self._by_owner.get(owner_uid, ())
+        }
+
+    def query(
+        self,
+        owner_uid: UUID,
+        container_id: Optional[UUID] = None,
+        offset: int = 0,
+        limit: int = 100,
+        sort: str = "slot",
+        descending: bool = False,
+        text: Optional[str] = None,
+    ) -> Tuple[int, List[Pal]]:
+        if sort not in SORT_KEYS:
+            raise ValueError(f"Unknown sort key {sort}, expected one of {list(SORT_KEYS)}")
+        ids = self._ordered(owner_uid, container_id, sort)
+        if text:
+            text = text.lower()
+            ids = [pal_id for pal_id in ids if text in self._search_text[pal_id]]
+
+        total = len(ids)
+        offset = max(offset, 0)
+        if descending:
+            end = max(total - offset, 0)
+            page = ids[max(end - limit, 0) : end][::-1]
+        else:
+            page = ids[offset : offset + limit]
+        return total, [self._pals[pal_id] for pal_id in page]
+
+    def search(
+        self,
+        query: str,
+        offset: int = 0,
+        limit: int = 100,
+        sort: str = "level",
+        descending: bool = False,
+    ) -> Tuple[int, List[Pal]]:
+        """Pals matching a filter expression, see pal_query.parse_query"""
+        if sort not in SORT_KEYS:
+            raise ValueError(f"Unknown sort key {sort}, expected one of {list(SORT_KEYS)}")
+        matches = self._evaluate(parse_query(query))
+        total = len(matches)
+        offset = max(offset, 0)
+        if sort == "level" and total > len(self._levels) // 16:
+            # Walk the level index instead of sorting many matches
+            levels = reversed(self._levels) if descending else self._levels
+            page = []
+            skipped = 0
+            for _, ordinal in levels:
+                if ordinal not in matches:
+                    continue
+                if skipped < offset:
+                    skipped += 1
+                    continue
+                page.append(ordinal)
+                if len(page) >= limit:
+                    break
+        elif sort == "level":
+            ordered = sorted(
+                matches,
+                key=lambda ordinal: (self._level_of[ordinal], ordinal),
+                reverse=descending,
+            )
+            page = ordered[offset : offset + limit]
+        else:
+            key = SORT_KEYS[sort]
+            ordered = sorted(
+                matches,
+                key=lambda ordinal: (key(self._pals[self._ordinals[ordinal]]), ordinal),
+                reverse=descending,
+            )
+            page = ordered[offset : offset + limit]
+        return total, [self._pals[self._ordinals[ordinal]] for ordinal in page]
+
+    def _evaluate(self, node: QueryNode) -> Set[int]:
+        if isinstance(node, And):
+            ranges = [
+                operand
+                for operand in node.operands
+                if isinstance(operand, Comparison) and operand.field in RANGE_FIELDS
+            ]
+            negated = [operand for operand in node.operands if isinstance(operand, Not)]
+            others = [
+                operand
+                for operand in node.operands
+                if operand not in ranges and operand not in negated
+            ]
+            if not others:
+                if ranges:
+                    ranges, others = ranges[1:], ranges[:1]
+                else:
+                    negated, others = negated[1:], negated[:1]
+            # Intersect smallest first so the work shrinks as it goes
+            sets = sorted((self._evaluate(operand) for operand in others), key=len)
+            result = set(sets[0])
+            for other in sets[1:]:
+                result &= other
+            for operand in negated:
+                result -= self._evaluate(operand.operand)
+            # Check level and rank on the survivors rather than materializing
+            # every pal in the range
+            for field, op, value in ranges:
+                values = self._level_of if field == "level" else self._rank_of
+                compare = RANGE_OPERATORS[op]
+                result = {o for o in result if compare(values[o], value)}
+            return result
+        if isinstance(node, Or):
+            result = set()
+            for operand in node.operands:
+                result |= self._evaluate(operand)
+            return result
+        if isinstance(node, Not):
+            return self._all - self._evaluate(node.operand)
+        return self._match(node)
+
+    def _match(self, comparison: Comparison) -> Set[int]:
+        field, op, value = comparison
+        if field == "level":
+            return self._match_levels(op, value)
+        if field == "rank":
+            compare = RANGE_OPERATORS[op]
+            return {
+                ordinal
+                for rank, ordinals in self._by_rank.items()
+                if compare(rank, value)
+                for ordinal in ordinals
+            }
+        if field == "name":
+            # ~ is a substring match, = must equal the nickname or species
+            if op == "=":
+                return {
+                    self._fields[pal_id].ordinal
+                    for pal_id, text in self._search_text.items()
+                    if value in text.split("\n")
+                }
+            return {
+                self._fields[pal_id].ordinal
+                for pal_id, text in self._search_text.items()
+                if value in text
+            }
+
+        if field == "lucky":
+            matched = self._lucky if value else self._all - self._lucky
+        elif field == "boss":
+            matched = self._boss if value else self._all - self._boss
+        elif field in ("owner", "container"):
+            index = self._by_owner if field == "owner" else self._by_container
+            matched = {
+                self._fields[pal_id].ordinal for pal_id in index.get(value, ())
+            }
+        else:
+            index = {
+                "passive": self._by_passive,
+                "active": self._by_active,
+                "species": self._by_species,
+                "element": self._by_element,
+                "gender": self._by_gender,
+            }[field]
+            matched = index.get(value, set())
+        if op == "!=":
+            return self._all - matched
+        return matched
+
+    def _match_levels(self, op: str, level: int) -> Set[int]:
+        start = 0
+        end = len(self._levels)
+        if op in ("=", "!="):
+            start = bisect.bisect_left(self._levels, (level,))
+            end = bisect.bisect_left(self._levels, (level + 1,))
+        elif op == ">":
+            start = bisect.bisect_left(self._levels, (level + 1,))
+        elif op == ">=":
+            start = bisect.bisect_left(self._levels, (level,))
+        elif op == "<":
+            end = bisect.bisect_left(self._levels, (level,))
+        elif op == "<=":
+            end = bisect.bisect_left(self._levels, (level + 1,))
+        matched = {ordinal for _, ordinal in self._levels[start:end]}
+        if op == "!=":
+            return self._all - matched
+        return matched
+
+    def _ordered(
+        self, owner_uid: UUID, container_id: Optional[UUID], sort: str
+    ) -> List[UUID]:
+        cache_key = (owner_uid, container_id, sort)
+        ids = self._sorted.get(cache_key)
+        if ids is None:
+            candidates = self._by_owner.get(owner_uid, set())
+            if container_id is not None:
+                candidates = candidates & self._by_container.get(container_id, set())
+            key = SORT_KEYS[sort]
+            ids = sorted(
+                candidates,
+                key=lambda pal_id: (
+                    key(self._pals[pal_id]),
+                    self._pals[pal_id].storage_slot,
+                    str(pal_id),
+                ),
+            )
+            self._sorted[cache_key] = ids
+        return ids
+
+    def _insert(self, pal: Pal, sort_levels: bool = True) -> None:
+        pal_id = pal.instance_id
+        species = normalize_species(pal.character_id)
+        if pal.elements:
+            elements = frozenset(element.value.lower() for element in pal.elements)
+        else:
+            elements = frozenset(species_elements().get(species, ()))
+        ordinal = self._next_ordinal
+        self._next_ordinal += 1
+        fields = _IndexedFields(
+            ordinal=ordinal,
+            owner_uid=pal.owner_uid,
+            container_id=pal.storage_id,
+            species=species,
+            elements=elements,
+            passives=frozenset(skill.lower() for skill in pal.passive_skills),
+            actives=frozenset(skill.lower() for skill in pal.active_skills),
+            gender=pal.gender.value.lower() if pal.gender else "",
+            lucky=pal.is_lucky,
+            boss=pal.is_boss,
+            level=pal.level,
+            rank=pal.rank,
+        )
+        self._pals[pal_id] = pal
+        self._fields[pal_id] = fields
+        self._ordinals[ordinal] = pal_id
+        self._all.add(ordinal)
+        self._level_of[ordinal] = fields.level
+        self._rank_of[ordinal] = fields.rank
+        self._by_owner[fields.owner_uid].add(pal_id)
+        self._by_container[fields.container_id].add(pal_id)
+        self._by_species[species].add(ordinal)
+        for element in elements:
+            self._by_element[element].add(ordinal)
+        for skill in fields.passives:
+            self._by_passive[skill].add(ordinal)
+        for skill in fields.actives:
+            self._by_active[skill].add(ordinal)
+        self._by_gender[fields.gender].add(ordinal)
+        self._by_rank[fields.rank].add(ordinal)
+        if fields.lucky:
+            self._lucky.add(ordinal)
+        if fields.boss:
+            self._boss.add(ordinal)
+        if sort_levels:
+            bisect.insort(self._levels, (fields.level, ordinal))
+        else:
+            self._levels.append((fields.level, ordinal))
+        self._search_text[pal_id] = (
+            f"{pal.nickname or ''}\n{pal.character_id or ''}".lower()
+        )
+
+    def _discard(self, pal_id: UUID) -> None:
+        fields = self._fields.pop(pal_id, None)
+        self._pals.pop(pal_id, None)
+        self._search_text.pop(pal_id, None)
+        if fields is None:
+            return
+        ordinal = fields.ordinal
+        del self._ordinals[ordinal]
+        self._all.discard(ordinal)
+        del self._level_of[ordinal]
+        del self._rank_of[ordinal]
+        self._by_owner[fields.owner_uid].discard(pal_id)
+        self._by_container[fields.container_id].discard(pal_id)
+        self._by_species[fields.species].discard(ordinal)
+        for element in fields.elements:
+            self._by_element[element].discard(ordinal)
+        for skill in fields.passives:
+            self._by_passive[skill].discard(ordinal)
+        for skill in fields.actives:
+            self._by_active[skill].discard(ordinal)
+        self._by_gender[fields.gender].discard(ordinal)
+        self._by_rank[fields.rank].discard(ordinal)
+        self._lucky.discard(ordinal)
+        self._boss.discard(ordinal)
+        position = bisect.bisect_left(self._levels, (fields.level, ordinal))
+        if position < len(self._levels) and self._levels[position][1] == ordinal:
+            del self._levels[position]
+
+    def _invalidate(self, owner_uid: Optional[UUID]) -> None:
+        for cache_key in [k for k in self._sorted if k[0] == owner_uid]:
+            del self._sorted[cache_key]
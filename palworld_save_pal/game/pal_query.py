@@ -0,0 +1,200 @@
+import re
+from typing import List, NamedTuple, Optional, Tuple, Union
+from uuid import UUID
+
+from palworld_save_pal.game.pal_objects import Element
+
+# Fields that are matched through an inverted index, by equality only
+SET_FIELDS = {
+    "passive": "passive",
+    "passive_skill": "passive",
+    "active": "active",
+    "active_skill": "active",
+    "species": "species",
+    "character_id": "species",
+    "element": "element",
+    "gender": "gender",
+    "owner": "owner",
+    "container": "container",
+    "lucky": "lucky",
+    "boss": "boss",
+}
+# Numeric fields, compared with = != < <= > >=
+RANGE_FIELDS = {"level", "rank"}
+# Nickname or species, ~ is a substring match and = an exact one
+TEXT_FIELDS = {"name", "nickname"}
+
+COMPARISONS = ("=", "!=", "<", "<=", ">", ">=")
+
+ELEMENT_ALIASES = {
+    alias: element.value.lower()
+    for element in Element
+    for alias in (element.name.lower(), element.value.lower())
+}
+
+TOKEN = re.compile(
+    r"""\s*(?:
+        (?P<op><=|>=|!=|=|<|>|~)
+        |(?P<paren>[()])
+        |"(?P<quoted>[^"]*)"
+        |(?P<word>[A-Za-z0-9_:.\-]+)
+    )""",
+    re.VERBOSE,
+)
+
+
+class Comparison(NamedTuple):
+    field: str
+    op: str
+    value: Union[str, int, bool, UUID]
+
+
+class Not(NamedTuple):
+    operand: "QueryNode"
+
+
+class And(NamedTuple):
+    operands: Tuple["QueryNode", ...]
+
+
+class Or(NamedTuple):
+    operands: Tuple["QueryNode", ...]
+
+
+QueryNode = Union[Comparison, Not, And, Or]
+
+
+def normalize_species(character_id: Optional[str]) -> str:
+    """Species key shared by wild, boss and differently cased ids"""
+    species = (character_id or "").lower()
+    if species.startswith("boss_"):
+        species = species[5:]
+    return species
+
+
+def parse_query(text: str) -> QueryNode:
+    """Parse a pal filter expression.
+
+    Comparisons look like ``field op value`` and combine with and, or, not
+    and parentheses, e.g. ``passive = Legend and (element = fire or
+    element = dark) and level >= 40``. Values with spaces go in double
+    quotes. Raises ValueError on malformed input.
+    """
+    parser = _Parser(_tokenize(text))
+    node = parser.parse_or()
+    if parser.peek() is not None:
+        raise ValueError(f"Unexpected {parser.peek()[1]!r} in query")
+    return node
+
+
+def _tokenize(text: str) -> List[Tuple[str, str]]:
+    tokens = []
+    position = 0
+    text = text.rstrip()
+    while position < len(text):
+        match = TOKEN.match(text, position)
+        if match is None or match.end() == position:
+            raise ValueError(f"Invalid query near {text[position:position + 10]!r}")
+        kind = match.lastgroup
+        value = match.group(kind)
+        if kind == "word" and value.lower() in ("and", "or", "not"):
+            kind = "keyword"
+            value = value.lower()
+        tokens.append((kind, value))
+        position = match.end()
+    return tokens
+
+
+class _Parser:
+    def __init__(self, tokens: List[Tuple[str, str]]):
+        self.tokens = tokens
+        self.position = 0
+
+    def peek(self) -> Optional[Tuple[str, str]]:
+        if self.position < len(self.tokens):
+            return self.tokens[self.position]
+        return None
+
+    def take(self) -> Tuple[str, str]:
+        token = self.peek()
+        if token is None:
+            raise ValueError("Unexpected end of query")
+        self.position += 1
+        return token
+
+    def parse_or(self) -> QueryNode:
+        operands = [self.parse_and()]
+        while self.peek() == ("keyword", "or"):
+            self.take()
+            operands.append(self.parse_and())
+        return operands[0] if len(operands) == 1 else Or(tuple(operands))
+
+    def parse_and(self) -> QueryNode:
+        operands = [self.parse_not()]
+        while self.peek() == ("keyword", "and"):
+            self.take()
+            operands.append(self.parse_not())
+        return operands[0] if len(operands) == 1 else And(tuple(operands))
+
+    def parse_not(self) -> QueryNode:
+        if self.peek() == ("keyword", "not"):
+            self.take()
+            return Not(self.parse_not())
+        if self.peek() == ("paren", "("):
+            self.take()
+            node = self.parse_or()
+            if self.take() != ("paren", ")"):
+                raise ValueError("Expected ) in query")
+            return node
+        return self.parse_comparison()
+
+    def parse_comparison(self) -> Comparison:
+        kind, field = self.take()
+        if kind != "word":
+            raise ValueError(f"Expected a field name, got {field!r}")
+        field = field.lower()
+        kind, op = self.take()
+        if kind != "op":
+            raise ValueError(f"Expected a comparison after {field}, got {op!r}")
+        kind, value = self.take()
+        if kind not in ("word", "quoted"):
+            raise ValueError(f"Expected a value after {field} {op}, got {value!r}")
+        return _comparison(field, op, value)
+
+
+def _comparison(field: str, op: str, value: str) -> Comparison:
+    if field in RANGE_FIELDS:
+        if op not in COMPARISONS:
+            raise ValueError(f"{field} supports {', '.join(COMPARISONS)}")
+        try:
+            return Comparison(field, op, int(value))
+        except ValueError:
+            raise ValueError(f"{field} expects a number, got {value!r}")
+    if field in TEXT_FIELDS:
+        if op not in ("~", "="):
+            raise ValueError(f"{field} supports ~ and =")
+        return Comparison("name", op, value.lower())
+    if field not in SET_FIELDS:
+        known = sorted(set(SET_FIELDS) | RANGE_FIELDS | TEXT_FIELDS)
+        raise ValueError(f"Unknown field {field}, expected one of {known}")
+    if op not in ("=", "!="):
+        raise ValueError(f"{field} supports = and !=")
+
+    field = SET_FIELDS[field]
+    if field in ("owner", "container"):
+        try:
+            return Comparison(field, op, UUID(value))
+        except ValueError:
+            raise ValueError(f"{field} expects a UUID, got {value!r}")
+    if field in ("lucky", "boss"):
+        if value.lower() not in ("true", "false"):
+            raise ValueError(f"{field} expects true or false, got {value!r}")
+        return Comparison(field, op, value.lower() == "true")
+    if field == "element":
+        element = ELEMENT_ALIASES.get(value.lower())
+        if element is None:
+            raise ValueError(f"Unknown element {value}")
+        return Comparison(field, op, element)
+    if field == "species":
+        return Comparison(field, op, normalize_species(value))
+    return Comparison(field, op, value.lower())
@@ -31,6 +31,7 @@ class Player(BaseModel):
     ext_status_point_list: Dict[str, int] = Field(default_factory=dict)
     instance_id: Optional[UUID] = Field(default=None)
     guild: Optional[Guild] = Field(default=None)
+    loaded: bool = True
 
     pals: Optional[Dict[UUID, Pal]] = Field(default_factory=dict)
     pal_box_id: Optional[UUID] = Field(default=None)
@@ -70,6 +71,14 @@ class Player(BaseModel):
             self._load_inventory(item_container_save_data, dynamic_item_save_data)
             self._load_pal_box(character_container_save_data)
             self._load_otomo_container(character_container_save_data)
+        elif character_save_parameter is not None:
+            # Listed from Level.sav only, the player save is parsed later
+            self._character_save_parameter = character_save_parameter
+            self.loaded = False
+            self._get_hp()
+            self._get_status_points()
+            self._get_stomach()
+            self._get_sanity()
 
     def add_pal(self, pal_code_name: str, nickname: str, container_id: UUID):
         new_pal_id = uuid.uuid4()
@@ -1,8 +1,10 @@
 import copy
 from enum import Enum
+import io
 import json
 import os
-from typing import Any, Dict, List, Optional
+import threading
+from typing import Any, Dict, Iterable, List, Optional
 from uuid import UUID
 from pydantic import BaseModel, ConfigDict, PrivateAttr
 
@@ -11,7 +13,6 @@ from palworld_save_tools.archive import (
     FArchiveWriter,
 )
 from palworld_save_tools.gvas import GvasFile
-from palworld_save_tools.json_tools import CustomEncoder
 from palworld_save_tools.palsav import compress_gvas_to_sav, decompress_sav_to_gvas
 from palworld_save_tools.paltypes import (
     DISABLED_PROPERTIES,
@@ -20,10 +21,21 @@ from palworld_save_tools.paltypes import (
 )
 
 from palworld_save_pal.game.guild import Guild
+from palworld_save_pal.game.item_container import ItemContainer
+from palworld_save_pal.game.item_container_slot import ItemContainerSlot
 from palworld_save_pal.game.pal import Pal
+from palworld_save_pal.game.pal_index import PalIndex
 from palworld_save_pal.game.pal_objects import GroupType, PalObjects
+from palworld_save_pal.game.save_validator import (
+    ReferenceSets,
+    ValidationReport,
+    validate_world_save_data,
+)
+from palworld_save_pal.utils.atomic import atomic_write
+from palworld_save_pal.utils.gvas_bin import load_bin, load_gvas, write_bin_file
 from palworld_save_pal.utils.logging_config import create_logger
 from palworld_save_pal.game.player import Player
+from palworld_save_pal.utils.json_stream import iter_json, write_json
 from palworld_save_pal.utils.uuid import are_equal_uuids
 from palworld_save_pal.game.item_container_slot import (
     encode as encode_item_container_slot,
@@ -140,6 +152,16 @@ CUSTOM_PROPERTIES[".worldSaveData.ItemContainerSaveData.Value.Slots.Slots.RawDat
 )
 
 
+def sav_save_type(save_game_class_name: str) -> int:
+    """SAV compression type, world saves are zlib compressed twice"""
+    if (
+        "Pal.PalWorldSaveGame" in save_game_class_name
+        or "Pal.PalLocalWorldSaveGame" in save_game_class_name
+    ):
+        return 0x32
+    return 0x31
+
+
 class SaveType(int, Enum):
     STEAM = 0
     GAMEPASS = 1
@@ -153,8 +175,13 @@ class SaveFile(BaseModel):
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
     _players: Dict[UUID, Player] = PrivateAttr(default_factory=dict)
+    _player_entries: Dict[UUID, Dict[str, Any]] = PrivateAttr(default_factory=dict)
+    _player_sav_paths: Dict[UUID, str] = PrivateAttr(default_factory=dict)
+    # Players are prefetched in a worker thread while handlers load on demand
+    _player_load_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
     _pals: Dict[UUID, Pal] = PrivateAttr(default_factory=dict)
     _guilds: Dict[UUID, Guild] = PrivateAttr(default_factory=dict)
+    _pal_index: PalIndex = PrivateAttr(default_factory=PalIndex)
 
     _gvas_file: Optional[GvasFile] = PrivateAttr(default=None)
     _level_meta_gvas_file: Optional[GvasFile] = PrivateAttr(default=None)
@@ -173,7 +200,7 @@ class SaveFile(BaseModel):
     def add_pal(
         self, player_id: UUID, pal_code_name: str, nickname: str, container_id: UUID
     ) -> Optional[Pal]:
-        player = self._players.get(player_id)
+        player = self._get_player(player_id)
         if not player:
             raise ValueError(f"Player {player_id} not found in the save file.")
 
@@ -183,17 +210,21 @@ class SaveFile(BaseModel):
         new_pal, new_pal_data = data
         self._character_save_parameter_map.append(new_pal_data)
         self._pals[new_pal.instance_id] = new_pal
+        self._pal_index.add(new_pal)
         return new_pal
 
     def move_pal(self, player_id: UUID, pal_id: UUID, container_id: UUID) -> Pal | None:
-        player = self._players.get(player_id)
+        player = self._get_player(player_id)
         if not player:
             raise ValueError(f"Player {player_id} not found in the save file.")
 
-        return player.move_pal(pal_id, container_id)
+        pal = player.move_pal(pal_id, container_id)
+        if pal:
+            self._pal_index.update(pal)
+        return pal
 
     def clone_pal(self, pal: Pal) -> Optional[Pal]:
-        player = self._players.get(pal.owner_uid)
+        player = self._get_player(pal.owner_uid)
         if not player:
             raise ValueError(f"Player {pal.owner_uid} not found in the save file.")
 
@@ -202,15 +233,17 @@ class SaveFile(BaseModel):
             return
         self._character_save_parameter_map.append(new_pal.character_save())
         self._pals[new_pal.instance_id] = new_pal
+        self._pal_index.add(new_pal)
         return new_pal
 
     def delete_pals(self, player_id: UUID, pal_ids: List[UUID]) -> None:
-        player = self._players.get(player_id)
+        player = self._get_player(player_id)
         if not player:
             raise ValueError(f"Player {player_id} not found in the save file.")
 
         for pal_id in pal_ids:
             player.delete_pal(pal_id)
+            self._pal_index.remove(pal_id)
 
     def heal_pals(self, pal_ids: List[UUID]) -> None:
         for pal_id in pal_ids:
@@ -220,13 +253,105 @@ class SaveFile(BaseModel):
                 continue
             pal.heal()
 
+    def find_players(
+        self,
+        player_ids: Optional[Iterable[UUID]] = None,
+        guild_id: Optional[UUID] = None,
+        all_players: bool = False,
+    ) -> List[Player]:
+        if all_players:
+            return [self._get_player(player_id) for player_id in list(self._players)]
+        players = {}
+        for player_id in player_ids or []:
+            player = self._get_player(player_id)
+            if not player:
+                raise ValueError(f"Player {player_id} not found in the save file.")
+            players[player.uid] = player
+        if guild_id is not None:
+            for player_id, player in list(self._players.items()):
+                if player.guild and are_equal_uuids(player.guild.id, guild_id):
+                    players[player_id] = self._get_player(player_id)
+        return list(players.values())
+
+    async def apply_inventory(
+        self,
+        players: List[Player],
+        containers: Dict[str, List[ItemContainerSlot]],
+        ws_callback=None,
+        progress_every: int = 25,
+    ) -> None:
+        """Write container layouts into many players in one pass.
+
+        Slots missing from a layout are emptied, like applying a preset in the
+        UI. Replaced dynamic items are pruned from the save data once at the
+        end rather than once per slot.
+        """
+        if not self._gvas_file:
+            raise ValueError("No GvasFile has been loaded.")
+
+        removed_items = set()
+        for count, player in enumerate(players, start=1):
+            for field, slots in containers.items():
+                container: Optional[ItemContainer] = getattr(player, field)
+                if container is None:
+                    continue
+                layout = {slot.slot_index: slot for slot in slots}
+                new_slots = [
+                    layout.pop(slot.slot_index, None)
+                    or ItemContainerSlot(
+                        slot_index=slot.slot_index, count=0, static_id="None"
+                    )
+                    for slot in container.slots
+                ]
+                new_slots.extend(layout.values())
+                container.replace_slots(
+                    [slot.model_copy(deep=True) for slot in new_slots],
+                    removed_items,
+                )
+            if ws_callback and (count % progress_every == 0 or count == len(players)):
+                await ws_callback(f"Updated {count}/{len(players)} players")
+
+        ItemContainer.prune_dynamic_items(self._dynamic_item_save_data, removed_items)
+        logger.info(
+            "Applied %s containers to %d players, replaced %d dynamic items",
+            len(containers),
+            len(players),
+            len(removed_items),
+        )
+
+    async def apply_pal_skills(
+        self,
+        pal_ids: Iterable[UUID],
+        active_skills: Optional[List[str]] = None,
+        passive_skills: Optional[List[str]] = None,
+        ws_callback=None,
+    ) -> List[Pal]:
+        pals = []
+        for pal_id in pal_ids:
+            pal = self._pals.get(pal_id)
+            if not pal:
+                logger.error("Pal %s not found in the save file.", pal_id)
+                continue
+            pal.set_skills(active_skills, passive_skills)
+            self._pal_index.update(pal)
+            pals.append(pal)
+        if ws_callback:
+            await ws_callback(f"Updated {len(pals)} pals")
+        logger.info("Applied skills to %d pals", len(pals))
+        return pals
+
+    def dump(self) -> Dict[str, Any]:
+        """The GVAS tree as JSON-shaped data, sharing the loaded properties"""
+        return self._gvas_file.dump()
+
     def get_json(self, minify=False, allow_nan=True):
         logger.info("Converting %s to JSON", self.name)
-        return json.dumps(
-            self._gvas_file.dump(),
-            indent=None if minify else "\t",
-            cls=CustomEncoder,
-            allow_nan=allow_nan,
+        return "".join(
+            iter_json(
+                self._gvas_file.dump(),
+                indent=None if minify else "\t",
+                allow_nan=allow_nan,
+            )
         )
 
     def get_pals(self):
@@ -235,11 +360,82 @@ class SaveFile(BaseModel):
     def get_players(self):
         return self._players
 
+    def get_guilds(self):
+        return self._guilds
+
+    def load_player(self, player_id: UUID) -> Player:
+        """Parse a lazily listed player's save, replacing its Level.sav summary"""
+        with self._player_load_lock:
+            player = self._players.get(player_id)
+            if player is None:
+                raise ValueError(f"Player {player_id} not found in the save file.")
+            if player.loaded:
+                return player
+            logger.info("Loading player save for %s", player.nickname)
+            with open(self._player_sav_paths[player_id], "rb") as f:
+                player_sav = f.read()
+            player = self._build_player(
+                self._player_entries[player_id], {player_id: player_sav}
+            )
+            self._players[player_id] = player
+            return player
+
+    def unloaded_player_ids(self) -> List[UUID]:
+        return [uid for uid, player in self._players.items() if not player.loaded]
+
+    def _get_player(self, player_id: UUID) -> Optional[Player]:
+        player = self._players.get(player_id)
+        if player is not None and not player.loaded:
+            player = self.load_player(player_id)
+        return player
+
+    def query_player_pals(
+        self,
+        player_id: UUID,
+        container_id: Optional[UUID] = None,
+        offset: int = 0,
+        limit: int = 100,
+        sort: str = "slot",
+        descending: bool = False,
+        text: Optional[str] = None,
+    ) -> tuple[int, List[Pal]]:
+        if player_id not in self._players:
+            raise ValueError(f"Player {player_id} not found in the save file.")
+        return self._pal_index.query(
+            player_id, container_id, offset, limit, sort, descending, text
+        )
+
+    def search_pals(
+        self,
+        query: str,
+        offset: int = 0,
+        limit: int = 100,
+        sort: str = "level",
+        descending: bool = False,
+    ) -> tuple[int, List[Pal]]:
+        return self._pal_index.search(
+            query, offset=offset, limit=limit, sort=sort, descending=descending
+        )
+
+    def validate(self, reference: Optional[ReferenceSets] = None) -> ValidationReport:
+        if not self._gvas_file:
+            raise ValueError("No GvasFile has been loaded.")
+        logger.info("Validating %s", self.name)
+        return validate_world_save_data(
+            PalObjects.get_value(self._gvas_file.properties["worldSaveData"]),
+            reference,
+        )
+
     def load_json(self, data: bytes):
         logger.info("Loading %s as JSON", self.name)
         self._gvas_file = GvasFile.load(json.loads(data))
         return self
 
+    def load_bin(self, data: bytes):
+        logger.info("Loading %s as GVAS bin", self.name)
+        self._gvas_file = load_gvas(load_bin(io.BytesIO(data)))
+        return self
+
     def load_level_meta(self, data: bytes):
         logger.info("Loading %s as GVAS", self.name)
         raw_gvas, _ = decompress_sav_to_gvas(data)
@@ -283,8 +479,15 @@ class SaveFile(BaseModel):
         level_sav: bytes,
         player_sav_files: Dict[str, bytes],
         level_meta: Optional[bytes] = None,
+        player_sav_paths: Optional[Dict[UUID, str]] = None,
     ):
+        """Load a world and its players.
+
+        Players with a save in player_sav_paths instead of player_sav_files are
+        listed from Level.sav only and their save is read on first use.
+        """
         logger.info("Loading %s as GVAS", self.name)
+        self._player_sav_paths = player_sav_paths or {}
         raw_gvas, _ = decompress_sav_to_gvas(level_sav)
         gvas_file = GvasFile.read(
             raw_gvas, PALWORLD_TYPE_HINTS, CUSTOM_PROPERTIES, allow_nan=True
@@ -308,14 +511,7 @@ class SaveFile(BaseModel):
 
     def sav(self):
         logger.info("Converting %s to SAV", self.name)
-        if (
-            "Pal.PalWorldSaveGame" in self._gvas_file.header.save_game_class_name
-            or "Pal.PalLocalWorldSaveGame"
-            in self._gvas_file.header.save_game_class_name
-        ):
-            save_type = 0x32
-        else:
-            save_type = 0x31
+        save_type = sav_save_type(self._gvas_file.header.save_game_class_name)
         gvas = copy.deepcopy(self._gvas_file)
         return compress_gvas_to_sav(gvas.write(CUSTOM_PROPERTIES), save_type)
 
@@ -326,33 +522,27 @@ class SaveFile(BaseModel):
         allow_nan=True,
     ):
         logger.info("Converting %s to JSON, saving to %s", self.name, output_path)
+        # GvasFile.dump shares the property tree, which is streamed to the
+        # file in chunks rather than encoded into one string first
         with open(output_path, "w", encoding="utf8") as f:
-            indent = None if minify else "\t"
-            json.dump(
+            write_json(
                 self._gvas_file.dump(),
                 f,
-                indent=indent,
-                cls=CustomEncoder,
+                indent=None if minify else "\t",
                 allow_nan=allow_nan,
             )
 
+    def to_bin_file(self, output_path, compress=True):
+        logger.info("Converting %s to GVAS bin, saving to %s", self.name, output_path)
+        write_bin_file(output_path, self._gvas_file, compress=compress)
+
     def to_sav_file(self, output_path):
         logger.info("Converting %s to SAV, saving to %s", self.name, output_path)
-        if (
-            "Pal.PalWorldSaveGame" in self._gvas_file.header.save_game_class_name
-            or "Pal.PalLocalWorldSaveGame"
-            in self._gvas_file.header.save_game_class_name
-        ):
-            save_type = 0x32
-        else:
-
-            save_type = 0x31
-
+        save_type = sav_save_type(self._gvas_file.header.save_game_class_name)
         logger.info("Compressing GVAS to SAV with save type %s", save_type)
         gvas = copy.deepcopy(self._gvas_file)
         sav_file = compress_gvas_to_sav(gvas.write(CUSTOM_PROPERTIES), save_type)
-        with open(output_path, "wb") as f:
-            f.write(sav_file)
+        atomic_write(output_path, sav_file)
 
     async def update_pals(self, modified_pals: Dict[UUID, Pal], ws_callback) -> None:
         if not self._gvas_file:
@@ -388,11 +578,7 @@ class SaveFile(BaseModel):
 
     def _get_player_pals(self, uid):
         logger.info("Loading Pals for player %s", uid)
-        pals = {}
-        pals = {
-            k: v for k, v in self._pals.items() if are_equal_uuids(v.owner_uid, uid)
-        }
-        return pals
+        return self._pal_index.owned_by(uid)
 
     def _get_player_save_data(self, player_gvas: Dict[str, Any]):
         player_save_data = PalObjects.get_value(player_gvas.properties["SaveData"])
@@ -438,6 +624,7 @@ class SaveFile(BaseModel):
                 self._pals[instance.instance_id] = instance
             else:
                 logger.warning("Failed to create PalEntity summary")
+        self._pal_index.rebuild(self._pals)
 
     def _load_world_name(self):
         world_name = PalObjects.get_nested(
@@ -484,65 +671,126 @@ class SaveFile(BaseModel):
             return {}
         logger.info("Loading Players")
 
-        def extract_player_info(entry):
+        players = {}
+        self._player_entries = {}
+        for entry in self._character_save_parameter_map:
+            if not self._is_player(entry):
+                continue
             uid = PalObjects.get_guid(entry["key"]["PlayerUId"])
-            player_sav_bytes = player_sav_files.get(uid)
-            if not player_sav_bytes:
-                logger.warning("No player save file found for player %s", uid)
-                return
-            save_parameter = PalObjects.get_nested(
-                entry,
-                "value",
-                "RawData",
-                "value",
-                "object",
-                "SaveParameter",
-                "value",
-            )
-            nickname = PalObjects.get_value(save_parameter["NickName"])
-            level = (
-                PalObjects.get_byte_property(save_parameter["Level"])
-                if "Level" in save_parameter
-                else 1
-            )
-            exp = (
-                PalObjects.get_value(save_parameter["Exp"])
-                if "Exp" in save_parameter
-                else 0
-            )
+            self._player_entries[uid] = entry
+            if uid in self._player_sav_paths and uid not in (player_sav_files or {}):
+                player = self._list_player(entry)
+            else:
+                player = self._build_player(entry, player_sav_files or {})
+            if player:
+                players[player.uid] = player
+        self._players = players
 
-            raw_gvas, _ = decompress_sav_to_gvas(player_sav_bytes)
-            gvas_file = GvasFile.read(
-                raw_gvas, PALWORLD_TYPE_HINTS, CUSTOM_PROPERTIES, allow_nan=True
-            )
-            self._player_gvas_files[uid] = gvas_file
-            player = Player(
-                uid=uid,
-                nickname=nickname,
-                level=level,
-                exp=exp,
-                gvas_file=gvas_file,
-                item_container_save_data=self._item_container_save_data,
-                dynamic_item_save_data=self._dynamic_item_save_data,
-                character_container_save_data=self._character_container_save_data,
-                character_save_parameter=save_parameter,
-                guild=self._player_guild(uid),
-            )
-            player.pals = self._get_player_pals(uid)
-            return player
+    def reload_players(
+        self,
+        player_sav_files: Dict[UUID, bytes],
+        removed_player_ids: Iterable[UUID] = (),
+    ) -> List[UUID]:
+        """Re-parse the given player saves against the loaded Level.sav.
+
+        Only valid while Level.sav itself is unchanged; players whose save was
+        removed are dropped. Returns the ids of players that changed.
+        """
+        changed = []
+        for player_id in removed_player_ids:
+            if self._players.pop(player_id, None) is not None:
+                self._player_gvas_files.pop(player_id, None)
+                changed.append(player_id)
 
-        players = {}
         for entry in self._character_save_parameter_map:
-            if self._is_player(entry):
-                player = extract_player_info(entry)
-                if player:
-                    players[player.uid] = player
-        self._players = players
+            if not self._is_player(entry):
+                continue
+            uid = PalObjects.get_guid(entry["key"]["PlayerUId"])
+            if uid not in player_sav_files:
+                continue
+            current = self._players.get(uid)
+            if current is not None and not current.loaded:
+                # Still read from disk on first use, so nothing to refresh
+                continue
+            player = self._build_player(entry, player_sav_files)
+            if player:
+                self._players[uid] = player
+                changed.append(uid)
+        logger.info("Reloaded %d players", len(changed))
+        return changed
+
+    def _list_player(self, entry: Dict[str, Any]) -> Player:
+        uid = PalObjects.get_guid(entry["key"]["PlayerUId"])
+        save_parameter, nickname, level, exp = self._player_summary(entry)
+        player = Player(
+            uid=uid,
+            nickname=nickname,
+            level=level,
+            exp=exp,
+            character_save_parameter=save_parameter,
+            guild=self._player_guild(uid),
+        )
+        player.pals = self._get_player_pals(uid)
+        return player
+
+    def _player_summary(self, entry: Dict[str, Any]):
+        save_parameter = PalObjects.get_nested(
+            entry,
+            "value",
+            "RawData",
+            "value",
+            "object",
+            "SaveParameter",
+            "value",
+        )
+        nickname = PalObjects.get_value(save_parameter["NickName"])
+        level = (
+            PalObjects.get_byte_property(save_parameter["Level"])
+            if "Level" in save_parameter
+            else 1
+        )
+        exp = (
+            PalObjects.get_value(save_parameter["Exp"])
+            if "Exp" in save_parameter
+            else 0
+        )
+        return save_parameter, nickname, level, exp
+
+    def _build_player(
+        self, entry: Dict[str, Any], player_sav_files: Dict[UUID, bytes]
+    ) -> Optional[Player]:
+        uid = PalObjects.get_guid(entry["key"]["PlayerUId"])
+        player_sav_bytes = player_sav_files.get(uid)
+        if not player_sav_bytes:
+            logger.warning("No player save file found for player %s", uid)
+            return
+        save_parameter, nickname, level, exp = self._player_summary(entry)
+
+        raw_gvas, _ = decompress_sav_to_gvas(player_sav_bytes)
+        gvas_file = GvasFile.read(
+            raw_gvas, PALWORLD_TYPE_HINTS, CUSTOM_PROPERTIES, allow_nan=True
+        )
+        self._player_gvas_files[uid] = gvas_file
+        player = Player(
+            uid=uid,
+            nickname=nickname,
+            level=level,
+            exp=exp,
+            gvas_file=gvas_file,
+            item_container_save_data=self._item_container_save_data,
+            dynamic_item_save_data=self._dynamic_item_save_data,
+            character_container_save_data=self._character_container_save_data,
+            character_save_parameter=save_parameter,
+            guild=self._player_guild(uid),
+        )
+        player.pals = self._get_player_pals(uid)
+        return player
 
     def _update_pal(self, pal_id: UUID, updated_pal: Pal) -> None:
         existing_pal = self._pals[pal_id]
         existing_pal.update_from(updated_pal)
+        self._pal_index.update(existing_pal)
 
     def _update_player(self, player: Player) -> None:
-        existing_player = self._players.get(player.uid)
+        existing_player = self._get_player(player.uid)
         existing_player.update_from(player)
@@ -0,0 +1,394 @@
+import time
+from collections import Counter
+from enum import Enum
+from typing import Any, Dict, FrozenSet, List, NamedTuple, Optional, Set
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from palworld_save_pal.game.pal_objects import PalObjects
+from palworld_save_pal.game.pal_query import normalize_species
+from palworld_save_pal.utils.logging_config import create_logger
+from palworld_save_pal.utils.reference_data import ReferenceData, get_reference_data
+
+logger = create_logger(__name__)
+
+GENDERS = {"EPalGenderType::Male", "EPalGenderType::Female"}
+# Static ids of empty item slots
+EMPTY_STATIC_IDS = {"", "None"}
+
+
+def _get(d: Any, *keys: str, default: Any = None) -> Any:
+    # PalObjects.get_nested logs every missing key, most checks here are optional
+    for key in keys:
+        if not isinstance(d, dict) or key not in d:
+            return default
+        d = d[key]
+    return d
+
+
+def _uuid(value: Any) -> Optional[UUID]:
+    uid = PalObjects.as_uuid(value)
+    if uid is None or uid == PalObjects.EMPTY_UUID:
+        return None
+    return uid
+
+
+class Severity(str, Enum):
+    # The game rejects or silently drops the data
+    ERROR = "error"
+    # Unusual but loadable, e.g. content from a newer game version
+    WARNING = "warning"
+
+
+class ValidationIssue(BaseModel):
+    severity: Severity
+    code: str
+    # Id of the pal, container or guild the issue was found on
+    subject: Optional[str] = None
+    value: Optional[str] = None
+    message: str
+
+
+class ValidationReport(BaseModel):
+    issues: List[ValidationIssue] = Field(default_factory=list)
+    # Entries checked per section
+    checked: Dict[str, int] = Field(default_factory=dict)
+    seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return not any(issue.severity == Severity.ERROR for issue in self.issues)
+
+    def counts(self) -> Dict[str, int]:
+        return dict(Counter(issue.code for issue in self.issues))
+
+
+class ReferenceSets(NamedTuple):
+    species: FrozenSet[str]
+    items: FrozenSet[str]
+    active_skills: FrozenSet[str]
+    passive_skills: FrozenSet[str]
+
+
+def reference_sets(reference_data: Optional[ReferenceData] = None) -> ReferenceSets:
+    """Known ids from data/json, species normalized like the pal index"""
+    reference_data = reference_data or get_reference_data()
+    return ReferenceSets(
+        species=frozenset(
+            normalize_species(code_name)
+            for code_name in reference_data.get("pals", "en")
+        ),
+        items=frozenset(reference_data.get("items", "en")),
+        active_skills=frozenset(reference_data.get("active_skills", "en")),
+        passive_skills=frozenset(reference_data.get("passive_skills", "en")),
+    )
+
+
+class SaveValidator:
+    """Checks a worldSaveData tree against the reference data.
+
+    Each section is walked once. Ids seen on the way (pal instances,
+    containers, dynamic items) are collected into sets, and the cross
+    references between sections are checked against those sets, so the
+    whole check is linear in the size of the save.
+    """
+
+    def __init__(self, reference: Optional[ReferenceSets] = None):
+        self.reference = reference or reference_sets()
+        self.report = ValidationReport()
+
+    def validate(self, world_save_data: Dict[str, Any]) -> ValidationReport:
+        start = time.perf_counter()
+        characters = _get(world_save_data, "CharacterSaveParameterMap", "value")
+        character_containers = _get(
+            world_save_data, "CharacterContainerSaveData", "value"
+        )
+        item_containers = _get(world_save_data, "ItemContainerSaveData", "value")
+        dynamic_items = _get(world_save_data, "DynamicItemSaveData", "value", "values")
+        groups = _get(world_save_data, "GroupSaveDataMap", "value")
+
+        instance_ids, pal_slots = self._check_characters(characters or [])
+        slotted = self._check_character_containers(
+            character_containers or [], instance_ids
+        )
+        for pal_id, container_id in pal_slots.items():
+            if container_id is not None and pal_id not in slotted:
+                self._add(
+                    Severity.WARNING,
+                    "pal_not_in_container",
+                    pal_id,
+                    container_id,
+                    f"Pal {pal_id} points at container {container_id} "
+                    "which has no slot for it",
+                )
+        local_ids = self._check_dynamic_items(dynamic_items or [])
+        referenced = self._check_item_containers(item_containers or [], local_ids)
+        for local_id in local_ids - referenced:
+            self._add(
+                Severity.WARNING,
+                "unreferenced_dynamic_item",
+                local_id,
+                None,
+                f"Dynamic item {local_id} is not in any item container",
+            )
+        self._check_groups(groups or [], instance_ids)
+
+        self.report.seconds = round(time.perf_counter() - start, 3)
+        logger.info(
+            "Validated save in %ss: %s issues %s",
+            self.report.seconds,
+            len(self.report.issues),
+            self.report.counts(),
+        )
+        return self.report
+
+    def _add(
+        self,
+        severity: Severity,
+        code: str,
+        subject: Any,
+        value: Any,
+        message: str,
+    ) -> None:
+        self.report.issues.append(
+            ValidationIssue(
+                severity=severity,
+                code=code,
+                subject=None if subject is None else str(subject),
+                value=None if value is None else str(value),
+                message=message,
+            )
+        )
+
+    def _check_characters(self, characters: List[Dict[str, Any]]):
+        instance_ids: Set[UUID] = set()
+        # Container each pal says it is in
+        pal_slots: Dict[UUID, Optional[UUID]] = {}
+        for entry in characters:
+            instance_id = _uuid(_get(entry, "key", "InstanceId", "value"))
+            if instance_id in instance_ids:
+                self._add(
+                    Severity.ERROR,
+                    "duplicate_instance_id",
+                    instance_id,
+                    None,
+                    f"Instance {instance_id} appears more than once",
+                )
+            instance_ids.add(instance_id)
+            save_parameter = _get(
+                entry, "value", "RawData", "value", "object", "SaveParameter", "value"
+            )
+            if not save_parameter or _get(save_parameter, "IsPlayer", "value"):
+                continue
+            self._check_pal(instance_id, save_parameter)
+            pal_slots[instance_id] = _uuid(
+                _get(save_parameter, "SlotID", "value", "ContainerId", "value", "ID", "value")
+            )
+        self.report.checked["characters"] = len(characters)
+        return instance_ids, pal_slots
+
+    def _check_pal(self, instance_id: UUID, save_parameter: Dict[str, Any]) -> None:
+        character_id = _get(save_parameter, "CharacterID", "value")
+        if character_id and normalize_species(character_id) not in self.reference.species:
+            self._add(
+                Severity.WARNING,
+                "unknown_character_id",
+                instance_id,
+                character_id,
+                f"Pal {instance_id} has unknown character {character_id}",
+            )
+
+        gender = _get(save_parameter, "Gender", "value", "value")
+        if gender and gender not in GENDERS:
+            self._add(
+                Severity.ERROR,
+                "unexpected_gender",
+                instance_id,
+                gender,
+                f"Pal {instance_id} has unexpected gender {gender}",
+            )
+
+        for skill_list in ("EquipWaza", "MasteredWaza"):
+            for skill in _get(save_parameter, skill_list, "value", "values", default=[]):
+                if skill not in self.reference.active_skills:
+                    self._add(
+                        Severity.WARNING,
+                        "unknown_active_skill",
+                        instance_id,
+                        skill,
+                        f"Pal {instance_id} has unknown active skill {skill}",
+                    )
+        for skill in _get(
+            save_parameter, "PassiveSkillList", "value", "values", default=[]
+        ):
+            if skill not in self.reference.passive_skills:
+                self._add(
+                    Severity.WARNING,
+                    "unknown_passive_skill",
+                    instance_id,
+                    skill,
+                    f"Pal {instance_id} has unknown passive skill {skill}",
+                )
+
+    def _check_character_containers(
+        self, containers: List[Dict[str, Any]], instance_ids: Set[UUID]
+    ) -> Set[UUID]:
+        slotted: Set[UUID] = set()
+        for entry in containers:
+            container_id = _uuid(_get(entry, "key", "ID", "value"))
+            slot_num = _get(entry, "value", "SlotNum", "value")
+            slots = _get(entry, "value", "Slots", "value", "values", default=[])
+
+            seen: Set[int] = set()
+            occupied = 0
+            for slot in slots:
+                slot_index = _get(slot, "SlotIndex", "value")
+                pal_id = _uuid(_get(slot, "RawData", "value", "instance_id"))
+                if pal_id is None:
+                    continue
+                occupied += 1
+                slotted.add(pal_id)
+                self._check_slot_index(
+                    "character_container", container_id, slot_index, slot_num, seen
+                )
+                if pal_id not in instance_ids:
+                    self._add(
+                        Severity.ERROR,
+                        "orphaned_pal_id",
+                        container_id,
+                        pal_id,
+                        f"Container {container_id} slot {slot_index} holds "
+                        f"pal {pal_id} which does not exist",
+                    )
+            if slot_num is not None and occupied > slot_num:
+                self._add(
+                    Severity.ERROR,
+                    "character_container_overflow",
+                    container_id,
+                    occupied,
+                    f"Container {container_id} holds {occupied} pals "
+                    f"but has {slot_num} slots",
+                )
+        self.report.checked["character_containers"] = len(containers)
+        return slotted
+
+    def _check_dynamic_items(self, dynamic_items: List[Dict[str, Any]]) -> Set[UUID]:
+        local_ids: Set[UUID] = set()
+        for entry in dynamic_items:
+            local_id = _uuid(
+                _get(entry, "RawData", "value", "id", "local_id_in_created_world")
+            )
+            if local_id is None:
+                continue
+            local_ids.add(local_id)
+            static_id = _get(entry, "RawData", "value", "id", "static_id")
+            if static_id not in EMPTY_STATIC_IDS and static_id not in self.reference.items:
+                self._add(
+                    Severity.WARNING,
+                    "unknown_static_id",
+                    local_id,
+                    static_id,
+                    f"Dynamic item {local_id} has unknown static id {static_id}",
+                )
+        self.report.checked["dynamic_items"] = len(dynamic_items)
+        return local_ids
+
+    def _check_item_containers(
+        self, containers: List[Dict[str, Any]], local_ids: Set[UUID]
+    ) -> Set[UUID]:
+        referenced: Set[UUID] = set()
+        for entry in containers:
+            container_id = _uuid(_get(entry, "key", "ID", "value"))
+            slot_num = _get(entry, "value", "SlotNum", "value")
+            slots = _get(entry, "value", "Slots", "value", "values", default=[])
+
+            seen: Set[int] = set()
+            for slot in slots:
+                slot_index = _get(slot, "RawData", "value", "slot_index")
+                static_id = _get(slot, "RawData", "value", "static_id")
+                self._check_slot_index(
+                    "item_container", container_id, slot_index, slot_num, seen
+                )
+                if static_id not in EMPTY_STATIC_IDS and static_id not in self.reference.items:
+                    self._add(
+                        Severity.WARNING,
+                        "unknown_static_id",
+                        container_id,
+                        static_id,
+                        f"Item container {container_id} slot {slot_index} has "
+                        f"unknown static id {static_id}",
+                    )
+                local_id = _uuid(_get(slot, "RawData", "value", "local_id"))
+                if local_id is None:
+                    continue
+                referenced.add(local_id)
+                if local_id not in local_ids:
+                    self._add(
+                        Severity.ERROR,
+                        "dangling_dynamic_item",
+                        container_id,
+                        local_id,
+                        f"Item container {container_id} slot {slot_index} points "
+                        f"at dynamic item {local_id} which does not exist",
+                    )
+        self.report.checked["item_containers"] = len(containers)
+        return referenced
+
+    def _check_slot_index(
+        self,
+        kind: str,
+        container_id: UUID,
+        slot_index: Optional[int],
+        slot_num: Optional[int],
+        seen: Set[int],
+    ) -> None:
+        if slot_index in seen:
+            self._add(
+                Severity.ERROR,
+                f"duplicate_{kind}_slot",
+                container_id,
+                slot_index,
+                f"Slot {slot_index} of {container_id} is used more than once",
+            )
+        seen.add(slot_index)
+        if slot_num is not None and slot_index is not None and slot_index >= slot_num:
+            self._add(
+                Severity.ERROR,
+                f"{kind}_slot_out_of_range",
+                container_id,
+                slot_index,
+                f"Slot {slot_index} of {container_id} is past its {slot_num} slots",
+            )
+
+    def _check_groups(
+        self, groups: List[Dict[str, Any]], instance_ids: Set[UUID]
+    ) -> None:
+        for entry in groups:
+            group_id = _uuid(entry.get("key"))
+            handles = _get(
+                entry,
+                "value",
+                "RawData",
+                "value",
+                "individual_character_handle_ids",
+                default=[],
+            )
+            for handle in handles:
+                instance_id = _uuid(handle.get("instance_id"))
+                if instance_id is not None and instance_id not in instance_ids:
+                    self._add(
+                        Severity.WARNING,
+                        "dangling_guild_handle",
+                        group_id,
+                        instance_id,
+                        f"Group {group_id} has a handle to {instance_id} "
+                        "which does not exist",
+                    )
+        self.report.checked["groups"] = len(groups)
+
+
+def validate_world_save_data(
+    world_save_data: Dict[str, Any], reference: Optional[ReferenceSets] = None
+) -> ValidationReport:
+    return SaveValidator(reference).validate(world_save_data)
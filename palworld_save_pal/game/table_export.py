@@ -0,0 +1,328 @@
+import csv
+import io
+import os
+import time
+from enum import Enum
+from itertools import islice
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+from palworld_save_pal.game.item_container import ItemContainer
+from palworld_save_pal.game.player import Player
+from palworld_save_pal.game.save_file import SaveFile
+from palworld_save_pal.utils.atomic import atomic_write_with
+from palworld_save_pal.utils.logging_config import create_logger
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+logger = create_logger(__name__)
+
+CHUNK_ROWS = 50_000
+# Multi-valued fields (skills, elements) are joined into one column
+LIST_SEPARATOR = "|"
+
+_ARROW_TYPES = {str: "string", int: "int64", float: "float64", bool: "bool"}
+
+# Column name and type per table, rows are tuples in this order
+Columns = List[Tuple[str, type]]
+
+PAL_COLUMNS: Columns = [
+    ("instance_id", str),
+    ("owner_uid", str),
+    ("character_id", str),
+    ("nickname", str),
+    ("gender", str),
+    ("is_lucky", bool),
+    ("is_boss", bool),
+    ("is_tower", bool),
+    ("level", int),
+    ("exp", int),
+    ("rank", int),
+    ("rank_hp", int),
+    ("rank_attack", int),
+    ("rank_defense", int),
+    ("rank_craftspeed", int),
+    ("talent_hp", int),
+    ("talent_shot", int),
+    ("talent_defense", int),
+    ("hp", int),
+    ("max_hp", int),
+    ("stomach", float),
+    ("sanity", float),
+    ("storage_id", str),
+    ("storage_slot", int),
+    ("group_id", str),
+    ("elements", str),
+    ("active_skills", str),
+    ("passive_skills", str),
+    ("learned_skills", str),
+]
+PLAYER_COLUMNS: Columns = [
+    ("uid", str),
+    ("nickname", str),
+    ("level", int),
+    ("exp", int),
+    ("hp", int),
+    ("stomach", float),
+    ("sanity", float),
+    ("guild_id", str),
+    ("loaded", bool),
+    ("pal_count", int),
+    ("pal_box_id", str),
+    ("otomo_container_id", str),
+]
+GUILD_COLUMNS: Columns = [
+    ("id", str),
+    ("name", str),
+    ("admin_player_uid", str),
+    ("player_count", int),
+]
+ITEM_SLOT_COLUMNS: Columns = [
+    ("player_uid", str),
+    ("container_id", str),
+    ("container_type", str),
+    ("slot_index", int),
+    ("static_id", str),
+    ("count", int),
+    ("local_id", str),
+]
+DYNAMIC_ITEM_COLUMNS: Columns = [
+    ("player_uid", str),
+    ("container_id", str),
+    ("local_id", str),
+    ("type", str),
+    ("durability", float),
+    ("remaining_bullets", int),
+]
+
+
+class TableFormat(str, Enum):
+    CSV = "csv"
+    PARQUET = "parquet"
+
+
+class TableExportResult(BaseModel):
+    output_dir: str
+    format: TableFormat
+    rows: Dict[str, int] = Field(default_factory=dict)
+    seconds: float = 0.0
+
+
+def export_tables(
+    save_file: SaveFile,
+    output_dir: str,
+    format: TableFormat = TableFormat.CSV,
+    chunk_rows: int = CHUNK_ROWS,
+    load_players: bool = True,
+) -> TableExportResult:
+    """Write pals, players, guilds, item slots and dynamic items as flat tables.
+
+    One file per table, named <table>.csv or <table>.parquet, with UUIDs as
+    strings and list fields joined with LIST_SEPARATOR. Rows are produced
+    lazily from the parsed models and written chunk_rows at a time, a
+    Parquet chunk being one row group, so only one chunk of any table is
+    ever held as rows. Inventories come from the players' own saves; with
+    load_players lazily listed players are parsed for them, otherwise only
+    already loaded players contribute item rows.
+    """
+    if format == TableFormat.PARQUET and pyarrow is None:
+        raise ValueError("Parquet export needs pyarrow installed")
+    start = time.perf_counter()
+    os.makedirs(output_dir, exist_ok=True)
+    result = TableExportResult(output_dir=output_dir, format=format)
+
+    players = _players(save_file, load_players)
+    tables = [
+        ("pals", PAL_COLUMNS, _pal_rows(save_file.get_pals().values())),
+        ("players", PLAYER_COLUMNS, _player_rows(players)),
+        ("guilds", GUILD_COLUMNS, _guild_rows(save_file.get_guilds().values())),
+        ("item_slots", ITEM_SLOT_COLUMNS, _item_slot_rows(players)),
+        ("dynamic_items", DYNAMIC_ITEM_COLUMNS, _dynamic_item_rows(players)),
+    ]
+    for name, columns, rows in tables:
+        path = os.path.join(output_dir, f"{name}.{format.value}")
+        result.rows[name] = _write_table(path, columns, rows, format, chunk_rows)
+        logger.info("Wrote %s rows to %s", result.rows[name], path)
+
+    result.seconds = round(time.perf_counter() - start, 3)
+    return result
+
+
+def _write_table(
+    path: str,
+    columns: Columns,
+    rows: Iterable[Tuple],
+    format: TableFormat,
+    chunk_rows: int,
+) -> int:
+    written = 0
+
+    def write_csv(f: IO[bytes]):
+        nonlocal written
+        text = io.TextIOWrapper(f, encoding="utf-8", newline="")
+        writer = csv.writer(text)
+        writer.writerow([name for name, _ in columns])
+        for chunk in _chunks(rows, chunk_rows):
+            writer.writerows(chunk)
+            written += len(chunk)
+        text.flush()
+        text.detach()
+
+    def write_parquet(f: IO[bytes]):
+        nonlocal written
+        schema = pyarrow.schema(
+            [
+                (name, pyarrow.type_for_alias(_ARROW_TYPES[column_type]))
+                for name, column_type in columns
+            ]
+        )
+        with pyarrow.parquet.ParquetWriter(f, schema) as writer:
+            for chunk in _chunks(rows, chunk_rows):
+                arrays = [
+                    pyarrow.array(values, type=field.type)
+                    for values, field in zip(zip(*chunk), schema)
+                ]
+                writer.write_table(pyarrow.Table.from_arrays(arrays, schema=schema))
+                written += len(chunk)
+
+    atomic_write_with(path, write_csv if format == TableFormat.CSV else write_parquet)
+    return written
+
+
+def _chunks(rows: Iterable[Tuple], size: int) -> Iterator[List[Tuple]]:
+    rows = iter(rows)
+    while chunk := list(islice(rows, size)):
+        yield chunk
+
+
+def _players(save_file: SaveFile, load_players: bool) -> List[Player]:
+    if load_players:
+        for uid in save_file.unloaded_player_ids():
+            try:
+                save_file.load_player(uid)
+            except (OSError, ValueError) as e:
+                logger.warning("Skipping inventory of player %s: %s", uid, e)
+    return list(save_file.get_players().values())
+
+
+def _str(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    if isinstance(value, Enum):
+        return value.value
+    return str(value)
+
+
+def _join(values: Optional[Iterable[Any]]) -> str:
+    return LIST_SEPARATOR.join(_str(value) for value in values or ())
+
+
+def _pal_rows(pals: Iterable[Any]) -> Iterator[Tuple]:
+    for pal in pals:
+        yield (
+            _str(pal.instance_id),
+            _str(pal.owner_uid),
+            pal.character_id,
+            pal.nickname,
+            _str(pal.gender),
+            pal.is_lucky,
+            pal.is_boss,
+            pal.is_tower,
+            pal.level,
+            pal.exp,
+            pal.rank,
+            pal.rank_hp,
+            pal.rank_attack,
+            pal.rank_defense,
+            pal.rank_craftspeed,
+            pal.talent_hp,
+            pal.talent_shot,
+            pal.talent_defense,
+            pal.hp,
+            pal.max_hp,
+            pal.stomach,
+            pal.sanity,
+            _str(pal.storage_id),
+            pal.storage_slot,
+            _str(pal.group_id),
+            _join(pal.elements),
+            _join(pal.active_skills),
+            _join(pal.passive_skills),
+            _join(pal.learned_skills),
+        )
+
+
+def _player_rows(players: Iterable[Player]) -> Iterator[Tuple]:
+    for player in players:
+        yield (
+            _str(player.uid),
+            player.nickname,
+            player.level,
+            player.exp,
+            player.hp,
+            player.stomach,
+            player.sanity,
+            _str(player.guild.id) if player.guild else None,
+            player.loaded,
+            len(player.pals or {}),
+            _str(player.pal_box_id),
+            _str(player.otomo_container_id),
+        )
+
+
+def _guild_rows(guilds: Iterable[Any]) -> Iterator[Tuple]:
+    for guild in guilds:
+        yield (
+            _str(guild.id),
+            guild.name,
+            _str(guild.admin_player_uid),
+            len(guild.players or []),
+        )
+
+
+def _containers(players: Iterable[Player]) -> Iterator[Tuple[Player, ItemContainer]]:
+    for player in players:
+        for container in (
+            player.common_container,
+            player.essential_container,
+            player.weapon_load_out_container,
+            player.player_equipment_armor_container,
+            player.food_equip_container,
+        ):
+            if container is not None:
+                yield player, container
+
+
+def _item_slot_rows(players: Iterable[Player]) -> Iterator[Tuple]:
+    for player, container in _containers(players):
+        for slot in container.slots:
+            yield (
+                _str(player.uid),
+                _str(container.id),
+                _str(container.type),
+                slot.slot_index,
+                slot.static_id,
+                slot.count,
+                _str(slot.dynamic_item.local_id) if slot.dynamic_item else None,
+            )
+
+
+def _dynamic_item_rows(players: Iterable[Player]) -> Iterator[Tuple]:
+    for player, container in _containers(players):
+        for slot in container.slots:
+            item = slot.dynamic_item
+            if item is None:
+                continue
+            yield (
+                _str(player.uid),
+                _str(container.id),
+                _str(item.local_id),
+                item.type,
+                item.durability,
+                item.remaining_bullets,
+            )
@@ -0,0 +1,394 @@
+import os
+import random
+import uuid
+from typing import Any, Dict, List
+from uuid import UUID
+
+from palworld_save_tools.palsav import compress_gvas_to_sav
+from pydantic import BaseModel, Field
+
+from palworld_save_pal.game.dynamic_item import DynamicItem
+from palworld_save_pal.game.item_container_slot import ItemContainerSlot
+from palworld_save_pal.game.pal_objects import ArrayType, GroupType, PalObjects
+from palworld_save_pal.game.save_file import CUSTOM_PROPERTIES, sav_save_type
+from palworld_save_pal.utils.atomic import atomic_write
+from palworld_save_pal.utils.gvas_bin import load_gvas
+from palworld_save_pal.utils.logging_config import create_logger
+
+logger = create_logger(__name__)
+
+GVAS_HEADER = {
+    "magic": 1396790855,
+    "save_game_version": 3,
+    "package_file_version_ue4": 522,
+    "package_file_version_ue5": 1008,
+    "engine_version_major": 5,
+    "engine_version_minor": 1,
+    "engine_version_patch": 1,
+    "engine_version_changelist": 0,
+    "engine_version_branch": "++UE5+Release-5.1",
+    "custom_version_format": 3,
+    "custom_versions": [],
+}
+LEVEL_SAVE_GAME_CLASS = "/Script/Pal.PalWorldSaveGame"
+PLAYER_SAVE_GAME_CLASS = "/Script/Pal.PalWorldPlayerSaveGame"
+
+SPECIES = ("SheepBall", "PinkCat", "ChickenPal", "Carbunclo", "Kitsunebi", "Anubis")
+ACTIVE_SKILLS = ("EPalWazaID::AirCanon", "EPalWazaID::FireBall")
+PASSIVE_SKILLS = ("Legend", "Rare", "CraftSpeed_up2", "PAL_ALLAttack_up2")
+ITEMS = ("Wood", "Stone", "Fiber", "PalSphere", "Berries")
+WEAPONS = ("AssaultRifle_Default1", "BowGun", "Spear")
+# Free slots left in every pal box, so pals can be added and cloned
+PAL_BOX_HEADROOM = 64
+PARTY_SIZE = 5
+MIN_COMMON_CONTAINER_SIZE = 42
+EQUIPMENT_CONTAINER_SIZE = 10
+# Every n-th inventory item is a weapon backed by a dynamic item
+WEAPON_EVERY = 5
+
+INVENTORY_CONTAINERS = (
+    "CommonContainerId",
+    "EssentialContainerId",
+    "WeaponLoadOutContainerId",
+    "PlayerEquipArmorContainerId",
+    "FoodEquipContainerId",
+)
+
+
+class SyntheticWorld(BaseModel):
+    level_sav: bytes
+    player_savs: Dict[UUID, bytes] = Field(default_factory=dict)
+    guild_id: UUID
+    pal_ids: List[UUID] = Field(default_factory=list)
+
+    def write(self, directory: str) -> str:
+        """Write Level.sav and Players/<uid>.sav, returns the Level.sav path"""
+        players_dir = os.path.join(directory, "Players")
+        os.makedirs(players_dir, exist_ok=True)
+        level_sav_path = os.path.join(directory, "Level.sav")
+        atomic_write(level_sav_path, self.level_sav)
+        for player_id, data in self.player_savs.items():
+            atomic_write(
+                os.path.join(players_dir, f"{player_id.hex.upper()}.sav"), data
+            )
+        return level_sav_path
+
+
+def generate_world(
+    players: int = 1, pals: int = 100, items: int = 20, seed: int = 0
+) -> SyntheticWorld:
+    """Build a Level.sav and player saves out of the PalObjects builders.
+
+    The pals are dealt round robin into the players' pal boxes and everyone
+    is in one guild. Each player holds items slots in their common
+    container, every WEAPON_EVERY-th a weapon with a dynamic item. Saves
+    are encoded with the editor's own custom properties, so they load
+    through SaveFile like real ones. The same seed gives the same world.
+    """
+    if players < 1:
+        raise ValueError("A world needs at least one player")
+    rng = random.Random(seed)
+    builder = _WorldBuilder(rng)
+    for index in range(players):
+        pal_count = pals // players + (index < pals % players)
+        builder.add_player(f"Player {index}", pal_count, items)
+
+    world = SyntheticWorld(
+        level_sav=_sav(
+            LEVEL_SAVE_GAME_CLASS, {"worldSaveData": builder.world_save_data()}
+        ),
+        guild_id=builder.guild_id,
+        pal_ids=builder.pal_ids,
+    )
+    for player_id, save_data in builder.player_save_data.items():
+        world.player_savs[player_id] = _sav(
+            PLAYER_SAVE_GAME_CLASS, {"SaveData": save_data}
+        )
+    logger.info(
+        "Generated a world with %s players, %s pals and %s dynamic items",
+        players,
+        len(builder.pal_ids),
+        len(builder.dynamic_items),
+    )
+    return world
+
+
+def write_world(directory: str, **kwargs: Any) -> str:
+    """generate_world straight to disk, returns the Level.sav path"""
+    return generate_world(**kwargs).write(directory)
+
+
+class _WorldBuilder:
+    def __init__(self, rng: random.Random):
+        self.rng = rng
+        self.guild_id = self._uuid()
+        self.pal_ids: List[UUID] = []
+        self.player_save_data: Dict[UUID, Dict[str, Any]] = {}
+        self.characters: List[Dict[str, Any]] = []
+        self.character_containers: List[Dict[str, Any]] = []
+        self.item_containers: List[Dict[str, Any]] = []
+        self.dynamic_items: List[Dict[str, Any]] = []
+        self.handles: List[Dict[str, Any]] = []
+        self.members: List[Dict[str, Any]] = []
+
+    def _uuid(self) -> UUID:
+        return uuid.UUID(int=self.rng.getrandbits(128), version=4)
+
+    def add_player(self, nickname: str, pal_count: int, item_count: int):
+        player_id, instance_id = self._uuid(), self._uuid()
+        pal_box_id, party_id = self._uuid(), self._uuid()
+        container_ids = {name: self._uuid() for name in INVENTORY_CONTAINERS}
+
+        self.characters.append(self._player_entry(player_id, instance_id, nickname))
+        self.handles.append(
+            PalObjects.individual_character_handle_ids(instance_id, player_id)
+        )
+        self.members.append(
+            {
+                "player_uid": player_id,
+                "player_info": {"last_online_real_time": 0, "player_name": nickname},
+            }
+        )
+
+        pal_slots = []
+        for slot_idx in range(pal_count):
+            pal_id = self._uuid()
+            self.characters.append(
+                self._pal_entry(pal_id, player_id, pal_box_id, slot_idx)
+            )
+            pal_slots.append(PalObjects.ContainerSlotData(slot_idx, pal_id))
+            self.handles.append(PalObjects.individual_character_handle_ids(pal_id))
+            self.pal_ids.append(pal_id)
+        self.character_containers.append(
+            _container(pal_box_id, pal_count + PAL_BOX_HEADROOM, pal_slots)
+        )
+        self.character_containers.append(_container(party_id, PARTY_SIZE, []))
+
+        common_id = container_ids["CommonContainerId"]
+        self.item_containers.append(
+            _container(
+                common_id,
+                max(item_count, MIN_COMMON_CONTAINER_SIZE),
+                [self._item_slot(slot_idx) for slot_idx in range(item_count)],
+                item_container=True,
+            )
+        )
+        for container_id in container_ids.values():
+            if container_id != common_id:
+                self.item_containers.append(
+                    _container(
+                        container_id, EQUIPMENT_CONTAINER_SIZE, [], item_container=True
+                    )
+                )
+
+        self.player_save_data[player_id] = _struct(
+            "PalWorldPlayerSaveData",
+            {
+                "PlayerUId": PalObjects.Guid(player_id),
+                "IndividualId": _struct(
+                    "PalInstanceID",
+                    {
+                        "PlayerUId": PalObjects.Guid(player_id),
+                        "InstanceId": PalObjects.Guid(instance_id),
+                    },
+                ),
+                "OtomoCharacterContainerId": PalObjects.PalContainerId(party_id),
+                "PalStorageContainerId": PalObjects.PalContainerId(pal_box_id),
+                "InventoryInfo": _struct(
+                    "PalPlayerDataInventoryInfo",
+                    {
+                        name: PalObjects.PalContainerId(container_id)
+                        for name, container_id in container_ids.items()
+                    },
+                ),
+            },
+        )
+
+    def _player_entry(
+        self, player_id: UUID, instance_id: UUID, nickname: str
+    ) -> Dict[str, Any]:
+        # A pal entry with the player's own save parameters swapped in
+        entry = PalObjects.PalSaveParameter(
+            code_name="Player",
+            instance_id=instance_id,
+            owner_uid=player_id,
+            container_id=PalObjects.EMPTY_UUID,
+            slot_idx=0,
+            group_id=self.guild_id,
+        )
+        entry["key"]["PlayerUId"] = PalObjects.Guid(player_id)
+        save_parameter = PalObjects.get_nested(
+            entry, "value", "RawData", "value", "object", "SaveParameter"
+        )
+        pal_parameter = save_parameter["value"]
+        save_parameter["value"] = {
+            "Level": PalObjects.ByteProperty(self.rng.randint(1, 50)),
+            "Exp": PalObjects.Int64Property(self.rng.randint(0, 1_000_000)),
+            "NickName": PalObjects.StrProperty(nickname),
+            "HP": pal_parameter["HP"],
+            "FullStomach": pal_parameter["FullStomach"],
+            "IsPlayer": PalObjects.BoolProperty(True),
+            "GotStatusPointList": pal_parameter["GotStatusPointList"],
+            "GotExStatusPointList": pal_parameter["GotExStatusPointList"],
+            "LastJumpedLocation": pal_parameter["LastJumpedLocation"],
+        }
+        return entry
+
+    def _pal_entry(
+        self, pal_id: UUID, owner_uid: UUID, container_id: UUID, slot_idx: int
+    ) -> Dict[str, Any]:
+        species = self.rng.choice(SPECIES)
+        entry = PalObjects.PalSaveParameter(
+            code_name=species,
+            instance_id=pal_id,
+            owner_uid=owner_uid,
+            container_id=container_id,
+            slot_idx=slot_idx,
+            group_id=self.guild_id,
+            nickname=f"{species} {slot_idx}",
+            active_skills=self.rng.sample(ACTIVE_SKILLS, self.rng.randint(0, 2)),
+            passive_skills=self.rng.sample(PASSIVE_SKILLS, self.rng.randint(0, 4)),
+        )
+        save_parameter = PalObjects.get_nested(
+            entry, "value", "RawData", "value", "object", "SaveParameter", "value"
+        )
+        PalObjects.set_byte_property(
+            save_parameter["Level"], value=self.rng.randint(1, 50)
+        )
+        return entry
+
+    def _item_slot(self, slot_idx: int) -> Dict[str, Any]:
+        if slot_idx % WEAPON_EVERY != WEAPON_EVERY - 1:
+            return PalObjects.ItemContainerSlot(
+                ItemContainerSlot(
+                    slot_index=slot_idx,
+                    count=self.rng.randint(1, 999),
+                    static_id=self.rng.choice(ITEMS),
+                )
+            )
+        slot = ItemContainerSlot(
+            slot_index=slot_idx,
+            count=1,
+            static_id=self.rng.choice(WEAPONS),
+            dynamic_item=DynamicItem(
+                local_id=self._uuid(),
+                type="weapon",
+                durability=round(self.rng.uniform(0, 1000), 1),
+                remaining_bullets=self.rng.randint(0, 30),
+            ),
+        )
+        dynamic_item = PalObjects.DynamicItem(slot)
+        # The DynamicItem builder only covers armor, weapons carry two more fields
+        raw_data = PalObjects.get_value(dynamic_item["RawData"])
+        raw_data["remaining_bullets"] = slot.dynamic_item.remaining_bullets
+        raw_data["passive_skill_list"] = []
+        self.dynamic_items.append(dynamic_item)
+        return PalObjects.ItemContainerSlot(slot)
+
+    def world_save_data(self) -> Dict[str, Any]:
+        guild = {
+            "group_type": GroupType.GUILD.prefixed(),
+            "group_id": self.guild_id,
+            "group_name": "Synthetic",
+            "individual_character_handle_ids": self.handles,
+            "org_type": 0,
+            "base_ids": [],
+            "base_camp_level": 1,
+            "map_object_instance_ids_base_camp_points": [],
+            "guild_name": "Synthetic",
+            "admin_player_uid": self.members[0]["player_uid"],
+            "players": self.members,
+        }
+        groups = _map("Guid", "PalGroupSaveData")
+        groups["custom_type"] = ".worldSaveData.GroupSaveDataMap"
+        groups["value"].append(
+            {
+                "key": self.guild_id,
+                "value": {
+                    "GroupType": PalObjects.EnumProperty(
+                        "EPalGroupType", GroupType.GUILD.prefixed()
+                    ),
+                    "RawData": PalObjects.ArrayProperty(ArrayType.BYTE_PROPERTY, guild),
+                },
+            }
+        )
+        characters = _map("PalInstanceID", "PalIndividualCharacterSaveParameterSaveData")
+        characters["value"] = self.characters
+        character_containers = _map("PalContainerId", "PalCharacterContainerSaveData")
+        character_containers["value"] = self.character_containers
+        item_containers = _map("PalContainerId", "PalItemContainerSaveData")
+        item_containers["value"] = self.item_containers
+        return _struct(
+            "PalWorldSaveData",
+            {
+                "CharacterSaveParameterMap": characters,
+                "ItemContainerSaveData": item_containers,
+                "DynamicItemSaveData": _struct_array(
+                    "DynamicItemSaveData", "PalDynamicItemSaveData", self.dynamic_items
+                ),
+                "CharacterContainerSaveData": character_containers,
+                "GroupSaveDataMap": groups,
+            },
+        )
+
+
+def _struct(struct_type: str, value: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "struct_type": struct_type,
+        "struct_id": PalObjects.EMPTY_UUID,
+        "id": None,
+        "value": value,
+        "type": "StructProperty",
+    }
+
+
+def _struct_array(
+    prop_name: str, type_name: str, values: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    return PalObjects.ArrayProperty(
+        ArrayType.STRUCT_PROPERTY,
+        {
+            "prop_name": prop_name,
+            "prop_type": "StructProperty",
+            "values": values,
+            "type_name": type_name,
+            "id": PalObjects.EMPTY_UUID,
+        },
+    )
+
+
+def _map(key_struct_type: str, value_struct_type: str) -> Dict[str, Any]:
+    return PalObjects.MapProperty(
+        "StructProperty", "StructProperty", key_struct_type, value_struct_type
+    )
+
+
+def _container(
+    container_id: UUID,
+    slot_num: int,
+    slots: List[Dict[str, Any]],
+    item_container: bool = False,
+) -> Dict[str, Any]:
+    type_name = (
+        "PalItemSlotSaveData" if item_container else "PalCharacterContainerSlotSaveData"
+    )
+    return {
+        "key": {"ID": PalObjects.Guid(container_id)},
+        "value": {
+            "Slots": _struct_array("Slots", type_name, slots),
+            "SlotNum": PalObjects.IntProperty(slot_num),
+        },
+    }
+
+
+def _sav(save_game_class_name: str, properties: Dict[str, Any]) -> bytes:
+    gvas_file = load_gvas(
+        {
+            "header": {**GVAS_HEADER, "save_game_class_name": save_game_class_name},
+            "properties": properties,
+            "trailer": b"\x00\x00\x00\x00",
+        }
+    )
+    return compress_gvas_to_sav(
+        gvas_file.write(CUSTOM_PROPERTIES), sav_save_type(save_game_class_name)
+    )
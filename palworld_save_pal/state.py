@@ -1,10 +1,11 @@
-from typing import Dict, Optional
+from typing import Any, Dict, Iterable, Optional
 from uuid import UUID
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 from palworld_save_pal.editor.settings import Settings
 from palworld_save_pal.game.player import Player
 from palworld_save_pal.game.save_file import SaveFile, SaveType
+from palworld_save_pal.utils.entity_store import EntityStore
 from palworld_save_pal.utils.logging_config import create_logger
 from palworld_save_pal.utils.json_manager import JsonManager
 
@@ -17,8 +18,11 @@ class AppState(BaseModel):
     save_type: SaveType = SaveType.STEAM
     players: Dict[UUID, Player] = Field(default_factory=dict)
     local: bool = False
+    lazy: bool = False
     settings: Settings = Field(default_factory=lambda: load_settings())
 
+    _player_store: EntityStore = PrivateAttr(default_factory=EntityStore)
+
     async def process_save_files(
         self,
         sav_id: str,
@@ -28,16 +32,40 @@ class AppState(BaseModel):
         ws_callback=None,
         local=False,
         save_type: SaveType = SaveType.STEAM,
+        player_sav_paths: Optional[Dict[UUID, str]] = None,
     ):
         logger.info("Processing save files for %s=>%s %s", sav_id, save_type, local)
         self.local = local
         self.save_type = save_type
-        await ws_callback(f"Loading level.sav and {len(player_savs)} players...")
+        self.lazy = player_sav_paths is not None
+        player_count = len(player_sav_paths) if self.lazy else len(player_savs)
+        await ws_callback(f"Loading level.sav and {player_count} players...")
         self.save_file = SaveFile(name=sav_id).load_sav_files(
-            level_sav, player_savs, level_meta
+            level_sav, player_savs, level_meta, player_sav_paths
         )
         await ws_callback("Files loaded, getting players...")
         self.players = self.save_file.get_players()
+        self._player_store.reset(self.players)
+
+    def touch_players(self, player_ids: Iterable[UUID]) -> int:
+        """Mark players as changed so they are included in the next delta"""
+        return self._player_store.touch(player_ids)
+
+    def remove_players(self, player_ids: Iterable[UUID]) -> int:
+        """Record players dropped from the save so deltas report them as removed"""
+        for player_id in player_ids:
+            self._player_store.remove(player_id)
+        return self._player_store.version
+
+    def player_changes(self, version: Optional[int]) -> Dict[str, Any]:
+        """Players changed since version, or a full snapshot if version is unknown"""
+        changes = self._player_store.changes_since(version)
+        return {
+            "version": changes.version,
+            "full": changes.full,
+            "players": changes.entities,
+            "removed": changes.removed,
+        }
 
     def update_settings(self, new_settings: Settings) -> None:
         """Update settings and save to file"""
@@ -0,0 +1,88 @@
+import os
+import shutil
+import tempfile
+from typing import Callable, IO
+
+from palworld_save_pal.utils.logging_config import create_logger
+
+logger = create_logger(__name__)
+
+# linux/fs.h: _IOW(0x94, 9, int)
+FICLONE = 0x40049409
+
+
+def atomic_write(path: str, data: bytes) -> None:
+    atomic_write_with(path, lambda f: f.write(data))
+
+
+def atomic_write_with(path: str, write: Callable[[IO[bytes]], object]) -> None:
+    """Write a file through a temporary sibling and rename it into place.
+
+    The temporary file lives in the target directory so os.replace is an
+    atomic rename; readers see either the old file or the complete new one,
+    never a partial write.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(
+        prefix=f".{os.path.basename(path)}-", suffix=".tmp", dir=directory
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        if os.path.exists(path):
+            shutil.copymode(path, temp_path)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    _fsync_directory(directory)
+
+
+def _fsync_directory(directory: str) -> None:
+    # Persist the rename itself; not supported on Windows
+    if os.name == "nt":
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def clone_file(source: str, destination: str) -> str:
+    """Copy a file as cheaply as the filesystem allows.
+
+    Tries a reflink (copy-on-write clone), then a hardlink, then falls back
+    to a full copy. Returns the method used. A hardlink is only a safe
+    backup because saves replace the original via atomic_write, leaving the
+    linked inode untouched.
+    """
+    if _reflink(source, destination):
+        return "reflink"
+    try:
+        os.link(source, destination)
+        return "hardlink"
+    except OSError as e:
+        logger.debug("Hardlink %s => %s failed: %s", source, destination, e)
+    shutil.copy2(source, destination)
+    return "copy"
+
+
+def _reflink(source: str, destination: str) -> bool:
+    try:
+        import fcntl
+    except ImportError:
+        return False
+    try:
+        with open(source, "rb") as src, open(destination, "wb") as dst:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+        shutil.copystat(source, destination)
+        return True
+    except OSError as e:
+        logger.debug("Reflink %s => %s failed: %s", source, destination, e)
+        if os.path.exists(destination):
+            os.remove(destination)
+        return False
@@ -0,0 +1,263 @@
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+import uuid
+import zlib
+from typing import Dict, Iterator, List, Optional
+
+import zstandard
+from pydantic import BaseModel, Field
+
+from palworld_save_tools.palsav import compress_gvas_to_sav, decompress_sav_to_gvas
+
+from palworld_save_pal.utils.atomic import atomic_write
+from palworld_save_pal.utils.logging_config import create_logger
+
+logger = create_logger(__name__)
+
+BACKUP_DIR = "backups/store"
+MIN_CHUNK_SIZE = 16 * 1024
+MAX_CHUNK_SIZE = 256 * 1024
+# Every GVAS property list ends with the FString "None", so chunk boundaries
+# are only ever placed right after one, on a property edge
+ANCHOR = b"\x05\x00\x00\x00None\x00"
+# An anchor is a boundary when the hash of the bytes ending at it matches the
+# mask, roughly one anchor in 128. The test only looks at local content, so
+# after an insertion the boundaries resynchronise at the next matching anchor.
+BOUNDARY_WINDOW = 512
+BOUNDARY_MASK = 0x7F
+COMPRESSION_LEVEL = 3
+HASH_SIZE = 20
+
+
+def _boundaries(data: bytes) -> Iterator[int]:
+    view = memoryview(data)
+    for match in re.finditer(re.escape(ANCHOR), data):
+        end = match.end()
+        window = view[max(end - BOUNDARY_WINDOW, 0) : end]
+        if zlib.crc32(window) & BOUNDARY_MASK == 0:
+            yield end
+
+
+def split_chunks(
+    data: bytes,
+    min_size: int = MIN_CHUNK_SIZE,
+    max_size: int = MAX_CHUNK_SIZE,
+) -> Iterator[memoryview]:
+    """Content-defined chunks between min_size and max_size.
+
+    Boundaries closer than min_size to the previous cut are skipped, and
+    stretches without a boundary are cut every max_size bytes.
+    """
+    view = memoryview(data)
+    length = len(data)
+    start = 0
+    for end in _boundaries(data):
+        while end - start > max_size:
+            yield view[start : start + max_size]
+            start += max_size
+        if end - start < min_size:
+            continue
+        yield view[start:end]
+        start = end
+    while length - start > max_size:
+        yield view[start : start + max_size]
+        start += max_size
+    if start < length:
+        yield view[start:]
+
+
+class BackupSnapshot(BaseModel):
+    id: str
+    name: str
+    source: str
+    created: float
+    save_type: int
+    size: int
+    stored_size: int = 0
+    chunks: List[str] = Field(default_factory=list)
+
+    def summary(self) -> Dict[str, object]:
+        return self.model_dump(exclude={"chunks"}) | {"chunk_count": len(self.chunks)}
+
+
+class BackupStore:
+    """Deduplicated backups of save files.
+
+    Each snapshot decompresses the SAV to its GVAS stream, splits it into
+    content-defined chunks and stores every chunk not already present once,
+    zstd compressed and named by its hash. A manifest per snapshot lists the
+    chunks needed to rebuild it, so successive backups of a world only cost
+    the chunks that changed.
+    """
+
+    def __init__(self, root: str = BACKUP_DIR):
+        self.root = root
+        self.chunk_dir = os.path.join(root, "chunks")
+        self.manifest_dir = os.path.join(root, "manifests")
+        self._lock = threading.Lock()
+
+    def snapshot(self, path: str) -> BackupSnapshot:
+        with open(path, "rb") as f:
+            raw_gvas, save_type = decompress_sav_to_gvas(f.read())
+        snapshot = BackupSnapshot(
+            id=f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}",
+            name=os.path.basename(path),
+            source=os.path.abspath(path),
+            created=time.time(),
+            save_type=save_type,
+            size=len(raw_gvas),
+        )
+
+        compressor = zstandard.ZstdCompressor(level=COMPRESSION_LEVEL)
+        with self._lock:
+            os.makedirs(self.manifest_dir, exist_ok=True)
+            for chunk in split_chunks(raw_gvas):
+                digest = hashlib.blake2b(chunk, digest_size=HASH_SIZE).hexdigest()
+                snapshot.chunks.append(digest)
+                chunk_path = self._chunk_path(digest)
+                if os.path.exists(chunk_path):
+                    continue
+                compressed = compressor.compress(chunk)
+                self._write_chunk(chunk_path, compressed)
+                snapshot.stored_size += len(compressed)
+            # One flush for all new chunks instead of an fsync per chunk, the
+            # manifest that references them is only written afterwards
+            if hasattr(os, "sync"):
+                os.sync()
+            atomic_write(
+                self._manifest_path(snapshot.id),
+                snapshot.model_dump_json().encode("utf-8"),
+            )
+
+        logger.info(
+            "Backed up %s as %s: %s chunks, %s new bytes for %s bytes of GVAS",
+            path,
+            snapshot.id,
+            len(snapshot.chunks),
+            snapshot.stored_size,
+            snapshot.size,
+        )
+        return snapshot
+
+    def list(self, source: Optional[str] = None) -> List[BackupSnapshot]:
+        """Snapshots newest first, optionally only those taken of source"""
+        if not os.path.isdir(self.manifest_dir):
+            return []
+        source = os.path.abspath(source) if source is not None else None
+        snapshots = []
+        for entry in os.listdir(self.manifest_dir):
+            if not entry.endswith(".json"):
+                continue
+            with open(os.path.join(self.manifest_dir, entry), "r", encoding="utf-8") as f:
+                snapshot = BackupSnapshot(**json.load(f))
+            if source is None or snapshot.source == source:
+                snapshots.append(snapshot)
+        return sorted(snapshots, key=lambda s: s.created, reverse=True)
+
+    def get(self, snapshot_id: str) -> BackupSnapshot:
+        path = self._manifest_path(snapshot_id)
+        if not os.path.exists(path):
+            raise ValueError(f"Backup {snapshot_id} not found")
+        with open(path, "r", encoding="utf-8") as f:
+            return BackupSnapshot(**json.load(f))
+
+    def read_gvas(self, snapshot: BackupSnapshot) -> bytes:
+        decompressor = zstandard.ZstdDecompressor()
+        parts = []
+        for digest in snapshot.chunks:
+            with open(self._chunk_path(digest), "rb") as f:
+                parts.append(decompressor.decompress(f.read()))
+        raw_gvas = b"".join(parts)
+        if len(raw_gvas) != snapshot.size:
+            raise ValueError(
+                f"Backup {snapshot.id} is corrupt: expected {snapshot.size} bytes, got {len(raw_gvas)}"
+            )
+        return raw_gvas
+
+    def restore(self, snapshot_id: str, target: Optional[str] = None) -> str:
+        snapshot = self.get(snapshot_id)
+        target = target or snapshot.source
+        sav = compress_gvas_to_sav(self.read_gvas(snapshot), snapshot.save_type)
+        atomic_write(target, sav)
+        logger.info("Restored backup %s to %s", snapshot_id, target)
+        return target
+
+    def prune(self, keep: int, source: Optional[str] = None) -> Dict[str, int]:
+        """Keep the newest snapshots per source file and drop unreferenced chunks
+
+        Snapshots are grouped by the absolute path they were taken from, every
+        world's save is named Level.sav so the file name alone can't tell them
+        apart.
+        """
+        with self._lock:
+            snapshots = self.list(source)
+            kept: Dict[str, int] = {}
+            removed = 0
+            for snapshot in snapshots:
+                kept[snapshot.source] = kept.get(snapshot.source, 0) + 1
+                if kept[snapshot.source] > keep:
+                    os.remove(self._manifest_path(snapshot.id))
+                    removed += 1
+
+            referenced = {digest for s in self.list() for digest in s.chunks}
+            freed_chunks = 0
+            freed_bytes = 0
+            for digest, path in self._stored_chunks():
+                if digest not in referenced:
+                    freed_bytes += os.path.getsize(path)
+                    os.remove(path)
+                    freed_chunks += 1
+
+        logger.info(
+            "Pruned %s backups, %s chunks (%s bytes)", removed, freed_chunks, freed_bytes
+        )
+        return {
+            "snapshots": removed,
+            "chunks": freed_chunks,
+            "bytes": freed_bytes,
+        }
+
+    def stats(self) -> Dict[str, int]:
+        snapshots = self.list()
+        stored = sum(os.path.getsize(path) for _, path in self._stored_chunks())
+        return {
+            "snapshots": len(snapshots),
+            "logical_bytes": sum(s.size for s in snapshots),
+            "stored_bytes": stored,
+        }
+
+    def _stored_chunks(self) -> Iterator[tuple]:
+        if not os.path.isdir(self.chunk_dir):
+            return
+        for prefix in os.listdir(self.chunk_dir):
+            directory = os.path.join(self.chunk_dir, prefix)
+            for entry in os.listdir(directory):
+                if entry.endswith(".zst"):
+                    yield entry[:-4], os.path.join(directory, entry)
+
+    @staticmethod
+    def _write_chunk(path: str, data: bytes) -> None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{uuid.uuid4().hex[:8]}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+
+    def _chunk_path(self, digest: str) -> str:
+        return os.path.join(self.chunk_dir, digest[:2], f"{digest}.zst")
+
+    def _manifest_path(self, snapshot_id: str) -> str:
+        if os.sep in snapshot_id or "/" in snapshot_id or snapshot_id.startswith("."):
+            raise ValueError(f"Invalid backup id {snapshot_id}")
+        return os.path.join(self.manifest_dir, f"{snapshot_id}.json")
+
+
+backup_store = BackupStore()
+
+
+def get_backup_store() -> BackupStore:
+    return backup_store
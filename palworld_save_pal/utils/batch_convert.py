@@ -0,0 +1,221 @@
+import glob
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+from palworld_save_pal.game.json_import import json_file_to_sav
+from palworld_save_pal.game.save_file import SaveFile
+from palworld_save_pal.utils.atomic import atomic_write
+from palworld_save_pal.utils.logging_config import create_logger
+
+logger = create_logger(__name__)
+
+SUMMARY_FILE = "convert_summary.json"
+
+
+class FileResult(BaseModel):
+    source: str
+    output: str
+    ok: bool = True
+    # Source size and mtime at conversion, a changed source is converted again
+    size: int = 0
+    mtime: float = 0.0
+    seconds: float = 0.0
+    error: Optional[str] = None
+
+
+class BatchSummary(BaseModel):
+    to_json: bool = True
+    converted: int = 0
+    skipped: int = 0
+    failed: int = 0
+    seconds: float = 0.0
+    files: Dict[str, FileResult] = Field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: str) -> "BatchSummary":
+        if not os.path.exists(path):
+            return cls()
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return cls(**json.load(f))
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable summary %s: %s", path, e)
+            return cls()
+
+    def save(self, path: str) -> None:
+        atomic_write(path, self.model_dump_json(indent=2).encode("utf-8"))
+
+
+def _world_files(world: str, to_json: bool) -> List[str]:
+    suffix = ".sav" if to_json else ".sav.json"
+    files = [
+        os.path.join(world, name)
+        for name in ("Level" + suffix, "LevelMeta" + suffix)
+        if os.path.isfile(os.path.join(world, name))
+    ]
+    players_dir = os.path.join(world, "Players")
+    if os.path.isdir(players_dir):
+        files.extend(
+            os.path.join(players_dir, name)
+            for name in sorted(os.listdir(players_dir))
+            if name.endswith(suffix)
+        )
+    return files
+
+
+def find_save_files(source: str, to_json: bool = True) -> List[str]:
+    """Save files of every world in a directory tree or glob.
+
+    Worlds are directories holding a Level.sav (Level.sav.json when converting
+    back), their LevelMeta and Players/*.sav are included. A glob may also
+    match save files directly.
+    """
+    marker = "Level.sav" if to_json else "Level.sav.json"
+    suffix = ".sav" if to_json else ".sav.json"
+    matches = glob.glob(source, recursive=True) if glob.has_magic(source) else [source]
+    files = []
+    for match in matches:
+        if os.path.isfile(match):
+            if match.endswith(suffix):
+                files.append(match)
+            continue
+        for directory, dirnames, filenames in os.walk(match):
+            if marker in filenames:
+                files.extend(_world_files(directory, to_json))
+                dirnames.clear()
+    # Globs can match a world and its files both
+    return sorted(set(os.path.abspath(f) for f in files))
+
+
+def source_root(source: str) -> str:
+    """Directory a batch source is relative to, the part of a glob before any magic"""
+    if not glob.has_magic(source):
+        if not os.path.isdir(source):
+            source = os.path.dirname(source)
+        return os.path.abspath(source)
+    parts = []
+    for part in source.replace("\\", "/").split("/"):
+        if glob.has_magic(part):
+            break
+        parts.append(part)
+    return os.path.abspath("/".join(parts) or ".")
+
+
+def output_path_for(
+    source: str, root: Optional[str] = None, output_dir: Optional[str] = None
+) -> str:
+    """Converted file name, mirrored under output_dir relative to root if set"""
+    if source.endswith(".sav.json"):
+        name = source[: -len(".json")]
+    else:
+        name = source + ".json"
+    if output_dir and root:
+        return os.path.join(output_dir, os.path.relpath(name, root))
+    return name
+
+
+def convert_file(
+    source: str,
+    output: str,
+    to_json: bool = True,
+    minify: bool = False,
+    allow_nan: bool = True,
+) -> FileResult:
+    """Convert one save, never raises so it is safe to run in a worker process"""
+    start = time.perf_counter()
+    stat = os.stat(source)
+    result = FileResult(
+        source=source, output=output, size=stat.st_size, mtime=stat.st_mtime
+    )
+    try:
+        os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+        if to_json:
+            with open(source, "rb") as f:
+                data = f.read()
+            save_file = SaveFile(name=source).load_level_sav(data)
+            del data
+            save_file.to_json_file(output, minify=minify, allow_nan=allow_nan)
+        else:
+            json_file_to_sav(source, output)
+    except Exception as e:
+        logger.exception("Failed to convert %s", source)
+        result.ok = False
+        result.error = str(e)
+    result.seconds = round(time.perf_counter() - start, 3)
+    return result
+
+
+def _is_done(previous: Optional[FileResult], source: str) -> bool:
+    if previous is None or not previous.ok or not os.path.exists(previous.output):
+        return False
+    stat = os.stat(source)
+    return previous.size == stat.st_size and previous.mtime == stat.st_mtime
+
+
+def convert_files(
+    files: List[str],
+    summary_path: str,
+    root: Optional[str] = None,
+    output_dir: Optional[str] = None,
+    to_json: bool = True,
+    jobs: Optional[int] = None,
+    minify: bool = False,
+    allow_nan: bool = True,
+    force: bool = False,
+) -> BatchSummary:
+    """Convert many saves across a process pool.
+
+    Results are recorded in summary_path as each file finishes. A re-run
+    with the same summary skips files whose last conversion succeeded and
+    whose source is unchanged, unless force is set.
+    """
+    start = time.perf_counter()
+    summary = BatchSummary.load(summary_path)
+    if summary.to_json != to_json:
+        summary = BatchSummary()
+    summary.to_json = to_json
+    summary.converted = summary.skipped = summary.failed = 0
+
+    pending: List[Tuple[str, str]] = []
+    for source in files:
+        if not force and _is_done(summary.files.get(source), source):
+            summary.skipped += 1
+            continue
+        pending.append((source, output_path_for(source, root, output_dir)))
+    # Level.sav dwarfs player saves, start the largest files first
+    pending.sort(key=lambda item: os.path.getsize(item[0]), reverse=True)
+    logger.info(
+        "Converting %s files, %s already converted", len(pending), summary.skipped
+    )
+
+    def record(result: FileResult) -> None:
+        summary.files[result.source] = result
+        if result.ok:
+            summary.converted += 1
+            logger.info("Converted %s in %ss", result.source, result.seconds)
+        else:
+            summary.failed += 1
+            logger.error("Failed %s: %s", result.source, result.error)
+        summary.save(summary_path)
+
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(pending) or 1))
+    if jobs == 1:
+        for source, output in pending:
+            record(convert_file(source, output, to_json, minify, allow_nan))
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = [
+                executor.submit(convert_file, source, output, to_json, minify, allow_nan)
+                for source, output in pending
+            ]
+            for future in as_completed(futures):
+                record(future.result())
+
+    summary.seconds = round(time.perf_counter() - start, 3)
+    summary.save(summary_path)
+    return summary
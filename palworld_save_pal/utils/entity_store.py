@@ -0,0 +1,80 @@
+from typing import Any, Dict, Hashable, Iterable, List, Optional
+from pydantic import BaseModel, Field
+
+from palworld_save_pal.utils.logging_config import create_logger
+
+logger = create_logger(__name__)
+
+
+class EntityChanges(BaseModel):
+    version: int
+    full: bool
+    entities: Dict[Any, Any] = Field(default_factory=dict)
+    removed: List[Any] = Field(default_factory=list)
+
+
+class EntityStore:
+    """Versioned view over a dict of entities.
+
+    Every mutation bumps the store version and stamps the affected keys so the
+    entities changed since any earlier version can be computed without diffing.
+    """
+
+    def __init__(self):
+        self.version = 0
+        self.base_version = 0
+        self._entities: Dict[Hashable, Any] = {}
+        self._versions: Dict[Hashable, int] = {}
+        self._removed: Dict[Hashable, int] = {}
+
+    def reset(self, entities: Dict[Hashable, Any]) -> int:
+        self.version += 1
+        self.base_version = self.version
+        self._entities = entities
+        self._versions = {key: self.version for key in entities}
+        self._removed = {}
+        logger.debug("Reset store with %s entities at v%s", len(entities), self.version)
+        return self.version
+
+    def touch(self, keys: Iterable[Hashable]) -> int:
+        keys = [key for key in keys if key in self._entities]
+        if not keys:
+            return self.version
+        self.version += 1
+        for key in keys:
+            self._versions[key] = self.version
+            self._removed.pop(key, None)
+        return self.version
+
+    def put(self, key: Hashable, entity: Any) -> int:
+        self._entities[key] = entity
+        return self.touch([key])
+
+    def remove(self, key: Hashable) -> int:
+        # The entities dict may be shared with its owner, which can have
+        # dropped the key already
+        if key not in self._versions:
+            return self.version
+        self.version += 1
+        self._entities.pop(key, None)
+        self._versions.pop(key, None)
+        self._removed[key] = self.version
+        return self.version
+
+    def snapshot(self) -> EntityChanges:
+        return EntityChanges(
+            version=self.version, full=True, entities=dict(self._entities)
+        )
+
+    def changes_since(self, version: Optional[int]) -> EntityChanges:
+        if version is None or version < self.base_version or version > self.version:
+            return self.snapshot()
+        entities = {
+            key: self._entities[key]
+            for key, changed in self._versions.items()
+            if changed > version
+        }
+        removed = [key for key, changed in self._removed.items() if changed > version]
+        return EntityChanges(
+            version=self.version, full=False, entities=entities, removed=removed
+        )
@@ -98,3 +98,11 @@ class FileManager:
                 player_saves[player_uuid] = f.read()
 
         return player_saves
+
+    @staticmethod
+    def get_player_save_paths(players_dir: str) -> Dict[uuid.UUID, str]:
+        """Player save paths by player id, without reading the files"""
+        return {
+            uuid.UUID(save_file.stem): str(save_file)
+            for save_file in Path(players_dir).glob("*.sav")
+        }
@@ -0,0 +1,134 @@
+import copyreg
+import gc
+import io
+import pickle
+import struct
+import uuid
+from contextlib import contextmanager
+from typing import IO, Any, Dict
+
+import zstandard
+from palworld_save_tools.archive import UUID as ArchiveUUID
+from palworld_save_tools.gvas import GvasFile, GvasHeader
+
+from palworld_save_pal.utils.atomic import atomic_write_with
+from palworld_save_pal.utils.logging_config import create_logger
+
+logger = create_logger(__name__)
+
+MAGIC = b"PSPBIN"
+VERSION = 1
+FLAG_ZSTD = 0x01
+COMPRESSION_LEVEL = 3
+
+_HEADER = struct.Struct("<6sBB")
+
+# Everything else in a GVAS tree is a builtin pickle writes natively
+_ALLOWED_CLASSES = {
+    ("palworld_save_tools.archive", "UUID"): ArchiveUUID,
+    ("uuid", "UUID"): uuid.UUID,
+}
+
+
+def _reduce_archive_uuid(value: ArchiveUUID):
+    return ArchiveUUID, (value.raw_bytes,)
+
+
+def _reduce_uuid(value: uuid.UUID):
+    return uuid.UUID, (None, value.bytes)
+
+
+class _Pickler(pickle.Pickler):
+    dispatch_table = copyreg.dispatch_table.copy()
+    dispatch_table[ArchiveUUID] = _reduce_archive_uuid
+    dispatch_table[uuid.UUID] = _reduce_uuid
+
+
+class _Unpickler(pickle.Unpickler):
+    def find_class(self, module: str, name: str):
+        cls = _ALLOWED_CLASSES.get((module, name))
+        if cls is None:
+            raise pickle.UnpicklingError(f"{module}.{name} is not allowed in a GVAS bin")
+        return cls
+
+
+def dump_bin(obj: Any, f: IO[bytes], compress: bool = True) -> None:
+    """Write a GVAS tree in the binary export format.
+
+    A short header (magic, version, flags) followed by the tree as pickle
+    protocol 5, zstd compressed unless compress is off. Types survive the
+    round trip as they are: save UUIDs, uuid.UUID, bytes, NaN and infinite
+    floats. The memo stays on: property names and type strings repeat all
+    over a save, and writing them once keeps both the file and load small.
+    """
+    f.write(_HEADER.pack(MAGIC, VERSION, FLAG_ZSTD if compress else 0))
+    if compress:
+        compressor = zstandard.ZstdCompressor(level=COMPRESSION_LEVEL)
+        with compressor.stream_writer(f, closefd=False) as writer:
+            _dump(obj, writer)
+    else:
+        _dump(obj, f)
+
+
+def _dump(obj: Any, f: IO[bytes]) -> None:
+    _Pickler(f, protocol=5).dump(obj)
+
+
+@contextmanager
+def _gc_paused():
+    # A save is a million small dicts with no cycles; letting the collector
+    # walk them as they are built triples the time taken to load one
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def load_bin(f: IO[bytes]) -> Any:
+    """Read a tree written by dump_bin, only UUID classes are ever constructed"""
+    header = f.read(_HEADER.size)
+    if len(header) != _HEADER.size:
+        raise ValueError("Not a GVAS bin file: too short")
+    magic, version, flags = _HEADER.unpack(header)
+    if magic != MAGIC:
+        raise ValueError("Not a GVAS bin file")
+    if version != VERSION:
+        raise ValueError(f"Unsupported GVAS bin version {version}")
+    try:
+        with _gc_paused():
+            if flags & FLAG_ZSTD:
+                decompressor = zstandard.ZstdDecompressor()
+                with decompressor.stream_reader(f, closefd=False) as reader:
+                    return _Unpickler(io.BufferedReader(reader)).load()
+            return _Unpickler(f).load()
+    except (pickle.UnpicklingError, EOFError, zstandard.ZstdError) as e:
+        raise ValueError(f"Corrupt GVAS bin file: {e}")
+
+
+def dump_gvas(gvas_file: GvasFile) -> Dict[str, Any]:
+    """Like GvasFile.dump but keeps the trailer as bytes"""
+    return {
+        "header": gvas_file.header.dump(),
+        "properties": gvas_file.properties,
+        "trailer": gvas_file.trailer,
+    }
+
+
+def load_gvas(data: Dict[str, Any]) -> GvasFile:
+    gvas_file = GvasFile()
+    gvas_file.header = GvasHeader.load(data["header"])
+    gvas_file.properties = data["properties"]
+    gvas_file.trailer = data["trailer"]
+    return gvas_file
+
+
+def write_bin_file(path: str, gvas_file: GvasFile, compress: bool = True) -> None:
+    atomic_write_with(path, lambda f: dump_bin(dump_gvas(gvas_file), f, compress))
+
+
+def read_bin_file(path: str) -> GvasFile:
+    with open(path, "rb") as f:
+        return load_gvas(load_bin(f))
@@ -0,0 +1,341 @@
+import base64
+import json
+import math
+import re
+import uuid
+from typing import IO, Any, Iterator, List, Optional, Union
+
+from palworld_save_tools.archive import UUID as ArchiveUUID
+
+CHUNK_SIZE = 1 << 16
+# Containers with up to this many nodes are encoded in one encoder call
+BATCH_NODES = 2048
+# Text the reader holds before it stops trying to decode a value in one call
+READ_BUFFER = 1 << 22
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_NUMBER = re.compile(r"[-+0-9.eE]*")
+
+
+def json_default(obj: Any) -> Any:
+    """Plain JSON value for the non-JSON types found in GVAS trees"""
+    if isinstance(obj, (uuid.UUID, ArchiveUUID)):
+        return str(obj)
+    if isinstance(obj, (bytes, bytearray, memoryview)):
+        return base64.b64encode(obj).decode("ascii")
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class JsonStreamer:
+    """Encodes an object tree to JSON as a stream of text chunks.
+
+    Large containers are walked one member at a time and small ones are
+    handed to the json module whole, so only the current path through the
+    tree and one output chunk are held in memory. Handles the types found
+    in GVAS trees like CustomEncoder does (UUIDs), plus bytes as base64.
+    NaN and infinities are written as in json.dump when allow_nan is set,
+    and as null otherwise instead of failing.
+    """
+
+    def __init__(
+        self,
+        indent: Optional[Union[int, str]] = None,
+        allow_nan: bool = True,
+        chunk_size: int = CHUNK_SIZE,
+        batch_nodes: int = BATCH_NODES,
+    ):
+        if isinstance(indent, int):
+            indent = " " * indent
+        self.indent = indent
+        self.allow_nan = allow_nan
+        self.chunk_size = chunk_size
+        self.batch_nodes = batch_nodes
+        self._item_separator = ","
+        self._key_separator = ": " if indent is not None else ":"
+        # Without indentation this runs on the C encoder
+        self._encoder = json.JSONEncoder(
+            default=json_default,
+            allow_nan=allow_nan,
+            indent=indent,
+            separators=(self._item_separator, self._key_separator),
+        )
+
+    def iter_chunks(self, obj: Any) -> Iterator[str]:
+        buffer: List[str] = []
+        size = 0
+        for piece in self._iter(obj, 0):
+            buffer.append(piece)
+            size += len(piece)
+            if size >= self.chunk_size:
+                yield "".join(buffer)
+                buffer = []
+                size = 0
+        if buffer:
+            yield "".join(buffer)
+
+    def write(self, obj: Any, f: IO[str]) -> int:
+        written = 0
+        for chunk in self.iter_chunks(obj):
+            f.write(chunk)
+            written += len(chunk)
+        return written
+
+    def _iter(self, obj: Any, level: int) -> Iterator[str]:
+        if isinstance(obj, (dict, list, tuple)):
+            if self._is_small(obj):
+                try:
+                    yield self._encode(obj, level)
+                    return
+                except (ValueError, TypeError):
+                    # NaN in strict mode or keys json can't encode, walk it
+                    pass
+            if isinstance(obj, dict):
+                yield from self._iter_dict(obj, level)
+            else:
+                yield from self._iter_list(obj, level)
+            return
+
+        if isinstance(obj, (str, int, float, bool)) or obj is None:
+            yield self._scalar(obj)
+            return
+        yield from self._iter(json_default(obj), level)
+
+    def _iter_dict(self, obj: dict, level: int) -> Iterator[str]:
+        if not obj:
+            yield "{}"
+            return
+        open_, separator, close = self._delimiters("{", "}", level)
+        yield open_
+        first = True
+        for key, value in obj.items():
+            if not first:
+                yield separator
+            first = False
+            yield self._key(key)
+            yield self._key_separator
+            yield from self._iter(value, level + 1)
+        yield close
+
+    def _iter_list(self, obj: Union[list, tuple], level: int) -> Iterator[str]:
+        if not obj:
+            yield "[]"
+            return
+        open_, separator, close = self._delimiters("[", "]", level)
+        yield open_
+        first = True
+        for value in obj:
+            if not first:
+                yield separator
+            first = False
+            yield from self._iter(value, level + 1)
+        yield close
+
+    def _delimiters(self, open_: str, close: str, level: int):
+        if self.indent is None:
+            return open_, self._item_separator, close
+        inner = "\n" + self.indent * (level + 1)
+        return (
+            open_ + inner,
+            self._item_separator + inner,
+            "\n" + self.indent * level + close,
+        )
+
+    def _encode(self, obj: Any, level: int) -> str:
+        text = self._encoder.encode(obj)
+        if self.indent is not None and level:
+            # Strings never hold a raw newline, every one is indentation
+            text = text.replace("\n", "\n" + self.indent * level)
+        return text
+
+    def _is_small(self, obj: Any) -> bool:
+        budget = self.batch_nodes
+        stack = [obj]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, dict):
+                budget -= len(node)
+                stack.extend(node.values())
+            elif isinstance(node, (list, tuple)):
+                budget -= len(node)
+                stack.extend(node)
+            if budget < 0:
+                return False
+        return True
+
+    def _key(self, key: Any) -> str:
+        if isinstance(key, str):
+            return json.encoder.encode_basestring_ascii(key)
+        if isinstance(key, bool) or key is None:
+            return f'"{json.dumps(key)}"'
+        if isinstance(key, (int, float)):
+            return f'"{self._scalar(key)}"'
+        return json.encoder.encode_basestring_ascii(str(json_default(key)))
+
+    def _scalar(self, obj: Any) -> str:
+        if isinstance(obj, str):
+            return json.encoder.encode_basestring_ascii(obj)
+        if obj is None:
+            return "null"
+        if obj is True:
+            return "true"
+        if obj is False:
+            return "false"
+        if isinstance(obj, float) and not math.isfinite(obj):
+            if not self.allow_nan:
+                return "null"
+            if obj != obj:
+                return "NaN"
+            return "Infinity" if obj > 0 else "-Infinity"
+        if isinstance(obj, int):
+            return int.__repr__(obj)
+        return float.__repr__(obj)
+
+
+def iter_json(
+    obj: Any, indent: Optional[Union[int, str]] = None, allow_nan: bool = True
+) -> Iterator[str]:
+    return JsonStreamer(indent=indent, allow_nan=allow_nan).iter_chunks(obj)
+
+
+def write_json(
+    obj: Any,
+    f: IO[str],
+    indent: Optional[Union[int, str]] = None,
+    allow_nan: bool = True,
+) -> int:
+    """Stream obj to a text file, returns the number of characters written"""
+    return JsonStreamer(indent=indent, allow_nan=allow_nan).write(obj, f)
+
+
+class JsonPullReader:
+    """Incremental JSON parser over a text file.
+
+    The caller walks the document with iter_object and iter_array and
+    calls read_value for the parts it wants as Python objects. A value that
+    fits in the read buffer is decoded by the json module in one call,
+    larger ones are assembled member by member, so the file is never held
+    in memory as a whole, only the buffer and the values asked for.
+    Parses NaN and Infinity like json.load.
+    """
+
+    def __init__(self, f: IO[str], buffer_size: int = READ_BUFFER):
+        self.f = f
+        self.buffer_size = buffer_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._position = 0
+        self._eof = False
+
+    def peek(self) -> str:
+        """Next non-whitespace character, empty at the end of the file"""
+        while True:
+            self._position = _WHITESPACE.match(self._buffer, self._position).end()
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+            if not self._fill():
+                return ""
+
+    def iter_object(self) -> Iterator[str]:
+        """Keys of the object at the current position.
+
+        After each key the reader is positioned at its value, which must be
+        consumed with read_value, iter_object or iter_array before resuming.
+        """
+        self._expect("{")
+        if self.peek() == "}":
+            self._position += 1
+            return
+        while True:
+            if self.peek() != '"':
+                self._error("Expecting property name enclosed in double quotes")
+            key = self._decode()
+            self._expect(":")
+            yield key
+            if self._separator("}"):
+                return
+
+    def iter_array(self) -> Iterator[None]:
+        """Yields once per element, positioned at the element"""
+        self._expect("[")
+        if self.peek() == "]":
+            self._position += 1
+            return
+        while True:
+            yield
+            if self._separator("]"):
+                return
+
+    def read_value(self) -> Any:
+        char = self.peek()
+        if char not in ("{", "["):
+            return self._decode()
+        self._ensure(self.buffer_size)
+        try:
+            value, end = self._decoder.raw_decode(self._buffer, self._position)
+            self._position = end
+            return value
+        except json.JSONDecodeError:
+            if self._eof:
+                raise
+        # Longer than the buffer, build it from its members
+        if char == "{":
+            return {key: self.read_value() for key in self.iter_object()}
+        return [self.read_value() for _ in self.iter_array()]
+
+    def _decode(self) -> Any:
+        # Scalars are decoded whole however long they are
+        while True:
+            if self._buffer[self._position] in "-0123456789":
+                # A number may continue past the end of the buffer
+                while (
+                    _NUMBER.match(self._buffer, self._position).end()
+                    == len(self._buffer)
+                    and self._fill()
+                ):
+                    pass
+            try:
+                value, self._position = self._decoder.raw_decode(
+                    self._buffer, self._position
+                )
+                return value
+            except json.JSONDecodeError as e:
+                truncated = e.msg.startswith("Unterminated string") or (
+                    len(self._buffer) - e.pos < 16
+                )
+                if not truncated or not self._fill():
+                    raise
+
+    def _separator(self, close: str) -> bool:
+        char = self.peek()
+        self._position += 1
+        if char == close:
+            return True
+        if char != ",":
+            self._position -= 1
+            self._error(f"Expecting ',' delimiter or {close!r}")
+        return False
+
+    def _expect(self, char: str) -> None:
+        if self.peek() != char:
+            self._error(f"Expecting {char!r}")
+        self._position += 1
+
+    def _ensure(self, size: int) -> None:
+        while len(self._buffer) - self._position < size and self._fill():
+            pass
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        chunk = self.f.read(self.buffer_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._position :] + chunk
+        self._position = 0
+        return True
+
+    def _error(self, message: str) -> None:
+        raise json.JSONDecodeError(message, self._buffer, self._position)
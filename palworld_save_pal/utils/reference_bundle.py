@@ -0,0 +1,207 @@
+import gzip
+import hashlib
+import json
+import os
+import threading
+from typing import Dict, List, Optional
+
+import zstandard
+from pydantic import BaseModel
+
+from palworld_save_pal.utils.logging_config import create_logger
+from palworld_save_pal.utils.reference_data import (
+    DATA_DIR,
+    ReferenceData,
+    get_languages,
+    get_reference_data,
+)
+from palworld_save_pal.utils.serialization import dumps
+
+logger = create_logger(__name__)
+
+BUNDLE_DIR = "data/bundles"
+MANIFEST_FILE = "manifest.json"
+BUNDLE_DATASETS = [
+    "pals",
+    "items",
+    "active_skills",
+    "passive_skills",
+    "elements",
+    "work_suitability",
+    "buildings",
+    "ui",
+    "exp",
+]
+GZIP_LEVEL = 9
+ZSTD_LEVEL = 19
+# Preferred first when a client accepts several encodings
+ENCODINGS = ["zstd", "gzip"]
+VERSION_LENGTH = 16
+
+
+class ReferenceBundle(BaseModel):
+    language: str
+    version: str
+    content: bytes
+    variants: Dict[str, bytes] = {}
+
+    @property
+    def filename(self) -> str:
+        return f"{self.language}.{self.version}.json"
+
+    def info(self) -> Dict[str, object]:
+        return {
+            "version": self.version,
+            "file": self.filename,
+            "size": len(self.content),
+            "encodings": {name: len(data) for name, data in self.variants.items()},
+        }
+
+
+def _compress(content: bytes) -> Dict[str, bytes]:
+    return {
+        "zstd": zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(content),
+        "gzip": gzip.compress(content, compresslevel=GZIP_LEVEL, mtime=0),
+    }
+
+
+def build_bundle(reference: ReferenceData, language: str) -> ReferenceBundle:
+    """Merge every bundled dataset for a language into one compact document.
+
+    The version is a hash of the encoded content, so it only changes when the
+    data does and can be used in URLs that are cached forever.
+    """
+    datasets = {
+        dataset: reference.get(dataset, "" if dataset == "exp" else language)
+        for dataset in BUNDLE_DATASETS
+    }
+    content = dumps(datasets)
+    version = hashlib.sha256(content).hexdigest()[:VERSION_LENGTH]
+    return ReferenceBundle(
+        language=language,
+        version=version,
+        content=content,
+        variants=_compress(content),
+    )
+
+
+def write_bundles(
+    output_dir: str = BUNDLE_DIR,
+    languages: Optional[List[str]] = None,
+    data_dir: str = DATA_DIR,
+) -> Dict[str, Dict[str, object]]:
+    """Build bundles for the given languages (all by default) into output_dir"""
+    reference = ReferenceData(data_dir)
+    languages = languages or get_languages(data_dir)
+    os.makedirs(output_dir, exist_ok=True)
+
+    manifest = _read_manifest(output_dir)
+    for language in languages:
+        bundle = build_bundle(reference, language)
+        path = os.path.join(output_dir, bundle.filename)
+        with open(path, "wb") as f:
+            f.write(bundle.content)
+        for encoding, data in bundle.variants.items():
+            with open(f"{path}.{_extension(encoding)}", "wb") as f:
+                f.write(data)
+        manifest[language] = bundle.info()
+        logger.info(
+            "Built %s bundle %s (%s bytes, %s)",
+            language,
+            bundle.version,
+            len(bundle.content),
+            ", ".join(f"{k} {len(v)} bytes" for k, v in bundle.variants.items()),
+        )
+
+    _remove_stale(output_dir, manifest)
+    with open(os.path.join(output_dir, MANIFEST_FILE), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def _read_manifest(bundle_dir: str) -> Dict[str, Dict[str, object]]:
+    path = os.path.join(bundle_dir, MANIFEST_FILE)
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _extension(encoding: str) -> str:
+    return "gz" if encoding == "gzip" else "zst"
+
+
+def _remove_stale(output_dir: str, manifest: Dict[str, Dict[str, object]]) -> None:
+    current = set()
+    for info in manifest.values():
+        current.add(info["file"])
+        current.update(f"{info['file']}.{_extension(e)}" for e in ENCODINGS)
+    for name in os.listdir(output_dir):
+        if name == MANIFEST_FILE or name in current:
+            continue
+        language = name.split(".", 1)[0]
+        if language in manifest and ".json" in name:
+            os.remove(os.path.join(output_dir, name))
+
+
+class BundleStore:
+    """Reference bundles held in memory, one per language.
+
+    Prebuilt bundles from the bundle CLI are used when their manifest is
+    present; otherwise a language is built on first request from data/json.
+    """
+
+    def __init__(self, bundle_dir: str = BUNDLE_DIR):
+        self.bundle_dir = bundle_dir
+        self._bundles: Dict[str, ReferenceBundle] = {}
+        self._lock = threading.Lock()
+        self._manifest: Optional[Dict[str, Dict[str, object]]] = None
+
+    def get(self, language: str) -> Optional[ReferenceBundle]:
+        with self._lock:
+            bundle = self._bundles.get(language)
+            if bundle is None:
+                bundle = self._load_prebuilt(language) or self._build(language)
+                if bundle is not None:
+                    self._bundles[language] = bundle
+            return bundle
+
+    def _build(self, language: str) -> Optional[ReferenceBundle]:
+        if language not in get_languages():
+            return None
+        logger.info("No prebuilt bundle for %s, building in memory", language)
+        return build_bundle(get_reference_data(), language)
+
+    def _load_prebuilt(self, language: str) -> Optional[ReferenceBundle]:
+        if self._manifest is None:
+            self._manifest = _read_manifest(self.bundle_dir)
+        info = self._manifest.get(language)
+        if info is None:
+            return None
+
+        path = os.path.join(self.bundle_dir, info["file"])
+        try:
+            with open(path, "rb") as f:
+                content = f.read()
+            variants = {}
+            for encoding in ENCODINGS:
+                variant_path = f"{path}.{_extension(encoding)}"
+                if os.path.exists(variant_path):
+                    with open(variant_path, "rb") as f:
+                        variants[encoding] = f.read()
+        except OSError as e:
+            logger.warning("Failed to read prebuilt bundle %s: %s", path, e)
+            return None
+        return ReferenceBundle(
+            language=language,
+            version=info["version"],
+            content=content,
+            variants=variants,
+        )
+
+
+bundle_store = BundleStore()
+
+
+def get_bundle_store() -> BundleStore:
+    return bundle_store
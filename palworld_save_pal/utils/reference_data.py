@@ -0,0 +1,191 @@
+import json
+import os
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from palworld_save_pal.utils.logging_config import create_logger
+
+logger = create_logger(__name__)
+
+DATA_DIR = "data/json"
+
+
+def _merge_pals(data: Dict[str, Any], l10n: Dict[str, Any]) -> Dict[str, Any]:
+    localized_data = {}
+    for code_name, pal_info in data.items():
+        if code_name in l10n:
+            i18n_data = l10n[code_name]
+            pal_info["localized_name"] = i18n_data.get("localized_name", code_name)
+            pal_info["description"] = i18n_data.get(
+                "description", "No description available"
+            )
+        else:
+            pal_info["localized_name"] = code_name
+            pal_info["description"] = "No description available"
+
+        localized_data[code_name] = pal_info
+    return localized_data
+
+
+def _merge_items(data: Dict[str, Any], l10n: Dict[str, Any]) -> Dict[str, Any]:
+    localized_data = {}
+    for item_id, details in data.items():
+        i18n_info = l10n.get(item_id, {"localized_name": item_id, "description": ""})
+        localized_data[item_id] = {
+            "id": item_id,
+            "details": details,
+            "info": i18n_info,
+        }
+    return localized_data
+
+
+def _merge_skills(data: Dict[str, Any], l10n: Dict[str, Any]) -> Dict[str, Any]:
+    localized_data = {}
+    for skill_id, details in data.items():
+        i18n_info = l10n.get(skill_id, {"localized_name": skill_id, "description": ""})
+        localized_data[skill_id] = {
+            "id": skill_id,
+            "localized_name": i18n_info["localized_name"],
+            "description": i18n_info["description"],
+            "details": {**details},
+        }
+    return localized_data
+
+
+def _merge_elements(data: Dict[str, Any], l10n: Dict[str, Any]) -> Dict[str, Any]:
+    localized_data = {}
+    for element_id, details in data.items():
+        i18n_info = l10n.get(element_id, {"localized_name": element_id})
+        localized_data[element_id] = {
+            "localized_name": i18n_info["localized_name"],
+            **details,
+        }
+    return localized_data
+
+
+def _l10n_only(_: Dict[str, Any], l10n: Dict[str, Any]) -> Dict[str, Any]:
+    return l10n
+
+
+def _data_only(data: Dict[str, Any], _: Dict[str, Any]) -> Dict[str, Any]:
+    return data
+
+
+# dataset => (data file, l10n file, merge function)
+DATASETS: Dict[
+    str,
+    Tuple[
+        Optional[str],
+        Optional[str],
+        Callable[[Dict[str, Any], Dict[str, Any]], Dict[str, Any]],
+    ],
+] = {
+    "pals": ("pals.json", "pals.json", _merge_pals),
+    "items": ("items.json", "items.json", _merge_items),
+    "active_skills": ("active_skills.json", "active_skills.json", _merge_skills),
+    "passive_skills": ("passive_skills.json", "passive_skills.json", _merge_skills),
+    "elements": ("elements.json", "elements.json", _merge_elements),
+    "buildings": ("buildings.json", "buildings.json", _merge_skills),
+    "work_suitability": (None, "work_suitability.json", _l10n_only),
+    "ui": (None, "ui.json", _l10n_only),
+    "exp": ("exp.json", None, _data_only),
+}
+
+
+class _CacheEntry:
+    def __init__(self, stamp: Tuple, data: Dict[str, Any]):
+        self.stamp = stamp
+        self.data = data
+        self.encoded: Optional[bytes] = None
+
+
+def get_languages(data_dir: str = DATA_DIR) -> List[str]:
+    l10n_dir = os.path.join(data_dir, "l10n")
+    if not os.path.isdir(l10n_dir):
+        return []
+    return sorted(
+        entry
+        for entry in os.listdir(l10n_dir)
+        if os.path.isdir(os.path.join(l10n_dir, entry))
+    )
+
+
+class ReferenceData:
+    """Merged, localized reference data loaded once per dataset and language.
+
+    Entries are keyed by the mtimes of their source files, so editing a file
+    under data/json is picked up on the next request without a restart.
+    """
+
+    def __init__(self, data_dir: str = DATA_DIR):
+        self.data_dir = data_dir
+        self._cache: Dict[Tuple[str, str], _CacheEntry] = {}
+        self._lock = threading.Lock()
+
+    def source_files(self, dataset: str, language: str) -> List[str]:
+        data_file, l10n_file, _ = DATASETS[dataset]
+        files = []
+        if data_file:
+            files.append(os.path.join(self.data_dir, data_file))
+        if l10n_file:
+            files.append(os.path.join(self.data_dir, "l10n", language, l10n_file))
+        return files
+
+    def get(self, dataset: str, language: str) -> Dict[str, Any]:
+        return self._entry(dataset, language).data
+
+    def get_encoded(
+        self, dataset: str, language: str, encode: Callable[[Dict[str, Any]], bytes]
+    ) -> bytes:
+        """Serialized form of a dataset, encoded once and reused until it changes"""
+        entry = self._entry(dataset, language)
+        if entry.encoded is None:
+            entry.encoded = encode(entry.data)
+        return entry.encoded
+
+    def _entry(self, dataset: str, language: str) -> _CacheEntry:
+        if dataset not in DATASETS:
+            raise ValueError(f"Unknown reference dataset {dataset}")
+        stamp = self._stamp(dataset, language)
+        key = (dataset, language)
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None or entry.stamp != stamp:
+                entry = _CacheEntry(stamp, self._load(dataset, language))
+                self._cache[key] = entry
+            return entry
+
+    def _stamp(self, dataset: str, language: str) -> Tuple:
+        stamp = []
+        for path in self.source_files(dataset, language):
+            try:
+                stamp.append(os.stat(path).st_mtime_ns)
+            except FileNotFoundError:
+                stamp.append(None)
+        return tuple(stamp)
+
+    def _load(self, dataset: str, language: str) -> Dict[str, Any]:
+        data_file, l10n_file, merge = DATASETS[dataset]
+        logger.debug("Loading %s (%s)", dataset, language)
+        data = self._read(os.path.join(self.data_dir, data_file)) if data_file else {}
+        l10n = (
+            self._read(os.path.join(self.data_dir, "l10n", language, l10n_file))
+            if l10n_file
+            else {}
+        )
+        return merge(data, l10n)
+
+    @staticmethod
+    def _read(path: str) -> Dict[str, Any]:
+        if not os.path.exists(path):
+            logger.warning("Reference data file %s not found", path)
+            return {}
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+
+reference_data = ReferenceData()
+
+
+def get_reference_data() -> ReferenceData:
+    return reference_data
@@ -0,0 +1,225 @@
+import hashlib
+import json
+import math
+from typing import Any, Dict, List, Optional, Tuple
+
+from palworld_save_tools.archive import UUID as ArchiveUUID
+
+from palworld_save_pal.utils.json_stream import json_default
+
+# Struct fields whose value identifies a map entry or array element
+KEY_FIELDS = ("InstanceId", "ID", "PlayerUId")
+HASH_SIZE = 16
+
+Path = Tuple[Any, ...]
+
+
+def format_path(path: Path) -> str:
+    """DeepDiff style path, e.g. ['value'][3]['key']"""
+    return "".join(f"[{part!r}]" for part in path)
+
+
+def to_plain(obj: Any) -> Any:
+    """Copy of a subtree holding the values json.loads would have produced"""
+    if isinstance(obj, dict):
+        return {key: to_plain(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [to_plain(value) for value in obj]
+    if isinstance(obj, (str, int, float, bool)) or obj is None:
+        return obj
+    return json_default(obj)
+
+
+def _id(value: Any) -> Any:
+    # Formatting a save UUID as text is slow, its raw bytes identify it as well
+    if isinstance(value, ArchiveUUID):
+        return value.raw_bytes.hex()
+    return json_default(value)
+
+
+_encoder = json.JSONEncoder(separators=(",", ":"), default=_id, allow_nan=True)
+
+
+def digest(obj: Any) -> bytes:
+    """Hash of the canonical JSON encoding of a subtree.
+
+    Keys are not sorted, both trees come from the same parser and property
+    order is part of the save.
+    """
+    encoded = _encoder.encode(obj)
+    return hashlib.blake2b(encoded.encode("utf-8"), digest_size=HASH_SIZE).digest()
+
+
+def entry_key(entry: Any) -> Optional[str]:
+    """Natural id of a map entry or array element, None if it has none"""
+    if not isinstance(entry, dict):
+        return None
+    key = entry.get("key")
+    if isinstance(key, dict):
+        for field in KEY_FIELDS:
+            value = key.get(field)
+            if isinstance(value, dict) and "value" in value:
+                return f"{field}={_id(value['value'])}"
+        return _encoder.encode(key)
+    if "key" in entry and "value" in entry:
+        return _encoder.encode(key)
+    raw = entry.get("RawData")
+    if isinstance(raw, dict):
+        item_id = (raw.get("value") or {}).get("id")
+        if isinstance(item_id, dict) and "local_id_in_created_world" in item_id:
+            return f"local_id={_id(item_id['local_id_in_created_world'])}"
+    return None
+
+
+class StructuralDiff:
+    """Diff of two GVAS subtrees that matches entries by their natural ids.
+
+    Map entries are keyed by InstanceId, container ID or the whole key struct,
+    dynamic items by local_id_in_created_world. Matched entries are compared
+    with ==, which runs in C, and only descended into when that fails (a NaN
+    never equals itself, the walk then finds nothing to report). Arrays
+    without ids are compared by position when their lengths match and as
+    multisets of hashed canonical encodings otherwise, like DeepDiff with
+    ignore_order.
+
+    Results use SaveComparison's report format, with paths relative to the
+    compared object.
+    """
+
+    def __init__(self):
+        self.added: List[Dict[str, Any]] = []
+        self.deleted: List[Dict[str, Any]] = []
+        self.updated: List[Dict[str, Any]] = []
+
+    def compare(self, original: Any, modified: Any) -> "StructuralDiff":
+        self._diff(original, modified, ())
+        return self
+
+    def report(self) -> Dict[str, List[Dict[str, Any]]]:
+        return {"Added": self.added, "Deleted": self.deleted, "Updated": self.updated}
+
+    def _diff(self, original: Any, modified: Any, path: Path) -> None:
+        if original is modified:
+            return
+        if isinstance(original, dict) and isinstance(modified, dict):
+            self._diff_dict(original, modified, path)
+        elif isinstance(original, list) and isinstance(modified, list):
+            self._diff_list(original, modified, path)
+        elif not _equal(original, modified):
+            self.updated.append(
+                {
+                    "path": format_path(path),
+                    "old_value": to_plain(original),
+                    "new_value": to_plain(modified),
+                }
+            )
+
+    def _diff_dict(self, original: dict, modified: dict, path: Path) -> None:
+        for key, value in modified.items():
+            if key not in original:
+                self._add(path + (key,), value)
+        for key, value in original.items():
+            if key not in modified:
+                self._delete(path + (key,), value)
+            else:
+                self._diff(value, modified[key], path + (key,))
+
+    def _diff_list(self, original: list, modified: list, path: Path) -> None:
+        if not any(map(_is_container, original)) and not any(
+            map(_is_container, modified)
+        ):
+            # Skill lists, raw byte arrays and the like change as a whole
+            if len(original) != len(modified) or not all(
+                map(_equal, original, modified)
+            ):
+                self.updated.append(
+                    {
+                        "path": format_path(path),
+                        "old_value": to_plain(original),
+                        "new_value": to_plain(modified),
+                    }
+                )
+            return
+        original_keys = _keys(original)
+        modified_keys = _keys(modified)
+        if original_keys is not None and modified_keys is not None:
+            self._diff_keyed(original, modified, original_keys, modified_keys, path)
+        elif len(original) == len(modified):
+            for index, (old, new) in enumerate(zip(original, modified)):
+                if old != new:
+                    self._diff(old, new, path + (index,))
+        else:
+            self._diff_unordered(original, modified, path)
+
+    def _diff_keyed(
+        self,
+        original: list,
+        modified: list,
+        original_keys: List[str],
+        modified_keys: List[str],
+        path: Path,
+    ) -> None:
+        original_index = {key: index for index, key in enumerate(original_keys)}
+        modified_index = {key: index for index, key in enumerate(modified_keys)}
+        for key, index in modified_index.items():
+            if key not in original_index:
+                self._add(path + (index,), modified[index])
+        for key, index in original_index.items():
+            new_index = modified_index.get(key)
+            if new_index is None:
+                self._delete(path + (index,), original[index])
+                continue
+            old, new = original[index], modified[new_index]
+            if old != new:
+                self._diff(old, new, path + (index,))
+
+    def _diff_unordered(self, original: list, modified: list, path: Path) -> None:
+        remaining: Dict[bytes, List[int]] = {}
+        for index, value in enumerate(original):
+            remaining.setdefault(digest(value), []).append(index)
+        for index, value in enumerate(modified):
+            matches = remaining.get(digest(value))
+            if matches:
+                matches.pop()
+            else:
+                self._add(path + (index,), value)
+        for indexes in remaining.values():
+            for index in indexes:
+                self._delete(path + (index,), original[index])
+
+    def _add(self, path: Path, value: Any) -> None:
+        self.added.append({"path": format_path(path), "value": to_plain(value)})
+
+    def _delete(self, path: Path, value: Any) -> None:
+        self.deleted.append({"path": format_path(path), "value": to_plain(value)})
+
+
+def diff_objects(original: Any, modified: Any) -> Dict[str, List[Dict[str, Any]]]:
+    return StructuralDiff().compare(original, modified).report()
+
+
+def _keys(values: list) -> Optional[List[str]]:
+    if not values:
+        return []
+    keys = []
+    for value in values:
+        key = entry_key(value)
+        if key is None:
+            return None
+        keys.append(key)
+    if len(set(keys)) != len(keys):
+        return None
+    return keys
+
+
+def _is_container(value: Any) -> bool:
+    return isinstance(value, (dict, list))
+
+
+def _equal(original: Any, modified: Any) -> bool:
+    if isinstance(original, float) and isinstance(modified, float):
+        if math.isnan(original) and math.isnan(modified):
+            return True
+    if type(original) is not type(modified):
+        return False
+    return original == modified
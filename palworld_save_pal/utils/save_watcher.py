@@ -0,0 +1,201 @@
+import asyncio
+import hashlib
+import os
+import threading
+import uuid
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from palworld_save_pal.utils.logging_config import create_logger
+
+logger = create_logger(__name__)
+
+DEFAULT_INTERVAL = 2.0
+MIN_INTERVAL = 0.5
+
+
+class WatchChanges(BaseModel):
+    level_changed: bool = False
+    changed_players: Dict[UUID, bytes] = Field(default_factory=dict)
+    removed_players: List[UUID] = Field(default_factory=list)
+
+    @property
+    def empty(self) -> bool:
+        return (
+            not self.level_changed
+            and not self.changed_players
+            and not self.removed_players
+        )
+
+
+class _FileState:
+    def __init__(self, stat: Tuple[int, int], digest: Optional[str]):
+        self.stat = stat
+        self.digest = digest
+
+
+class SaveWatcher:
+    """Polls a save directory for Level.sav and Players/*.sav changes.
+
+    Files are compared by (mtime, size) first and only read and hashed when
+    those differ, so touching a file without changing it is ignored. A file
+    is reported once its stat is unchanged between two polls, which skips
+    saves the server is still writing.
+
+    scan() and rebaseline() both run in worker threads and hold _lock while
+    touching the file states. Changes from a scan that finished before a
+    rebaseline are discarded, they predate the new baseline.
+    """
+
+    def __init__(
+        self,
+        level_sav: str,
+        players_dir: str,
+        interval: float = DEFAULT_INTERVAL,
+    ):
+        self.level_sav = level_sav
+        self.players_dir = players_dir
+        self.interval = max(interval, MIN_INTERVAL)
+        self._files: Dict[str, _FileState] = {}
+        self._pending: Dict[str, Tuple[int, int]] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._lock = threading.Lock()
+        self._generation = 0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def rebaseline(self) -> None:
+        """Accept the current files as seen, e.g. after saving them ourselves"""
+        files = {}
+        for path in self._paths():
+            stat = self._stat(path)
+            if stat is not None:
+                files[path] = _FileState(stat, self._hash(path))
+        with self._lock:
+            self._files = files
+            self._pending = {}
+            self._generation += 1
+
+    def scan(self) -> WatchChanges:
+        return self._scan_generation()[1]
+
+    def _scan_generation(self) -> Tuple[int, WatchChanges]:
+        with self._lock:
+            return self._generation, self._scan()
+
+    def _scan(self) -> WatchChanges:
+        changes = WatchChanges()
+        seen = set()
+        for path in self._paths():
+            seen.add(path)
+            stat = self._stat(path)
+            if stat is None:
+                continue
+            known = self._files.get(path)
+            if known is not None and known.stat == stat:
+                self._pending.pop(path, None)
+                continue
+            if self._pending.get(path) != stat:
+                # Wait for the file to settle before reading it
+                self._pending[path] = stat
+                continue
+            del self._pending[path]
+
+            with open(path, "rb") as f:
+                data = f.read()
+            digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+            self._files[path] = _FileState(stat, digest)
+            if known is not None and known.digest == digest:
+                continue
+            if path == self.level_sav:
+                changes.level_changed = True
+            else:
+                player_id = self._player_id(path)
+                if player_id is not None:
+                    changes.changed_players[player_id] = data
+
+        for path in [p for p in self._files if p not in seen]:
+            del self._files[path]
+            player_id = self._player_id(path)
+            if player_id is not None:
+                changes.removed_players.append(player_id)
+        return changes
+
+    def start(self, on_changes: Callable[[WatchChanges], Awaitable[None]]) -> None:
+        """Poll in the background, rebaseline() first to set what counts as seen"""
+        self.stop()
+        self._task = asyncio.create_task(self._run(on_changes))
+        logger.info(
+            "Watching %s and %s every %ss",
+            self.level_sav,
+            self.players_dir,
+            self.interval,
+        )
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _run(self, on_changes: Callable[[WatchChanges], Awaitable[None]]):
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                generation, changes = await asyncio.to_thread(self._scan_generation)
+                if generation != self._generation:
+                    continue
+                if not changes.empty:
+                    await on_changes(changes)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.exception("Save watcher stopped: %s", e)
+                return
+
+    def _paths(self) -> List[str]:
+        paths = [self.level_sav]
+        if os.path.isdir(self.players_dir):
+            paths.extend(str(p) for p in sorted(Path(self.players_dir).glob("*.sav")))
+        return paths
+
+    @staticmethod
+    def _stat(path: str) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    @staticmethod
+    def _hash(path: str) -> Optional[str]:
+        try:
+            with open(path, "rb") as f:
+                return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    def _player_id(path: str) -> Optional[UUID]:
+        try:
+            return uuid.UUID(Path(path).stem)
+        except ValueError:
+            return None
+
+
+_save_watcher: Optional[SaveWatcher] = None
+
+
+def get_save_watcher() -> Optional[SaveWatcher]:
+    return _save_watcher
+
+
+def set_save_watcher(watcher: Optional[SaveWatcher]) -> None:
+    global _save_watcher
+    if _save_watcher is not None and _save_watcher is not watcher:
+        _save_watcher.stop()
+    _save_watcher = watcher
@@ -0,0 +1,23 @@
+from typing import Any
+
+from pydantic_core import to_json
+
+from palworld_save_tools.archive import UUID as ArchiveUUID
+
+
+def _fallback(obj: Any) -> Any:
+    if isinstance(obj, ArchiveUUID):
+        return str(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode an object graph straight to JSON bytes.
+
+    Pydantic models, UUIDs (including as dict keys), enums and datetimes are
+    handled natively by pydantic-core, so there is no intermediate tree of
+    plain Python objects as with jsonable_encoder + json.dumps.
+    """
+    return to_json(obj, fallback=_fallback)
@@ -0,0 +1,53 @@
+from fastapi import APIRouter, Request, Response
+from fastapi.responses import RedirectResponse
+
+from palworld_save_pal.utils.reference_bundle import (
+    ENCODINGS,
+    ReferenceBundle,
+    get_bundle_store,
+)
+from palworld_save_pal.web.encoding import etag_matches, select_encoding
+
+BUNDLE_PATH = "/bundles"
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+router = APIRouter(prefix=BUNDLE_PATH)
+
+
+def bundle_url(bundle: ReferenceBundle) -> str:
+    return f"{BUNDLE_PATH}/{bundle.language}/{bundle.version}.json"
+
+
+@router.get("/{language}/{version}.json")
+async def get_bundle(language: str, version: str, request: Request):
+    bundle = get_bundle_store().get(language)
+    if bundle is None:
+        return Response(status_code=404)
+    if version != bundle.version:
+        # Old versions are not kept around, point the client at the current one
+        return RedirectResponse(
+            url=bundle_url(bundle),
+            status_code=302,
+            headers={"Cache-Control": "no-cache"},
+        )
+
+    encoding = select_encoding(
+        request.headers.get("accept-encoding"),
+        [e for e in ENCODINGS if e in bundle.variants],
+    )
+    # Strong validators must differ between representations of the same URL
+    etag = f'"{bundle.version}-{encoding}"' if encoding else f'"{bundle.version}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": IMMUTABLE,
+        "Vary": "Accept-Encoding",
+    }
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    if encoding:
+        headers["Content-Encoding"] = encoding
+        content = bundle.variants[encoding]
+    else:
+        content = bundle.content
+    return Response(content=content, media_type="application/json", headers=headers)
@@ -0,0 +1,175 @@
+import gzip
+import hashlib
+import mimetypes
+import os
+import re
+import threading
+from typing import Callable, Dict, Optional
+from urllib.parse import quote
+
+import zstandard
+from fastapi import Request, Response
+from fastapi.responses import FileResponse, RedirectResponse
+
+from palworld_save_pal.utils.logging_config import create_logger
+from palworld_save_pal.web.encoding import etag_matches, select_encoding
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+logger = create_logger(__name__)
+
+STATIC_DIR = "ui"
+# Files up to this size are kept in memory with precompressed variants,
+# anything bigger is streamed from disk.
+MAX_MEMORY_SIZE = 2 * 1024 * 1024
+MIN_COMPRESS_SIZE = 1024
+COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/javascript",
+    "application/json",
+    "application/manifest+json",
+    "application/wasm",
+    "application/xml",
+    "image/svg+xml",
+)
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+# SvelteKit emits content hashed build output under _app/immutable, nothing
+# else in the build is safe to cache forever
+HASHED_ASSET = re.compile(r"(^|/)_app/immutable/")
+
+COMPRESSORS: Dict[str, Callable[[bytes], bytes]] = {
+    "zstd": lambda data: zstandard.ZstdCompressor(level=19).compress(data),
+    "gzip": lambda data: gzip.compress(data, compresslevel=9, mtime=0),
+}
+if brotli is not None:
+    COMPRESSORS = {"br": lambda data: brotli.compress(data, quality=11), **COMPRESSORS}
+
+
+class StaticAsset:
+    def __init__(self, path: str, relative_path: str):
+        self.path = path
+        stat = os.stat(path)
+        self.size = stat.st_size
+        self.media_type = (
+            mimetypes.guess_type(path)[0] or "application/octet-stream"
+        )
+        self.cache_control = (
+            IMMUTABLE if HASHED_ASSET.search(relative_path) else REVALIDATE
+        )
+        self.content: Optional[bytes] = None
+        self.variants: Dict[str, bytes] = {}
+
+        if self.size > MAX_MEMORY_SIZE:
+            self.etag = f'"{stat.st_mtime_ns:x}-{self.size:x}"'
+            return
+
+        with open(path, "rb") as f:
+            self.content = f.read()
+        self.etag = f'"{hashlib.sha256(self.content).hexdigest()[:20]}"'
+        if self.size >= MIN_COMPRESS_SIZE and self.media_type.startswith(
+            COMPRESSIBLE_TYPES
+        ):
+            for encoding, compress in COMPRESSORS.items():
+                compressed = compress(self.content)
+                if len(compressed) < self.size:
+                    self.variants[encoding] = compressed
+
+    def response(self, request: Request) -> Response:
+        encoding = select_encoding(
+            request.headers.get("accept-encoding"), list(self.variants)
+        )
+        etag = f'{self.etag[:-1]}-{encoding}"' if encoding else self.etag
+        headers = {"ETag": etag, "Cache-Control": self.cache_control}
+        if self.variants:
+            headers["Vary"] = "Accept-Encoding"
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
+
+        if self.content is None:
+            return FileResponse(self.path, media_type=self.media_type, headers=headers)
+        if encoding:
+            headers["Content-Encoding"] = encoding
+            content = self.variants[encoding]
+        else:
+            content = self.content
+        return Response(content=content, media_type=self.media_type, headers=headers)
+
+
+class StaticAssets:
+    """Index of the built UI, scanned once instead of hitting the disk per request
+
+    load() compresses every asset and is slow, the servers call it from their
+    startup hook so no request ever waits on it.
+    """
+
+    def __init__(self, root: str = STATIC_DIR):
+        self.root = root
+        self._assets: Dict[str, StaticAsset] = {}
+        self._lock = threading.Lock()
+        self._loaded = False
+
+    def load(self) -> None:
+        assets = {}
+        memory = 0
+        for directory, _, files in os.walk(self.root):
+            for name in files:
+                path = os.path.join(directory, name)
+                relative_path = os.path.relpath(path, self.root).replace(os.sep, "/")
+                try:
+                    asset = StaticAsset(path, relative_path)
+                except OSError as e:
+                    logger.warning("Failed to index %s: %s", path, e)
+                    continue
+                assets[relative_path] = asset
+                if asset.content is not None:
+                    memory += len(asset.content) + sum(
+                        len(v) for v in asset.variants.values()
+                    )
+        with self._lock:
+            self._assets = assets
+            self._loaded = True
+        logger.info(
+            "Indexed %s static files from %s (%s KB in memory, encodings: %s)",
+            len(assets),
+            self.root,
+            memory // 1024,
+            ", ".join(COMPRESSORS),
+        )
+
+    def get(self, path: str) -> Optional[StaticAsset]:
+        if not self._loaded:
+            self.load()
+        relative_path = path.strip("/")
+        asset = self._assets.get(relative_path)
+        if asset is None:
+            index_path = f"{relative_path}/index.html" if relative_path else "index.html"
+            asset = self._assets.get(index_path)
+        return asset
+
+
+static_assets = StaticAssets()
+
+
+def get_static_assets() -> StaticAssets:
+    return static_assets
+
+
+async def serve_static_files(request: Request, call_next, passthrough=("/ws",)):
+    path = request.url.path
+    if path.startswith(passthrough):
+        return await call_next(request)
+
+    asset = get_static_assets().get(path)
+    if asset is not None:
+        return asset.response(request)
+
+    # If no static file matches the requested path, redirect to the root path with the
+    # original URL as a query parameter. This is to handle client-side routing in the SPA.
+    if path != "/":
+        encoded_path = quote(path)
+        return RedirectResponse(url=f"/?path={encoded_path}")
+    return await call_next(request)
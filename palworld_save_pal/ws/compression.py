@@ -0,0 +1,78 @@
+import json
+import os
+from typing import List, Optional
+
+import zstandard
+
+from palworld_save_pal.utils.logging_config import create_logger
+
+logger = create_logger(__name__)
+
+ZSTD = "zstd"
+DEFAULT_THRESHOLD = 32 * 1024
+MIN_THRESHOLD = 1024
+COMPRESSION_LEVEL = 3
+DICTIONARY_SIZE = 64 * 1024
+DICTIONARY_SOURCES = [
+    "data/json/pals.json",
+    "data/json/items.json",
+    "data/json/active_skills.json",
+    "data/json/passive_skills.json",
+    "data/json/elements.json",
+]
+
+_dictionary: Optional[zstandard.ZstdCompressionDict] = None
+
+
+def _dictionary_samples() -> List[bytes]:
+    samples = []
+    for path in DICTIONARY_SOURCES:
+        if not os.path.exists(path):
+            continue
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        samples.extend(
+            json.dumps({key: value}, separators=(",", ":")).encode("utf-8")
+            for key, value in data.items()
+        )
+    return samples
+
+
+def get_dictionary() -> Optional[zstandard.ZstdCompressionDict]:
+    """Dictionary trained on reference data entries, built once per process"""
+    global _dictionary
+    if _dictionary is None:
+        samples = _dictionary_samples()
+        if not samples:
+            logger.warning("No samples found to train a compression dictionary")
+            return None
+        _dictionary = zstandard.train_dictionary(
+            DICTIONARY_SIZE, samples, level=COMPRESSION_LEVEL
+        )
+        logger.info(
+            "Trained zstd dictionary %s from %s samples",
+            _dictionary.dict_id(),
+            len(samples),
+        )
+    return _dictionary
+
+
+class MessageCompressor:
+    """Compresses serialized messages larger than threshold into zstd frames"""
+
+    def __init__(
+        self,
+        threshold: int = DEFAULT_THRESHOLD,
+        dictionary: Optional[zstandard.ZstdCompressionDict] = None,
+    ):
+        self.threshold = max(threshold, MIN_THRESHOLD)
+        self.dictionary = dictionary
+        self._compressor = zstandard.ZstdCompressor(
+            level=COMPRESSION_LEVEL, dict_data=dictionary, write_content_size=True
+        )
+
+    def should_compress(self, payload: bytes) -> bool:
+        return len(payload) >= self.threshold
+
+    def compress(self, payload: bytes) -> bytes:
+        return self._compressor.compress(payload)
@@ -1,6 +1,7 @@
 from fastapi import WebSocket
 from palworld_save_pal.ws.messages import SyncAppStateMessage, MessageType
-from palworld_save_pal.ws.utils import build_response
+from palworld_save_pal.ws.handlers.player_handler import send_players
+from palworld_save_pal.ws.utils import build_response, send_response
 from palworld_save_pal.state import get_app_state
 from palworld_save_pal.utils.logging_config import create_logger
 
@@ -11,7 +12,7 @@ async def sync_app_state_handler(_: SyncAppStateMessage, ws: WebSocket):
     app_state = get_app_state()
 
     response = build_response(MessageType.GET_SETTINGS, app_state.settings)
-    await ws.send_json(response)
+    await send_response(ws, response)
 
     save_file = app_state.save_file
     if save_file is None:
@@ -35,7 +36,6 @@ async def sync_app_state_handler(_: SyncAppStateMessage, ws: WebSocket):
         MessageType.LOADED_SAVE_FILES if app_state.local else MessageType.LOAD_ZIP_FILE
     )
     response = build_response(message_type, data)
-    await ws.send_json(response)
+    await send_response(ws, response)
 
-    response = build_response(MessageType.GET_PLAYERS, save_file.get_players())
-    await ws.send_json(response)
+    await send_players(ws)
@@ -0,0 +1,55 @@
+import os
+
+from fastapi import WebSocket
+
+from palworld_save_pal.utils.backup_store import get_backup_store
+from palworld_save_pal.utils.logging_config import create_logger
+from palworld_save_pal.ws.messages import (
+    ListBackupsMessage,
+    MessageType,
+    PruneBackupsMessage,
+    RestoreBackupMessage,
+)
+from palworld_save_pal.ws.utils import build_response, send_response
+
+logger = create_logger(__name__)
+
+
+async def list_backups_handler(message: ListBackupsMessage, ws: WebSocket):
+    store = get_backup_store()
+    source = message.data.source if message.data else None
+    data = {
+        "backups": [snapshot.summary() for snapshot in store.list(source)],
+        "stats": store.stats(),
+    }
+    response = build_response(MessageType.LIST_BACKUPS, data)
+    await send_response(ws, response)
+
+
+async def restore_backup_handler(message: RestoreBackupMessage, ws: WebSocket):
+
+    async def ws_callback(message: str):
+        response = build_response(MessageType.PROGRESS_MESSAGE, message)
+        await send_response(ws, response)
+
+    store = get_backup_store()
+    snapshot = store.get(message.data.id)
+    # Backups only restore to the file they were taken from, and the current
+    # version of that file is backed up first so a restore can be undone
+    if os.path.exists(snapshot.source):
+        await ws_callback(f"Backing up current {snapshot.name}...")
+        store.snapshot(snapshot.source)
+    await ws_callback(f"Restoring {snapshot.name} from {snapshot.id}...")
+    target = store.restore(snapshot.id)
+    response = build_response(
+        MessageType.RESTORE_BACKUP, f"Restored {snapshot.id} to {target}"
+    )
+    await send_response(ws, response)
+
+
+async def prune_backups_handler(message: PruneBackupsMessage, ws: WebSocket):
+    if message.data.keep < 1:
+        raise ValueError("At least one backup must be kept")
+    result = get_backup_store().prune(message.data.keep, message.data.source)
+    response = build_response(MessageType.PRUNE_BACKUPS, result)
+    await send_response(ws, response)
@@ -3,14 +3,18 @@ from typing import TYPE_CHECKING
 from palworld_save_pal.ws.handlers import (
     active_skills_handler,
     app_state_handler,
+    backup_handler,
+    compression_handler,
     elements_handler,
     exp_handler,
     items_handler,
     open_in_browser_handler,
     passive_skills_handler,
     preset_handler,
+    reference_bundle_handler,
     save_file_handler,
     pal_handler,
+    player_handler,
     settings_handler,
     ui_common_handler,
     version_handler,
@@ -19,6 +23,7 @@ from palworld_save_pal.ws.handlers import (
 from palworld_save_pal.ws.messages import (
     AddPalMessage,
     AddPresetMessage,
+    ApplyPresetMessage,
     BaseMessage,
     ClonePalMessage,
     GetActiveSkillsMessage,
@@ -26,12 +31,21 @@ from palworld_save_pal.ws.messages import (
     GetItemsMessage,
     GetPalsMessage,
     GetPassiveSkillsMessage,
+    GetPlayerPalsMessage,
+    GetReferenceBundleMessage,
     GetSettingsMessage,
     HealPalsMessage,
+    ListBackupsMessage,
+    LoadPlayerMessage,
     MessageType,
     MovePalMessage,
+    NegotiateCompressionMessage,
     OpenInBrowserMessage,
+    PruneBackupsMessage,
+    QueryPalsMessage,
+    RestoreBackupMessage,
     SyncAppStateMessage,
+    SyncPlayersMessage,
     UpdateSaveFileMessage,
     DownloadSaveFileMessage,
     LoadZipFileMessage,
@@ -42,6 +56,8 @@ from palworld_save_pal.ws.messages import (
     GetVersionMessage,
     SelectSaveMessage,
     UpdateSettingsMessage,
+    ValidateSaveMessage,
+    WatchSaveMessage,
 )
 
 if TYPE_CHECKING:
@@ -81,6 +97,86 @@ def bootstrap(dispatcher: "MessageDispatcher"):
         },
     )
 
+    dispatcher.register_handler(
+        MessageType.SYNC_PLAYERS.value,
+        {
+            "message_class": SyncPlayersMessage,
+            "handler_func": player_handler.sync_players_handler,
+        },
+    )
+
+    dispatcher.register_handler(
+        MessageType.GET_PLAYER_PALS.value,
+        {
+            "message_class": GetPlayerPalsMessage,
+            "handler_func": player_handler.get_player_pals_handler,
+        },
+    )
+
+    dispatcher.register_handler(
+        MessageType.LOAD_PLAYER.value,
+        {
+            "message_class": LoadPlayerMessage,
+            "handler_func": player_handler.load_player_handler,
+        },
+    )
+
+    dispatcher.register_handler(
+        MessageType.NEGOTIATE_COMPRESSION.value,
+        {
+            "message_class": NegotiateCompressionMessage,
+            "handler_func": compression_handler.negotiate_compression_handler,
+        },
+    )
+
+    dispatcher.register_handler(
+        MessageType.GET_REFERENCE_BUNDLE.value,
+        {
+            "message_class": GetReferenceBundleMessage,
+            "handler_func": reference_bundle_handler.get_reference_bundle_handler,
+        },
+    )
+
+    dispatcher.register_handler(
+        MessageType.APPLY_PRESET.value,
+        {
+            "message_class": ApplyPresetMessage,
+            "handler_func": preset_handler.apply_preset_handler,
+        },
+    )
+
+    dispatcher.register_handler(
+        MessageType.LIST_BACKUPS.value,
+        {
+            "message_class": ListBackupsMessage,
+            "handler_func": backup_handler.list_backups_handler,
+        },
+    )
+
+    dispatcher.register_handler(
+        MessageType.RESTORE_BACKUP.value,
+        {
+            "message_class": RestoreBackupMessage,
+            "handler_func": backup_handler.restore_backup_handler,
+        },
+    )
+
+    dispatcher.register_handler(
+        MessageType.PRUNE_BACKUPS.value,
+        {
+            "message_class": PruneBackupsMessage,
+            "handler_func": backup_handler.prune_backups_handler,
+        },
+    )
+
+    dispatcher.register_handler(
+        MessageType.WATCH_SAVE.value,
+        {
+            "message_class": WatchSaveMessage,
+            "handler_func": local_file_handler.watch_save_handler,
+        },
+    )
+
     dispatcher.register_handler(
         MessageType.DELETE_PALS.value,
         {
@@ -97,6 +193,22 @@ def bootstrap(dispatcher: "MessageDispatcher"):
         },
     )
 
+    dispatcher.register_handler(
+        MessageType.QUERY_PALS.value,
+        {
+            "message_class": QueryPalsMessage,
+            "handler_func": pal_handler.query_pals_handler,
+        },
+    )
+
+    dispatcher.register_handler(
+        MessageType.VALIDATE_SAVE.value,
+        {
+            "message_class": ValidateSaveMessage,
+            "handler_func": save_file_handler.validate_save_handler,
+        },
+    )
+
     dispatcher.register_handler(
         MessageType.ADD_PAL.value,
         {
@@ -0,0 +1,52 @@
+import base64
+
+from fastapi import WebSocket
+
+from palworld_save_pal.ws.compression import (
+    DEFAULT_THRESHOLD,
+    ZSTD,
+    MessageCompressor,
+    get_dictionary,
+)
+from palworld_save_pal.ws.messages import MessageType, NegotiateCompressionMessage
+from palworld_save_pal.ws.utils import build_response, send_response
+from palworld_save_pal.utils.logging_config import create_logger
+
+logger = create_logger(__name__)
+
+
+async def negotiate_compression_handler(
+    message: NegotiateCompressionMessage, ws: WebSocket
+):
+    ws.state.compressor = None
+    if ZSTD not in message.data.algorithms:
+        logger.info("Client offered %s, compression disabled", message.data.algorithms)
+        data = {"algorithm": None}
+        response = build_response(MessageType.NEGOTIATE_COMPRESSION, data)
+        await send_response(ws, response)
+        return
+
+    dictionary = get_dictionary() if message.data.dictionary else None
+    compressor = MessageCompressor(
+        threshold=message.data.threshold or DEFAULT_THRESHOLD,
+        dictionary=dictionary,
+    )
+    data = {
+        "algorithm": ZSTD,
+        "threshold": compressor.threshold,
+        "dictionary_id": dictionary.dict_id() if dictionary else None,
+        "dictionary": (
+            base64.b64encode(dictionary.as_bytes()).decode("utf-8")
+            if dictionary
+            else None
+        ),
+    }
+    response = build_response(MessageType.NEGOTIATE_COMPRESSION, data)
+    # Reply uncompressed, the client needs the dictionary before it can decode
+    await send_response(ws, response)
+    ws.state.compressor = compressor
+    logger.info(
+        "Compressing messages over %s bytes with zstd (dictionary %s)",
+        compressor.threshold,
+        data["dictionary_id"],
+    )
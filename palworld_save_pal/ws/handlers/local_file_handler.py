@@ -1,17 +1,32 @@
+import asyncio
 import os
 import time
-import shutil
 
 from fastapi import WebSocket
+from palworld_save_pal.utils.atomic import clone_file
+from palworld_save_pal.utils.backup_store import get_backup_store
+from palworld_save_pal.utils.save_watcher import (
+    DEFAULT_INTERVAL,
+    SaveWatcher,
+    WatchChanges,
+    get_save_watcher,
+    set_save_watcher,
+)
 from palworld_save_pal.utils.file_manager import FileManager
 from palworld_save_pal.ws.messages import (
     MessageType,
     SaveModdedSaveMessage,
     SelectSaveMessage,
+    WatchSaveMessage,
 )
 from palworld_save_pal.utils.logging_config import create_logger
-from palworld_save_pal.ws.utils import build_response
+from palworld_save_pal.ws.handlers.player_handler import (
+    prefetch_players,
+    send_players,
+)
+from palworld_save_pal.ws.utils import build_response, send_response
 from palworld_save_pal.state import get_app_state
+from palworld_save_pal.game.save_file import SaveType
 
 logger = create_logger(__name__)
 
@@ -21,7 +36,7 @@ async def save_modded_save_handler(_: SaveModdedSaveMessage, ws: WebSocket):
 
     async def ws_callback(message: str):
         response = build_response(MessageType.PROGRESS_MESSAGE, message)
-        await ws.send_json(response)
+        await send_response(ws, response)
 
     app_state = get_app_state()
     save_file = app_state.save_file
@@ -29,21 +44,34 @@ async def save_modded_save_handler(_: SaveModdedSaveMessage, ws: WebSocket):
     if not save_file:
         raise ValueError("No save file loaded")
 
-    file_name = os.path.basename(save_file.name)
-    backup_dir = "backups"
-    if not os.path.exists(backup_dir):
-        os.makedirs(backup_dir)
-    timestamp = time.strftime("%Y-%m-%d-%H-%M")
-    backup_path = os.path.join(backup_dir, f"{file_name}_{timestamp}.sav")
-    await ws_callback(f"Backing up save file {save_file.name} to {backup_path}...")
-    shutil.move(save_file.name, backup_path)
+    await ws_callback(f"Backing up save file {save_file.name}...")
+    try:
+        snapshot = get_backup_store().snapshot(save_file.name)
+        logger.info("Backed up %s as %s", save_file.name, snapshot.id)
+    except Exception as e:
+        # Fall back to a plain copy, the world is never saved over unbacked
+        logger.warning("Backup store failed for %s: %s", save_file.name, e)
+        file_name = os.path.basename(save_file.name)
+        backup_dir = "backups"
+        if not os.path.exists(backup_dir):
+            os.makedirs(backup_dir)
+        timestamp = time.strftime("%Y-%m-%d-%H-%M")
+        backup_path = os.path.join(backup_dir, f"{file_name}_{timestamp}.sav")
+        method = clone_file(save_file.name, backup_path)
+        logger.info("Backed up %s to %s (%s)", save_file.name, backup_path, method)
     await ws_callback("Saving modded save file...")
+    # Written to a temp file and renamed over the original, so Level.sav is
+    # always either the previous or the new save
     save_file.to_sav_file(save_file.name)
+    watcher = get_save_watcher()
+    if watcher is not None:
+        # Don't report the save we just wrote as changed on disk
+        await asyncio.to_thread(watcher.rebaseline)
     await ws_callback(f"Modded save file saved to {save_file.name}")
     response = build_response(
         MessageType.SAVE_MODDED_SAVE, f"Modded save file saved to {save_file.name}"
     )
-    await ws.send_json(response)
+    await send_response(ws, response)
 
 
 async def select_save_files_handler(message: SelectSaveMessage, ws: WebSocket):
@@ -54,12 +82,16 @@ async def select_save_files_handler(message: SelectSaveMessage, ws: WebSocket):
     local = message.data.local
 
     if save_type == "steam":
-        await process_steam_save(save_path, ws, local)
+        await process_steam_save(save_path, ws, local, lazy=message.data.lazy)
+        if message.data.lazy and message.data.prefetch:
+            asyncio.create_task(prefetch_players(ws))
     else:
         pass
 
 
-async def process_steam_save(save_path: str, ws: WebSocket, local: bool):
+async def process_steam_save(
+    save_path: str, ws: WebSocket, local: bool, lazy: bool = False
+):
     logger.debug("Processing Steam save files")
     validation_result = FileManager.validate_steam_save_directory(save_path)
     if not validation_result.valid:
@@ -78,27 +110,85 @@ async def process_steam_save(save_path: str, ws: WebSocket, local: bool):
         with open(validation_result.level_meta, "rb") as f:
             level_meta = f.read()
 
-    player_files = FileManager.get_player_saves(validation_result.players_dir)
+    # Lazy loading only lists players here, their saves are parsed on first use
+    player_paths = None
+    if lazy:
+        player_paths = FileManager.get_player_save_paths(validation_result.players_dir)
+        player_files = {}
+    else:
+        player_files = FileManager.get_player_saves(validation_result.players_dir)
 
     await app_state.process_save_files(
         save_path,
         level_sav,
         level_meta,
         player_files,
-        ws_callback=lambda msg: ws.send_json(
-            build_response(MessageType.PROGRESS_MESSAGE, msg)
+        ws_callback=lambda msg: send_response(
+            ws, build_response(MessageType.PROGRESS_MESSAGE, msg)
         ),
         local=local,
+        player_sav_paths=player_paths,
     )
 
     data = {
         "sav_file_name": validation_result.level_sav,
-        "players": [str(p) for p in player_files],
+        "players": [str(p) for p in (player_paths or player_files)],
         "world_name": app_state.save_file.world_name,
     }
 
     response = build_response(MessageType.LOADED_SAVE_FILES, data)
-    await ws.send_json(response)
+    await send_response(ws, response)
+
+    await send_players(ws)
+
+
+async def watch_save_handler(message: WatchSaveMessage, ws: WebSocket):
+    app_state = get_app_state()
+    if not message.data.enabled:
+        set_save_watcher(None)
+        response = build_response(MessageType.WATCH_SAVE, {"enabled": False})
+        await send_response(ws, response)
+        return
 
-    response = build_response(MessageType.GET_PLAYERS, app_state.players)
-    await ws.send_json(response)
+    save_file = app_state.save_file
+    if not save_file or app_state.save_type != SaveType.STEAM:
+        raise ValueError("Watch mode needs a Steam save loaded from disk")
+    save_path = save_file.name
+    validation_result = FileManager.validate_steam_save_directory(save_path)
+    if not validation_result.valid:
+        raise ValueError(validation_result.error)
+
+    async def on_changes(changes: WatchChanges):
+        if changes.level_changed:
+            # Reloading here would drop edits not saved yet, the client
+            # decides whether to reload by selecting the save again
+            logger.info("Level.sav changed on disk: %s", save_path)
+            data = {
+                "path": save_path,
+                "level_changed": True,
+                "players": [str(p) for p in changes.changed_players],
+            }
+            response = build_response(MessageType.SAVE_CHANGED, data)
+            await send_response(ws, response)
+            return
+
+        changed = app_state.save_file.reload_players(
+            changes.changed_players, changes.removed_players
+        )
+        removed = set(changes.removed_players)
+        app_state.remove_players(removed)
+        app_state.touch_players(p for p in changed if p not in removed)
+        logger.info("Reloaded players %s", changed)
+        await send_players(ws)
+
+    watcher = SaveWatcher(
+        str(validation_result.level_sav),
+        str(validation_result.players_dir),
+        message.data.interval or DEFAULT_INTERVAL,
+    )
+    set_save_watcher(watcher)
+    await asyncio.to_thread(watcher.rebaseline)
+    watcher.start(on_changes)
+    data = {"enabled": True, "interval": watcher.interval}
+    response = build_response(MessageType.WATCH_SAVE, data)
+    await send_response(ws, response)
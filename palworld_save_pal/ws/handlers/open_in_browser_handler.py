@@ -1,7 +1,7 @@
 import webbrowser
 from fastapi import WebSocket
 from palworld_save_pal.ws.messages import OpenInBrowserMessage, MessageType
-from palworld_save_pal.ws.utils import build_response
+from palworld_save_pal.ws.utils import build_response, send_response
 from palworld_save_pal.utils.logging_config import create_logger
 
 logger = create_logger(__name__)
@@ -16,4 +16,4 @@ async def open_in_browser_handler(message: OpenInBrowserMessage, ws: WebSocket):
     response = build_response(
         MessageType.OPEN_IN_BROWSER, "Browser opened successfully"
     )
-    await ws.send_json(response)
+    await send_response(ws, response)
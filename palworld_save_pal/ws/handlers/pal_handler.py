@@ -3,7 +3,7 @@ from fastapi import WebSocket
 
 from palworld_save_pal.game.pal import Pal
 from palworld_save_pal.state import get_app_state
-from palworld_save_pal.utils.json_manager import JsonManager
+from palworld_save_pal.utils.reference_data import get_reference_data
 from palworld_save_pal.ws.messages import (
     GetPalsMessage,
     AddPalMessage,
@@ -12,38 +12,47 @@ from palworld_save_pal.ws.messages import (
     DeletePalsMessage,
     HealPalsMessage,
     MessageType,
+    QueryPalsMessage,
 )
 from palworld_save_pal.utils.logging_config import create_logger
-from palworld_save_pal.ws.utils import build_response
+from palworld_save_pal.ws.utils import build_response, send_response
 
 logger = create_logger(__name__)
 
 
 async def get_pals_handler(_: GetPalsMessage, ws: WebSocket):
     app_state = get_app_state()
-    pals_json = JsonManager("data/json/pals.json")
-    pals_i18n_json = JsonManager(
-        f"data/json/l10n/{app_state.settings.language}/pals.json"
+    response = get_reference_data().get_encoded(
+        "pals",
+        app_state.settings.language,
+        lambda data: build_response(MessageType.GET_PALS, data),
     )
-    pals_data = pals_json.read()
-    pals_i18n = pals_i18n_json.read()
+    await send_response(ws, response)
 
-    localized_data = {}
-    for code_name, pal_info in pals_data.items():
-        if code_name in pals_i18n:
-            i18n_data = pals_i18n[code_name]
-            pal_info["localized_name"] = i18n_data.get("localized_name", code_name)
-            pal_info["description"] = i18n_data.get(
-                "description", "No description available"
-            )
-        else:
-            pal_info["localized_name"] = code_name
-            pal_info["description"] = "No description available"
 
-        localized_data[code_name] = pal_info
-
-    response = build_response(MessageType.GET_PALS, localized_data)
-    await ws.send_json(response)
+async def query_pals_handler(message: QueryPalsMessage, ws: WebSocket):
+    query = message.data
+    app_state = get_app_state()
+    save_file = app_state.save_file
+    if not save_file:
+        raise ValueError("No save file loaded")
+
+    total, pals = save_file.search_pals(
+        query.query,
+        offset=query.offset,
+        limit=query.limit,
+        sort=query.sort,
+        descending=query.descending,
+    )
+    data = {
+        "query": query.query,
+        "offset": query.offset,
+        "limit": query.limit,
+        "total": total,
+        "pals": pals,
+    }
+    response = build_response(MessageType.QUERY_PALS, data)
+    await send_response(ws, response)
 
 
 async def add_pal_handler(message: AddPalMessage, ws: WebSocket):
@@ -54,12 +63,13 @@ async def add_pal_handler(message: AddPalMessage, ws: WebSocket):
     app_state = get_app_state()
     save_file = app_state.save_file
     new_pal = save_file.add_pal(player_id, pal_code_name, nickname, container_id)
+    app_state.touch_players([player_id])
     data = {
         "player_id": player_id,
         "pal": new_pal,
     }
     response = build_response(MessageType.ADD_PAL, data)
-    await ws.send_json(response)
+    await send_response(ws, response)
 
 
 async def move_pal_handler(message: MovePalMessage, ws: WebSocket):
@@ -69,6 +79,7 @@ async def move_pal_handler(message: MovePalMessage, ws: WebSocket):
     app_state = get_app_state()
     save_file = app_state.save_file
     pal = save_file.move_pal(player_id, pal_id, container_id)
+    app_state.touch_players([player_id])
     response = {}
     if isinstance(pal, Pal):
         data = {
@@ -80,7 +91,7 @@ async def move_pal_handler(message: MovePalMessage, ws: WebSocket):
         response = build_response(MessageType.MOVE_PAL, data)
     else:
         response = build_response(MessageType.WARNING, "Pal container is full")
-    await ws.send_json(response)
+    await send_response(ws, response)
 
 
 async def clone_pal_handler(message: ClonePalMessage, ws: WebSocket):
@@ -88,12 +99,13 @@ async def clone_pal_handler(message: ClonePalMessage, ws: WebSocket):
     app_state = get_app_state()
     save_file = app_state.save_file
     new_pal = save_file.clone_pal(pal)
+    app_state.touch_players([pal.owner_uid])
     data = {
         "player_id": pal.owner_uid if pal.owner_uid else None,
         "pal": new_pal,
     }
     response = build_response(MessageType.ADD_PAL, data)
-    await ws.send_json(response)
+    await send_response(ws, response)
 
 
 async def delete_pals_handler(message: DeletePalsMessage, _: WebSocket):
@@ -102,6 +114,7 @@ async def delete_pals_handler(message: DeletePalsMessage, _: WebSocket):
     app_state = get_app_state()
     save_file = app_state.save_file
     save_file.delete_pals(player_id, pal_ids)
+    app_state.touch_players([player_id])
 
 
 async def heal_pals_handler(message: HealPalsMessage, _: WebSocket):
@@ -109,3 +122,7 @@ async def heal_pals_handler(message: HealPalsMessage, _: WebSocket):
     app_state = get_app_state()
     save_file = app_state.save_file
     save_file.heal_pals(pal_ids)
+    pals = save_file.get_pals()
+    app_state.touch_players(
+        {pals[pal_id].owner_uid for pal_id in pal_ids if pal_id in pals}
+    )
@@ -0,0 +1,112 @@
+import asyncio
+
+from fastapi import WebSocket
+
+from palworld_save_pal.state import get_app_state
+from palworld_save_pal.ws.messages import (
+    GetPlayerPalsMessage,
+    LoadPlayerMessage,
+    MessageType,
+    SyncPlayersMessage,
+)
+from palworld_save_pal.ws.utils import build_response, send_response
+from palworld_save_pal.utils.logging_config import create_logger
+
+logger = create_logger(__name__)
+
+
+async def send_players(ws: WebSocket):
+    """Send players to the client, as a delta if it has acknowledged a version"""
+    app_state = get_app_state()
+    version = getattr(ws.state, "players_version", None)
+    if version is None:
+        # Client never synced, keep sending the full GET_PLAYERS payload
+        response = build_response(MessageType.GET_PLAYERS, app_state.players)
+    else:
+        changes = app_state.player_changes(version)
+        logger.debug(
+            "Sending %s players (full=%s) since v%s",
+            len(changes["players"]),
+            changes["full"],
+            version,
+        )
+        response = build_response(MessageType.SYNC_PLAYERS, changes)
+        ws.state.players_version = changes["version"]
+    await send_response(ws, response)
+
+
+async def sync_players_handler(message: SyncPlayersMessage, ws: WebSocket):
+    app_state = get_app_state()
+    version = message.data.version if message.data else None
+    changes = app_state.player_changes(version)
+    response = build_response(MessageType.SYNC_PLAYERS, changes)
+    await send_response(ws, response)
+    # Messages on a websocket are delivered in order, so from here on the
+    # client only needs what changed after the version we just sent it.
+    ws.state.players_version = changes["version"]
+
+
+async def get_player_pals_handler(message: GetPlayerPalsMessage, ws: WebSocket):
+    query = message.data
+    app_state = get_app_state()
+    save_file = app_state.save_file
+    if not save_file:
+        raise ValueError("No save file loaded")
+
+    total, pals = save_file.query_player_pals(
+        query.player_id,
+        container_id=query.container_id,
+        offset=query.offset,
+        limit=query.limit,
+        sort=query.sort,
+        descending=query.descending,
+        text=query.filter,
+    )
+    data = {
+        "player_id": query.player_id,
+        "container_id": query.container_id,
+        "offset": query.offset,
+        "limit": query.limit,
+        "total": total,
+        "pals": pals,
+    }
+    response = build_response(MessageType.GET_PLAYER_PALS, data)
+    await send_response(ws, response)
+
+
+async def load_player_handler(message: LoadPlayerMessage, ws: WebSocket):
+    app_state = get_app_state()
+    save_file = app_state.save_file
+    if not save_file:
+        raise ValueError("No save file loaded")
+
+    player_id = message.data.player_id
+    player = save_file.get_players().get(player_id)
+    if player is None:
+        raise ValueError(f"Player {player_id} not found in the save file.")
+    if not player.loaded:
+        player = save_file.load_player(player_id)
+        app_state.touch_players([player_id])
+    response = build_response(MessageType.LOAD_PLAYER, player)
+    await send_response(ws, response)
+
+
+async def prefetch_players(ws: WebSocket):
+    """Parse the remaining lazily listed players without blocking other messages"""
+    app_state = get_app_state()
+    save_file = app_state.save_file
+    loaded = []
+    for player_id in save_file.unloaded_player_ids():
+        if app_state.save_file is not save_file:
+            return
+        try:
+            # Parsed in a worker thread so other messages are served meanwhile
+            await asyncio.to_thread(save_file.load_player, player_id)
+        except Exception as e:
+            logger.warning("Failed to prefetch player %s: %s", player_id, e)
+            continue
+        loaded.append(player_id)
+    logger.info("Prefetched %s players", len(loaded))
+    if loaded:
+        app_state.touch_players(loaded)
+        await send_players(ws)
@@ -1,48 +1,101 @@
 # preset_handler.py
-import uuid
+import time
 from fastapi import WebSocket
 from fastapi.encoders import jsonable_encoder
+from palworld_save_pal.editor.preset_profile import PresetProfile
+from palworld_save_pal.state import get_app_state
+from palworld_save_pal.utils.reference_data import get_reference_data
+from palworld_save_pal.ws.handlers.player_handler import send_players
 from palworld_save_pal.ws.messages import (
     AddPresetMessage,
+    ApplyPresetMessage,
     GetPresetsMessage,
     UpdatePresetMessage,
     DeletePresetMessage,
     MessageType,
 )
-from palworld_save_pal.ws.utils import build_response
+from palworld_save_pal.ws.utils import build_response, send_response
 from palworld_save_pal.utils.logging_config import create_logger
-from palworld_save_pal.utils.json_manager import JsonManager
+from palworld_save_pal.editor.preset_store import get_preset_store
 
 logger = create_logger(__name__)
 
-presets_json = JsonManager("data/json/presets.json")
-
 
 async def add_preset_handler(message: AddPresetMessage, ws: WebSocket):
     preset = message.data
-    presets_json.append(str(uuid.uuid4()), jsonable_encoder(preset))
+    get_preset_store().add(jsonable_encoder(preset))
     response = build_response(MessageType.ADD_PRESET, "Preset added successfully")
-    await ws.send_json(response)
+    await send_response(ws, response)
 
 
 async def get_presets_handler(_: GetPresetsMessage, ws: WebSocket):
-    presets = presets_json.read()
+    presets = get_preset_store().all()
     response = build_response(MessageType.GET_PRESETS, presets)
-    await ws.send_json(response)
+    await send_response(ws, response)
 
 
 async def update_preset_handler(message: UpdatePresetMessage, ws: WebSocket):
     preset_id = message.data.id
     preset_name = message.data.name
-    presets_json.update_name(str(preset_id), preset_name)
+    if not get_preset_store().rename(str(preset_id), preset_name):
+        raise ValueError(f"Preset {preset_id} not found")
     response = build_response(
         MessageType.UPDATE_PRESET, f"{preset_name} updated successfully"
     )
-    await ws.send_json(response)
+    await send_response(ws, response)
 
 
 async def delete_presets_handler(message: DeletePresetMessage, ws: WebSocket):
-    for preset_id in message.data:
-        presets_json.delete(str(preset_id))
+    get_preset_store().delete([str(preset_id) for preset_id in message.data])
     response = build_response(MessageType.DELETE_PRESET, "Preset deleted successfully")
-    await ws.send_json(response)
+    await send_response(ws, response)
+
+
+async def apply_preset_handler(message: ApplyPresetMessage, ws: WebSocket):
+
+    async def ws_callback(message: str):
+        response = build_response(MessageType.PROGRESS_MESSAGE, message)
+        await send_response(ws, response)
+
+    app_state = get_app_state()
+    save_file = app_state.save_file
+    if not save_file:
+        raise ValueError("No save file loaded")
+
+    data = message.data
+    preset_data = get_preset_store().get(str(data.preset_id))
+    if preset_data is None:
+        raise ValueError(f"Preset {data.preset_id} not found")
+    preset = PresetProfile(**preset_data)
+
+    start = time.perf_counter()
+    if preset.type == "inventory":
+        players = save_file.find_players(data.player_ids, data.guild_id, data.all_players)
+        items = get_reference_data().get("items", app_state.settings.language)
+        await ws_callback(f"Applying {preset.name} to {len(players)} players")
+        await save_file.apply_inventory(
+            players, preset.container_slots(items), ws_callback
+        )
+        changed_player_ids = {player.uid for player in players}
+        result = {"players": len(players), "pals": 0}
+    elif preset.type in ("active_skills", "passive_skills"):
+        skills = preset.skills or []
+        await ws_callback(f"Applying {preset.name} to {len(data.pal_ids or [])} pals")
+        pals = await save_file.apply_pal_skills(
+            data.pal_ids or [],
+            active_skills=skills if preset.type == "active_skills" else None,
+            passive_skills=skills if preset.type == "passive_skills" else None,
+            ws_callback=ws_callback,
+        )
+        changed_player_ids = {pal.owner_uid for pal in pals}
+        result = {"players": 0, "pals": len(pals)}
+    else:
+        raise ValueError(f"Unsupported preset type {preset.type}")
+    logger.info(
+        "Applied preset %s in %.3fs", preset.name, time.perf_counter() - start
+    )
+
+    app_state.touch_players(changed_player_ids)
+    response = build_response(MessageType.APPLY_PRESET, result)
+    await send_response(ws, response)
+    await send_players(ws)
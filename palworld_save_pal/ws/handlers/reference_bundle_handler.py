@@ -0,0 +1,37 @@
+from fastapi import WebSocket
+
+from palworld_save_pal.state import get_app_state
+from palworld_save_pal.utils.logging_config import create_logger
+from palworld_save_pal.utils.reference_bundle import BUNDLE_DATASETS, get_bundle_store
+from palworld_save_pal.web.bundles import bundle_url
+from palworld_save_pal.ws.messages import GetReferenceBundleMessage, MessageType
+from palworld_save_pal.ws.utils import build_response, send_response
+
+logger = create_logger(__name__)
+
+
+async def get_reference_bundle_handler(
+    message: GetReferenceBundleMessage, ws: WebSocket
+):
+    language = (
+        message.data.language
+        if message.data and message.data.language
+        else get_app_state().settings.language
+    )
+    bundle = get_bundle_store().get(language)
+    if bundle is None:
+        response = build_response(
+            MessageType.ERROR, f"No reference data for language {language}"
+        )
+        await send_response(ws, response)
+        return
+
+    data = {
+        "language": bundle.language,
+        "version": bundle.version,
+        "url": bundle_url(bundle),
+        "datasets": BUNDLE_DATASETS,
+        "size": len(bundle.content),
+    }
+    response = build_response(MessageType.GET_REFERENCE_BUNDLE, data)
+    await send_response(ws, response)
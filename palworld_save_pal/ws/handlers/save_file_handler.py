@@ -1,16 +1,20 @@
+import asyncio
 import base64
 import io
 import os
 import uuid
 import zipfile
 from fastapi import WebSocket
+from palworld_save_pal.game.save_validator import Severity
 from palworld_save_pal.ws.messages import (
     DownloadSaveFileMessage,
     MessageType,
     UpdateSaveFileMessage,
     LoadZipFileMessage,
+    ValidateSaveMessage,
 )
-from palworld_save_pal.ws.utils import build_response
+from palworld_save_pal.ws.handlers.player_handler import send_players
+from palworld_save_pal.ws.utils import build_response, send_response
 from palworld_save_pal.state import get_app_state
 from palworld_save_pal.utils.logging_config import create_logger
 
@@ -21,7 +25,7 @@ async def update_save_file_handler(message: UpdateSaveFileMessage, ws: WebSocket
 
     async def ws_callback(message: str):
         response = build_response(MessageType.PROGRESS_MESSAGE, message)
-        await ws.send_json(response)
+        await send_response(ws, response)
 
     modified_pals = message.data.modified_pals if message.data.modified_pals else None
     modified_players = (
@@ -33,23 +37,26 @@ async def update_save_file_handler(message: UpdateSaveFileMessage, ws: WebSocket
     if not save_file:
         raise ValueError("No save file loaded")
 
+    changed_player_ids = set()
     if modified_pals:
         await save_file.update_pals(modified_pals, ws_callback)
+        changed_player_ids.update(pal.owner_uid for pal in modified_pals.values())
     if modified_players:
         await save_file.update_players(modified_players, ws_callback)
+        changed_player_ids.update(modified_players.keys())
 
     app_state.players = save_file.get_players()
+    app_state.touch_players(changed_player_ids)
     response = build_response(MessageType.UPDATE_SAVE_FILE, "Changes saved")
-    await ws.send_json(response)
-    response = build_response(MessageType.GET_PLAYERS, app_state.players)
-    await ws.send_json(response)
+    await send_response(ws, response)
+    await send_players(ws)
 
 
 async def download_save_file_handler(_: DownloadSaveFileMessage, ws: WebSocket):
 
     async def ws_callback(message: str):
         response = build_response(MessageType.PROGRESS_MESSAGE, message)
-        await ws.send_json(response)
+        await send_response(ws, response)
 
     app_state = get_app_state()
     save_file = app_state.save_file
@@ -65,14 +72,14 @@ async def download_save_file_handler(_: DownloadSaveFileMessage, ws: WebSocket):
         "content": encoded_data,
     }
     response = build_response(MessageType.DOWNLOAD_SAVE_FILE, data)
-    await ws.send_json(response)
+    await send_response(ws, response)
 
 
 async def load_zip_file_handler(message: LoadZipFileMessage, ws: WebSocket):
 
     async def ws_callback(message: str):
         response = build_response(MessageType.PROGRESS_MESSAGE, message)
-        await ws.send_json(response)
+        await send_response(ws, response)
 
     app_state = get_app_state()
     zip_data = bytes(message.data)
@@ -126,7 +133,28 @@ async def load_zip_file_handler(message: LoadZipFileMessage, ws: WebSocket):
     )
 
     response = build_response(MessageType.LOAD_ZIP_FILE, data)
-    await ws.send_json(response)
+    await send_response(ws, response)
 
-    response = build_response(MessageType.GET_PLAYERS, app_state.players)
-    await ws.send_json(response)
+    await send_players(ws)
+
+
+async def validate_save_handler(message: ValidateSaveMessage, ws: WebSocket):
+    app_state = get_app_state()
+    save_file = app_state.save_file
+    if not save_file:
+        raise ValueError("No save file loaded")
+
+    # One pass over the whole world, kept off the event loop
+    report = await asyncio.to_thread(save_file.validate)
+    issues = report.issues
+    if message.data and message.data.errors_only:
+        issues = [issue for issue in issues if issue.severity == Severity.ERROR]
+    data = {
+        "ok": report.ok,
+        "counts": report.counts(),
+        "checked": report.checked,
+        "seconds": report.seconds,
+        "issues": issues,
+    }
+    response = build_response(MessageType.VALIDATE_SAVE, data)
+    await send_response(ws, response)
@@ -3,7 +3,7 @@ from fastapi.encoders import jsonable_encoder
 from palworld_save_pal.editor.settings import Settings
 from palworld_save_pal.state import get_app_state
 from palworld_save_pal.ws.messages import MessageType, UpdateSettingsMessage
-from palworld_save_pal.ws.utils import build_response
+from palworld_save_pal.ws.utils import build_response, send_response
 from palworld_save_pal.utils.logging_config import create_logger
 from palworld_save_pal.utils.json_manager import JsonManager
 
@@ -20,11 +20,11 @@ async def get_settings_handler(_: dict, ws: WebSocket):
         settings_json.write(settings)
 
     response = build_response(MessageType.GET_SETTINGS, settings)
-    await ws.send_json(response)
+    await send_response(ws, response)
 
 
 async def update_settings_handler(message: UpdateSettingsMessage, ws: WebSocket):
     app_state.settings = message.data
     settings_json.write(jsonable_encoder(app_state.settings))
     response = build_response(MessageType.GET_SETTINGS, app_state.settings)
-    await ws.send_json(response)
+    await send_response(ws, response)
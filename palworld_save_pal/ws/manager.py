@@ -4,7 +4,7 @@ import traceback
 from fastapi import WebSocket
 
 from palworld_save_pal.ws.dispatcher import create_dispatcher
-from palworld_save_pal.ws.utils import build_response
+from palworld_save_pal.ws.utils import build_response, send_response
 from palworld_save_pal.ws.messages import MessageType
 from palworld_save_pal.utils.logging_config import create_logger
 
@@ -38,7 +38,7 @@ class ConnectionManager:
             response = build_response(
                 MessageType.ERROR, f"Invalid JSON received:\n{exception}"
             )
-            await websocket.send_json(response)
+            await send_response(websocket, response)
         except Exception as e:
             logger.exception("Error processing message: %s", str(e))
             exception = traceback.format_exc()
@@ -47,4 +47,4 @@ class ConnectionManager:
                 "trace": exception,
             }
             response = build_response(MessageType.ERROR, data)
-            await websocket.send_json(response)
+            await send_response(websocket, response)
@@ -1,6 +1,6 @@
 from enum import Enum
 from typing import Any, Dict, List, Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from uuid import UUID
 
 from palworld_save_pal.editor.preset_profile import PresetProfile
@@ -9,6 +9,10 @@ from palworld_save_pal.game.pal import Pal
 from palworld_save_pal.game.player import Player
 
 
+# Largest page of pals a client can request at once
+MAX_PAGE_SIZE = 1000
+
+
 class BaseMessage(BaseModel):
     type: str
     data: None = None
@@ -48,6 +52,19 @@ class MessageType(str, Enum):
     UPDATE_SETTINGS = "update_settings"
     GET_UI_COMMON = "get_ui_common"
     NO_FILE_SELECTED = "no_file_selected"
+    SYNC_PLAYERS = "sync_players"
+    GET_PLAYER_PALS = "get_player_pals"
+    NEGOTIATE_COMPRESSION = "negotiate_compression"
+    GET_REFERENCE_BUNDLE = "get_reference_bundle"
+    APPLY_PRESET = "apply_preset"
+    LIST_BACKUPS = "list_backups"
+    RESTORE_BACKUP = "restore_backup"
+    PRUNE_BACKUPS = "prune_backups"
+    WATCH_SAVE = "watch_save"
+    SAVE_CHANGED = "save_changed"
+    LOAD_PLAYER = "load_player"
+    QUERY_PALS = "query_pals"
+    VALIDATE_SAVE = "validate_save"
 
 
 class AddPalData(BaseModel):
@@ -117,6 +134,101 @@ class SyncAppStateMessage(BaseMessage):
     data: None = None
 
 
+class SyncPlayersData(BaseModel):
+    version: Optional[int] = None
+
+
+class SyncPlayersMessage(BaseMessage):
+    type: str = MessageType.SYNC_PLAYERS.value
+    data: Optional[SyncPlayersData] = None
+
+
+class GetPlayerPalsData(BaseModel):
+    player_id: UUID
+    container_id: Optional[UUID] = None
+    offset: int = Field(default=0, ge=0)
+    limit: int = Field(default=100, ge=1, le=MAX_PAGE_SIZE)
+    sort: str = "slot"
+    descending: bool = False
+    filter: Optional[str] = None
+
+
+class GetPlayerPalsMessage(BaseMessage):
+    type: str = MessageType.GET_PLAYER_PALS.value
+    data: GetPlayerPalsData
+
+
+class QueryPalsData(BaseModel):
+    query: str
+    offset: int = Field(default=0, ge=0)
+    limit: int = Field(default=100, ge=1, le=MAX_PAGE_SIZE)
+    sort: str = "level"
+    descending: bool = False
+
+
+class QueryPalsMessage(BaseMessage):
+    type: str = MessageType.QUERY_PALS.value
+    data: QueryPalsData
+
+
+class ValidateSaveData(BaseModel):
+    # Leave out warnings, only report errors
+    errors_only: bool = False
+
+
+class ValidateSaveMessage(BaseMessage):
+    type: str = MessageType.VALIDATE_SAVE.value
+    data: Optional[ValidateSaveData] = None
+
+
+class NegotiateCompressionData(BaseModel):
+    algorithms: List[str]
+    threshold: Optional[int] = None
+    dictionary: bool = False
+
+
+class NegotiateCompressionMessage(BaseMessage):
+    type: str = MessageType.NEGOTIATE_COMPRESSION.value
+    data: NegotiateCompressionData
+
+
+class GetReferenceBundleData(BaseModel):
+    language: Optional[str] = None
+
+
+class GetReferenceBundleMessage(BaseMessage):
+    type: str = MessageType.GET_REFERENCE_BUNDLE.value
+    data: Optional[GetReferenceBundleData] = None
+
+
+class ListBackupsData(BaseModel):
+    source: Optional[str] = None
+
+
+class ListBackupsMessage(BaseMessage):
+    type: str = MessageType.LIST_BACKUPS.value
+    data: Optional[ListBackupsData] = None
+
+
+class RestoreBackupData(BaseModel):
+    id: str
+
+
+class RestoreBackupMessage(BaseMessage):
+    type: str = MessageType.RESTORE_BACKUP.value
+    data: RestoreBackupData
+
+
+class PruneBackupsData(BaseModel):
+    keep: int
+    source: Optional[str] = None
+
+
+class PruneBackupsMessage(BaseMessage):
+    type: str = MessageType.PRUNE_BACKUPS.value
+    data: PruneBackupsData
+
+
 class ProgressMessage(BaseMessage):
     type: str = MessageType.PROGRESS_MESSAGE.value
     data: str
@@ -151,6 +263,19 @@ class DeletePresetMessage(BaseMessage):
     data: List[UUID]
 
 
+class ApplyPresetData(BaseModel):
+    preset_id: UUID
+    player_ids: Optional[List[UUID]] = None
+    guild_id: Optional[UUID] = None
+    all_players: bool = False
+    pal_ids: Optional[List[UUID]] = None
+
+
+class ApplyPresetMessage(BaseMessage):
+    type: str = MessageType.APPLY_PRESET.value
+    data: ApplyPresetData
+
+
 class GetActiveSkillsMessage(BaseModel):
     type: str = MessageType.GET_ACTIVE_SKILLS.value
 
@@ -184,6 +309,8 @@ class SelectSaveMessageData(BaseModel):
     type: str
     path: str
     local: bool
+    lazy: bool = False
+    prefetch: bool = False
 
 
 class SelectSaveMessage(BaseMessage):
@@ -191,6 +318,25 @@ class SelectSaveMessage(BaseMessage):
     data: SelectSaveMessageData
 
 
+class LoadPlayerData(BaseModel):
+    player_id: UUID
+
+
+class LoadPlayerMessage(BaseMessage):
+    type: str = MessageType.LOAD_PLAYER.value
+    data: LoadPlayerData
+
+
+class WatchSaveData(BaseModel):
+    enabled: bool
+    interval: Optional[float] = None
+
+
+class WatchSaveMessage(BaseMessage):
+    type: str = MessageType.WATCH_SAVE.value
+    data: WatchSaveData
+
+
 class SaveModdedSaveMessage(BaseMessage):
     type: str = MessageType.SAVE_MODDED_SAVE.value
 
@@ -1,8 +1,20 @@
 from typing import Any
-from fastapi.encoders import jsonable_encoder
 
+from fastapi import WebSocket
+
+from palworld_save_pal.utils.serialization import dumps
 from palworld_save_pal.ws.messages import MessageType
 
 
-def build_response(message_type: MessageType, data: Any = None):
-    return jsonable_encoder({"type": message_type.value, "data": data})
+def build_response(message_type: MessageType, data: Any = None) -> bytes:
+    return dumps({"type": message_type.value, "data": data})
+
+
+async def send_response(ws: WebSocket, response: bytes):
+    # Clients that negotiated compression get large messages as binary frames
+    # holding a zstd frame of the same JSON payload.
+    compressor = getattr(ws.state, "compressor", None)
+    if compressor is not None and compressor.should_compress(response):
+        await ws.send_bytes(compressor.compress(response))
+    else:
+        await ws.send_text(response.decode("utf-8"))
@@ -1,11 +1,13 @@
 import argparse
+import asyncio
+from contextlib import asynccontextmanager
 from pathlib import Path
 import multiprocessing
-from urllib.parse import quote
 
 import uvicorn
 from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect
-from fastapi.responses import FileResponse, RedirectResponse
+from palworld_save_pal.web import bundles
+from palworld_save_pal.web.static_assets import get_static_assets, serve_static_files
 from palworld_save_pal.ws.manager import ConnectionManager
 
 from palworld_save_pal.utils.logging_config import create_logger, setup_logging
@@ -15,33 +17,27 @@ PORT = 5174
 logger = create_logger(__name__)
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Index and precompress the UI before serving instead of on the first request
+    await asyncio.to_thread(get_static_assets().load)
+    yield
+
+
 # Initialize the FastAPI app
-app = FastAPI(swagger_ui_parameters={"syntaxHighlight.theme": "monokai"})
+app = FastAPI(
+    lifespan=lifespan, swagger_ui_parameters={"syntaxHighlight.theme": "monokai"}
+)
 
 manager = ConnectionManager()
+app.include_router(bundles.router)
 
 
 @app.middleware("http")
 async def static_files_middleware(request: Request, call_next):
-    path = request.url.path
-    if path.startswith("/ws"):
-        response = await call_next(request)
-        return response
-
-    file_path = Path("ui") / path.lstrip("/")
-    if file_path.is_dir():
-        index_path = file_path / "index.html"
-        if index_path.is_file():
-            return FileResponse(index_path)
-    elif file_path.is_file():
-        return FileResponse(file_path)
-
-    # If no static file matches the requested path, redirect to the root path with the
-    # original URL as a query parameter. This is to handle client-side routing in the SPA.
-    if path != "/":
-        encoded_path = quote(path)
-        return RedirectResponse(url=f"/?path={encoded_path}")
-    return await call_next(request)
+    return await serve_static_files(
+        request, call_next, passthrough=("/ws", bundles.BUNDLE_PATH)
+    )
 
 
 @app.websocket("/ws/{client_id}")
@@ -0,0 +1,104 @@
+import hashlib
+
+import pytest
+
+from palworld_save_tools.palsav import compress_gvas_to_sav, decompress_sav_to_gvas
+
+from palworld_save_pal.game.world_generator import generate_world
+from palworld_save_pal.utils.backup_store import BackupStore, split_chunks
+
+
+@pytest.fixture
+def store(tmp_path):
+    return BackupStore(root=str(tmp_path / "store"))
+
+
+def write_world(directory, seed=1):
+    return generate_world(players=1, pals=100, items=5, seed=seed).write(str(directory))
+
+
+def test_snapshot_restore_round_trip(tmp_path, store):
+    level_sav = write_world(tmp_path / "world")
+    with open(level_sav, "rb") as f:
+        original = f.read()
+    snapshot = store.snapshot(level_sav)
+
+    with open(level_sav, "wb") as f:
+        f.write(b"overwritten")
+    assert store.restore(snapshot.id) == snapshot.source
+
+    with open(level_sav, "rb") as f:
+        restored = f.read()
+    assert decompress_sav_to_gvas(restored) == decompress_sav_to_gvas(original)
+
+
+def test_similar_saves_share_chunks(tmp_path, store):
+    level_sav = write_world(tmp_path / "world")
+    first = store.snapshot(level_sav)
+
+    with open(level_sav, "rb") as f:
+        raw_gvas, save_type = decompress_sav_to_gvas(f.read())
+    edited = bytearray(raw_gvas)
+    middle = len(edited) // 2
+    edited[middle] ^= 0xFF
+    with open(level_sav, "wb") as f:
+        f.write(compress_gvas_to_sav(bytes(edited), save_type))
+    second = store.snapshot(level_sav)
+
+    shared = set(first.chunks) & set(second.chunks)
+    assert len(shared) == len(second.chunks) - 1
+    assert 0 < second.stored_size < first.stored_size / 4
+    assert store.read_gvas(second) == bytes(edited)
+
+
+def chunk_hashes(data: bytes, **kwargs):
+    return [
+        hashlib.blake2b(chunk, digest_size=20).hexdigest()
+        for chunk in split_chunks(data, **kwargs)
+    ]
+
+
+def test_insertion_reuses_most_chunks():
+    world = generate_world(players=2, pals=300, items=20, seed=3)
+    raw_gvas, _ = decompress_sav_to_gvas(world.level_sav)
+    sizes = {"min_size": 4 * 1024, "max_size": 64 * 1024}
+    before = chunk_hashes(raw_gvas, **sizes)
+
+    # Duplicate a stretch mid-stream, like a pal added to the middle of a map
+    middle = len(raw_gvas) // 2
+    edited = raw_gvas[:middle] + raw_gvas[middle : middle + 3000] + raw_gvas[middle:]
+    after = chunk_hashes(edited, **sizes)
+
+    assert len(before) >= 10
+    new = [digest for digest in after if digest not in set(before)]
+    assert len(new) <= 2
+    assert b"".join(split_chunks(edited, **sizes)) == edited
+
+
+def test_prune_keeps_newest_per_world(tmp_path, store):
+    worlds = [write_world(tmp_path / "a", seed=1), write_world(tmp_path / "b", seed=2)]
+    for _ in range(3):
+        for level_sav in worlds:
+            store.snapshot(level_sav)
+    newest = {level_sav: store.list(level_sav)[0].id for level_sav in worlds}
+
+    result = store.prune(keep=1)
+
+    assert result["snapshots"] == 4
+    for level_sav in worlds:
+        assert [s.id for s in store.list(level_sav)] == [newest[level_sav]]
+    assert len(store.list()) == 2
+    assert store.stats()["snapshots"] == 2
+
+
+def test_prune_one_world_leaves_others(tmp_path, store):
+    a = write_world(tmp_path / "a", seed=1)
+    b = write_world(tmp_path / "b", seed=2)
+    for _ in range(2):
+        store.snapshot(a)
+        store.snapshot(b)
+
+    store.prune(keep=1, source=a)
+
+    assert len(store.list(a)) == 1
+    assert len(store.list(b)) == 2
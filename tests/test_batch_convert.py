@@ -0,0 +1,43 @@
+import os
+
+from palworld_save_pal.game.world_generator import generate_world
+from palworld_save_pal.utils.batch_convert import convert_files, find_save_files
+
+
+def write_world(directory, seed, pals=5):
+    return generate_world(players=1, pals=pals, items=5, seed=seed).write(
+        str(directory)
+    )
+
+
+def test_rerun_converts_only_changed_world(tmp_path):
+    worlds = tmp_path / "worlds"
+    changed = write_world(worlds / "a", seed=1)
+    write_world(worlds / "b", seed=2)
+    files = find_save_files(str(worlds))
+    summary_path = str(tmp_path / "summary.json")
+
+    summary = convert_files(files, summary_path, jobs=1)
+    assert summary.failed == 0
+    assert summary.converted == len(files) == 4
+    assert all(os.path.exists(f"{source}.json") for source in files)
+
+    summary = convert_files(files, summary_path, jobs=1)
+    assert (summary.converted, summary.skipped) == (0, 4)
+
+    previous = summary.files
+    world_a = [source for source in files if source.startswith(str(worlds / "a"))]
+    before = os.stat(changed)
+    write_world(worlds / "a", seed=1, pals=6)
+    # Keep the mtime moving on filesystems with coarse timestamps
+    for source in world_a:
+        stat = os.stat(source)
+        os.utime(source, ns=(stat.st_atime_ns, before.st_mtime_ns + 10**9))
+    summary = convert_files(files, summary_path, jobs=1)
+
+    assert (summary.converted, summary.skipped, summary.failed) == (2, 2, 0)
+    reconverted = [
+        source for source in files if summary.files[source] != previous[source]
+    ]
+    assert reconverted == world_a
+    assert summary.files[os.path.abspath(changed)].size == os.path.getsize(changed)
@@ -0,0 +1,26 @@
+from palworld_save_pal.editor.batch_edit import edit_world, find_worlds
+from palworld_save_pal.game.save_file import SaveFile
+from palworld_save_pal.game.world_generator import generate_world
+from palworld_save_pal.utils.file_manager import FileManager
+
+
+def test_edit_world_adds_pal_to_generated_world(tmp_path):
+    world = generate_world(players=1, pals=3, items=5, seed=7)
+    world.write(str(tmp_path))
+    player_id = next(iter(world.player_savs))
+    script = {
+        "operations": [
+            {"op": "add_pal", "player_id": str(player_id), "pal_code_name": "PinkCat"}
+        ]
+    }
+
+    assert find_worlds(str(tmp_path)) == [str(tmp_path)]
+    result = edit_world(str(tmp_path), script, backup=False)
+
+    assert result.ok, result.errors
+    assert result.applied == 1 and result.written
+    save_file = SaveFile().load_sav_files(
+        (tmp_path / "Level.sav").read_bytes(),
+        FileManager.get_player_saves(str(tmp_path / "Players")),
+    )
+    assert save_file.pal_count() == 4
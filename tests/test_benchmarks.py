@@ -0,0 +1,146 @@
+"""Benchmarks of the load, edit and save hot paths on a synthetic world.
+
+Needs pytest-benchmark, the module is skipped without it. Record a
+baseline once, then compare later runs against it:
+
+    pytest tests/test_benchmarks.py --benchmark-autosave
+    pytest tests/test_benchmarks.py --benchmark-compare --benchmark-compare-fail=mean:15%
+
+Baselines are kept per machine under .benchmarks/. The world is built
+once per session at a fixed size, so runs stay comparable.
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from convert import SaveComparison
+from palworld_save_pal.game.item_container import ItemContainer, ItemContainerType
+from palworld_save_pal.game.save_file import SaveFile
+from palworld_save_pal.game.world_generator import generate_world
+from palworld_save_pal.ws.messages import MessageType
+from palworld_save_pal.ws.utils import build_response
+
+PLAYERS = 4
+PALS = 1000
+ITEMS = 40
+# Rounds for benchmarks that re-encode the whole world
+HEAVY_ROUNDS = 3
+# Player.add_pal and clone_pal rounds, each takes a free pal box slot
+EDIT_ROUNDS = 20
+
+
+@pytest.fixture(scope="module")
+def world():
+    return generate_world(players=PLAYERS, pals=PALS, items=ITEMS, seed=0)
+
+
+def load(world) -> SaveFile:
+    return SaveFile(name="benchmark").load_sav_files(
+        world.level_sav, dict(world.player_savs)
+    )
+
+
+@pytest.fixture
+def save_file(world):
+    return load(world)
+
+
+@pytest.fixture
+def player(save_file):
+    return next(iter(save_file.get_players().values()))
+
+
+def test_load_sav_files(benchmark, world):
+    save_file = benchmark.pedantic(load, args=(world,), rounds=HEAVY_ROUNDS)
+    assert save_file.pal_count() == PALS
+
+
+def test_load_players(benchmark, world, save_file):
+    benchmark(save_file._load_players, dict(world.player_savs))
+    assert len(save_file.get_players()) == PLAYERS
+
+
+def test_item_container_load(benchmark, save_file, player):
+    def load_container():
+        return ItemContainer(
+            id=player.common_container.id,
+            type=ItemContainerType.COMMON,
+            item_container_save_data=save_file._item_container_save_data,
+            dynamic_item_save_data=save_file._dynamic_item_save_data,
+        )
+
+    container = benchmark(load_container)
+    assert len(container.slots) == ITEMS
+
+
+def test_item_container_update(benchmark, player):
+    container = player.common_container
+    slots = {"slots": [slot.model_dump() for slot in container.slots]}
+
+    benchmark(container.update_from, slots)
+    assert len(container.slots) == ITEMS
+
+
+def test_player_add_pal(benchmark, player):
+    result = benchmark.pedantic(
+        player.add_pal,
+        args=("SheepBall", "Benchmark", player.pal_box_id),
+        rounds=EDIT_ROUNDS,
+    )
+    assert result is not None
+
+
+def test_player_clone_pal(benchmark, player):
+    pal = next(iter(player.pals.values()))
+
+    clone = benchmark.pedantic(player.clone_pal, args=(pal,), rounds=EDIT_ROUNDS)
+    assert clone is not None
+
+
+def test_player_delete_pal(benchmark, player):
+    def setup():
+        pal, _ = player.add_pal("SheepBall", "Benchmark", player.pal_box_id)
+        return (pal.instance_id,), {}
+
+    benchmark.pedantic(player.delete_pal, setup=setup, rounds=EDIT_ROUNDS)
+
+
+def test_sav(benchmark, save_file):
+    data = benchmark.pedantic(save_file.sav, rounds=HEAVY_ROUNDS)
+    assert data
+
+
+def test_get_json(benchmark, save_file):
+    data = benchmark.pedantic(save_file.get_json, rounds=HEAVY_ROUNDS)
+    assert data
+
+
+def test_build_response_encode(benchmark, save_file):
+    players = save_file.get_players()
+
+    response = benchmark.pedantic(
+        build_response, args=(MessageType.GET_PLAYERS, players), rounds=HEAVY_ROUNDS
+    )
+    size_mb = len(response) / (1024 * 1024)
+    benchmark.extra_info["size_mb"] = round(size_mb, 2)
+    # No stats are collected under --benchmark-disable
+    if benchmark.stats:
+        benchmark.extra_info["ms_per_mb"] = round(
+            benchmark.stats.stats.mean / size_mb * 1000, 1
+        )
+
+
+def test_convert_compare(benchmark, world, save_file, tmp_path):
+    modified = load(world)
+    player = next(iter(modified.get_players().values()))
+    modified.add_pal(player.uid, "PinkCat", "Benchmark", player.pal_box_id)
+    modified.delete_pals(player.uid, [next(iter(player.pals))])
+
+    def compare():
+        comparison = SaveComparison(save_file.dump(), modified.dump(), str(tmp_path))
+        comparison.compare()
+        return comparison
+
+    comparison = benchmark.pedantic(compare, rounds=HEAVY_ROUNDS)
+    assert comparison.differences["CharacterSaveParameterMap"]["Added"]
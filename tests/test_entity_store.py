@@ -0,0 +1,115 @@
+import asyncio
+import json
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+from palworld_save_pal.editor.settings import Settings
+from palworld_save_pal.game.player import Player
+from palworld_save_pal.state import AppState
+from palworld_save_pal.utils.entity_store import EntityStore
+from palworld_save_pal.ws.handlers import player_handler
+from palworld_save_pal.ws.messages import SyncPlayersData, SyncPlayersMessage
+
+
+def test_mutations_bump_the_version():
+    store = EntityStore()
+    assert store.reset({"a": 1, "b": 2}) == 1
+    assert store.touch(["a"]) == 2
+    # Unknown keys are not changes
+    assert store.touch(["missing"]) == 2
+    assert store.put("c", 3) == 3
+    assert store.remove("b") == 4
+    assert store.remove("b") == 4
+
+
+def test_changes_since_a_version():
+    store = EntityStore()
+    store.reset({"a": 1, "b": 2})
+    start = store.version
+    store.touch(["a"])
+    middle = store.version
+    store.put("c", 3)
+
+    changes = store.changes_since(start)
+    assert not changes.full
+    assert changes.entities == {"a": 1, "c": 3}
+    assert store.changes_since(middle).entities == {"c": 3}
+    assert store.changes_since(store.version).entities == {}
+
+
+def test_changes_report_deletions():
+    store = EntityStore()
+    store.reset({"a": 1, "b": 2})
+    start = store.version
+    store.remove("a")
+
+    changes = store.changes_since(start)
+    assert changes.removed == ["a"] and changes.entities == {}
+    # Touching a removed key again does not resurrect it
+    store.touch(["a"])
+    assert store.changes_since(start).removed == ["a"]
+    # Putting it back does, and it is no longer reported as removed
+    store.put("a", 10)
+    changes = store.changes_since(start)
+    assert changes.entities == {"a": 10} and changes.removed == []
+
+
+@pytest.mark.parametrize("version", [None, -1, 0, 99])
+def test_unknown_versions_get_a_snapshot(version):
+    store = EntityStore()
+    store.reset({"a": 1})
+    store.reset({"b": 2})
+    changes = store.changes_since(version)
+    assert changes.full and changes.entities == {"b": 2}
+    assert changes.version == store.version
+
+
+class FakeWebSocket:
+    def __init__(self):
+        self.state = SimpleNamespace()
+        self.sent = []
+
+    async def send_text(self, text: str):
+        self.sent.append(json.loads(text))
+
+
+def test_players_sync_as_deltas_after_the_first_sync(monkeypatch):
+    first, second = uuid.UUID(int=1), uuid.UUID(int=2)
+    players = {
+        uid: Player(uid=uid, nickname=str(uid), level=1, exp=0)
+        for uid in (first, second)
+    }
+    app_state = AppState(settings=Settings(language="en"))
+    app_state.players = players
+    app_state._player_store.reset(players)
+    monkeypatch.setattr(player_handler, "get_app_state", lambda: app_state)
+    ws = FakeWebSocket()
+
+    async def run():
+        # Clients that never synced keep getting the full player list
+        await player_handler.send_players(ws)
+        assert ws.sent[-1]["type"] == "get_players"
+
+        await player_handler.sync_players_handler(
+            SyncPlayersMessage(data=SyncPlayersData()), ws
+        )
+        full = ws.sent[-1]["data"]
+        assert full["full"] and len(full["players"]) == 2
+
+        app_state.touch_players([first])
+        await player_handler.send_players(ws)
+        delta = ws.sent[-1]["data"]
+        assert not delta["full"]
+        assert list(delta["players"]) == [str(first)]
+        assert delta["version"] > full["version"]
+
+        app_state.players.pop(second)
+        app_state.remove_players([second])
+        await player_handler.send_players(ws)
+        delta = ws.sent[-1]["data"]
+        assert delta["players"] == {} and delta["removed"] == [str(second)]
+        assert ws.state.players_version == delta["version"]
+
+    asyncio.run(run())
@@ -0,0 +1,49 @@
+import io
+import math
+import uuid
+
+import pytest
+from palworld_save_tools.archive import UUID
+from palworld_save_tools.palsav import compress_gvas_to_sav, decompress_sav_to_gvas
+
+from palworld_save_pal.game.save_file import SaveFile
+from palworld_save_pal.utils.gvas_bin import MAGIC, dump_bin, load_bin
+
+from test_json_import import make_gvas
+
+
+@pytest.mark.parametrize("compress", [True, False])
+def test_bin_keeps_types(compress):
+    archive_id = UUID(uuid.uuid4().bytes)
+    plain_id = uuid.uuid4()
+    tree = {"ids": [archive_id, plain_id], "raw": b"\x00\xff", "nan": float("nan")}
+    f = io.BytesIO()
+
+    dump_bin(tree, f, compress=compress)
+    f.seek(0)
+    loaded = load_bin(f)
+
+    assert loaded["ids"] == [archive_id, plain_id]
+    assert type(loaded["ids"][0]) is UUID and type(loaded["ids"][1]) is uuid.UUID
+    assert loaded["raw"] == b"\x00\xff"
+    assert math.isnan(loaded["nan"])
+
+
+def test_bin_refuses_other_classes():
+    payload = MAGIC + bytes([1, 0]) + b"cos\nsystem\n(S'true'\ntR."
+
+    with pytest.raises(ValueError):
+        load_bin(io.BytesIO(payload))
+
+
+def test_bin_file_round_trips_to_sav(tmp_path):
+    raw_gvas = make_gvas()
+    sav_path = tmp_path / "Level.sav"
+    sav_path.write_bytes(compress_gvas_to_sav(raw_gvas, 0x32))
+    bin_path = tmp_path / "Level.sav.bin"
+    SaveFile().load_level_sav(sav_path.read_bytes()).to_bin_file(str(bin_path))
+    output_path = tmp_path / "Level.back.sav"
+
+    SaveFile().load_bin(bin_path.read_bytes()).to_sav_file(str(output_path))
+
+    assert decompress_sav_to_gvas(output_path.read_bytes()) == (raw_gvas, 0x32)
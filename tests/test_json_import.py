@@ -0,0 +1,82 @@
+import uuid
+
+from palworld_save_tools.archive import UUID
+from palworld_save_tools.gvas import GvasFile
+from palworld_save_tools.palsav import compress_gvas_to_sav, decompress_sav_to_gvas
+
+from palworld_save_pal.game.json_import import json_file_to_sav
+from palworld_save_pal.game.save_file import CUSTOM_PROPERTIES, SaveFile
+
+HEADER = {
+    "magic": 1396790855,
+    "save_game_version": 3,
+    "package_file_version_ue4": 522,
+    "package_file_version_ue5": 1008,
+    "engine_version_major": 5,
+    "engine_version_minor": 1,
+    "engine_version_patch": 1,
+    "engine_version_changelist": 0,
+    "engine_version_branch": "++UE5+Release-5.1",
+    "custom_version_format": 3,
+    "custom_versions": [],
+    "save_game_class_name": "/Script/Pal.PalWorldSaveGame",
+}
+
+
+def int_property(value):
+    return {"id": None, "value": value, "type": "IntProperty"}
+
+
+def struct_property(struct_type, value):
+    return {
+        "struct_type": struct_type,
+        "struct_id": UUID(b"\0" * 16),
+        "id": None,
+        "value": value,
+        "type": "StructProperty",
+    }
+
+
+def make_gvas() -> bytes:
+    things = {
+        "key_type": "StructProperty",
+        "value_type": "StructProperty",
+        "key_struct_type": "Guid",
+        "value_struct_type": "StructProperty",
+        "id": None,
+        "value": [
+            {"key": UUID(uuid.uuid4().bytes), "value": {"Level": int_property(i)}}
+            for i in range(50)
+        ],
+        "type": "MapProperty",
+    }
+    world = {
+        "Counter": int_property(3),
+        "Rate": {"id": None, "value": float("nan"), "type": "FloatProperty"},
+        "Position": struct_property("Vector", {"x": 1.5, "y": 2.0, "z": -3.0}),
+        "Inner": struct_property("InnerThing", {"A": int_property(1)}),
+        "Things": things,
+    }
+    properties = {
+        "Version": int_property(7),
+        "worldSaveData": struct_property("PalWorldSaveData", world),
+    }
+    gvas = GvasFile.load(
+        {"header": HEADER, "properties": properties, "trailer": "AAAAAA=="}
+    )
+    return gvas.write(CUSTOM_PROPERTIES)
+
+
+def test_json_file_to_sav_round_trips(tmp_path):
+    raw_gvas = make_gvas()
+    sav_path = tmp_path / "Level.sav"
+    sav_path.write_bytes(compress_gvas_to_sav(raw_gvas, 0x32))
+    json_path = tmp_path / "Level.sav.json"
+    SaveFile().load_level_sav(sav_path.read_bytes()).to_json_file(str(json_path))
+    output_path = tmp_path / "Level.back.sav"
+
+    size = json_file_to_sav(str(json_path), str(output_path))
+
+    data = output_path.read_bytes()
+    assert size == len(data)
+    assert decompress_sav_to_gvas(data) == (raw_gvas, 0x32)
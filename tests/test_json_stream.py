@@ -0,0 +1,99 @@
+import io
+import json
+import math
+import uuid
+
+import pytest
+from palworld_save_tools.json_tools import CustomEncoder
+
+from palworld_save_pal.utils.json_stream import JsonPullReader, JsonStreamer, iter_json
+
+
+def make_tree():
+    return {
+        "header": {"magic": 1396790855, "save_game_class_name": "/Script/Pal"},
+        "properties": {
+            "worldSaveData": {
+                "value": {
+                    "CharacterSaveParameterMap": {
+                        "value": [
+                            {
+                                "key": {"InstanceId": uuid.uuid4(), "Index": i},
+                                "value": {
+                                    "Level": i % 60,
+                                    "Rate": float("nan") if i % 7 == 0 else i / 3,
+                                    "Name": f"Pal \"{i}\"\né",
+                                    "Flags": [True, False, None],
+                                    "Empty": {},
+                                },
+                            }
+                            for i in range(300)
+                        ]
+                    }
+                }
+            }
+        },
+        "trailer": "AAAAAA==",
+    }
+
+
+@pytest.mark.parametrize("indent", [None, "\t", 2])
+@pytest.mark.parametrize("batch_nodes", [0, 8, 2048])
+def test_stream_matches_json_dumps(indent, batch_nodes):
+    tree = make_tree()
+    expected = json.dumps(
+        tree,
+        indent=indent,
+        cls=CustomEncoder,
+        separators=None if indent is not None else (",", ":"),
+    )
+    streamer = JsonStreamer(indent=indent, batch_nodes=batch_nodes, chunk_size=256)
+    assert "".join(streamer.iter_chunks(tree)) == expected
+
+
+def test_stream_writes_nan_as_null_when_not_allowed():
+    tree = make_tree()
+    text = "".join(iter_json(tree, allow_nan=False))
+
+    def reject(constant):
+        raise ValueError(constant)
+
+    data = json.loads(text, parse_constant=reject)
+    values = data["properties"]["worldSaveData"]["value"]
+    values = values["CharacterSaveParameterMap"]["value"]
+    assert values[0]["value"]["Rate"] is None
+    assert math.isclose(values[1]["value"]["Rate"], 1 / 3)
+
+
+def test_stream_encodes_bytes_as_base64():
+    assert "".join(iter_json({"raw": b"\x00\x01"})) == '{"raw":"AAE="}'
+
+
+@pytest.mark.parametrize("buffer_size", [1, 7, 4096])
+def test_pull_reader_matches_json_loads(buffer_size):
+    text = json.dumps(make_tree(), cls=CustomEncoder, indent="\t")
+    reader = JsonPullReader(io.StringIO(text), buffer_size=buffer_size)
+
+    data = reader.read_value()
+
+    assert json.dumps(data) == json.dumps(json.loads(text))
+    assert reader.peek() == ""
+
+
+def test_pull_reader_walks_members():
+    text = '{"header": {"magic": 1}, "properties": {"a": [1, 2.5e-07], "b": "x"}}'
+    reader = JsonPullReader(io.StringIO(text), buffer_size=4)
+    seen = {}
+    for key in reader.iter_object():
+        if key == "properties":
+            for name in reader.iter_object():
+                seen[name] = reader.read_value()
+        else:
+            seen[key] = reader.read_value()
+
+    assert seen == {"header": {"magic": 1}, "a": [1, 2.5e-07], "b": "x"}
+
+
+def test_pull_reader_rejects_malformed_json():
+    with pytest.raises(json.JSONDecodeError):
+        JsonPullReader(io.StringIO('{"a": 1,}'), buffer_size=2).read_value()
@@ -0,0 +1,28 @@
+import uuid
+
+import pytest
+from pydantic import ValidationError
+
+from palworld_save_pal.ws.messages import (
+    MAX_PAGE_SIZE,
+    GetPlayerPalsData,
+    QueryPalsData,
+)
+
+
+@pytest.mark.parametrize(
+    "page",
+    [{"offset": -1}, {"limit": 0}, {"limit": -5}, {"limit": MAX_PAGE_SIZE + 1}],
+)
+def test_paging_rejects_out_of_range_values(page):
+    with pytest.raises(ValidationError):
+        GetPlayerPalsData(player_id=uuid.uuid4(), **page)
+    with pytest.raises(ValidationError):
+        QueryPalsData(query="level > 1", **page)
+
+
+def test_paging_defaults_and_bounds():
+    data = GetPlayerPalsData(player_id=uuid.uuid4())
+    assert (data.offset, data.limit) == (0, 100)
+    data = QueryPalsData(query="level > 1", offset=0, limit=MAX_PAGE_SIZE)
+    assert data.limit == MAX_PAGE_SIZE
@@ -0,0 +1,148 @@
+import uuid
+
+import pytest
+
+from palworld_save_pal.game.pal import Pal
+from palworld_save_pal.game.pal_index import PalIndex
+from palworld_save_pal.game.pal_objects import Element, PalGender
+from palworld_save_pal.game.pal_query import And, Comparison, Not, Or, parse_query
+
+OWNER = uuid.UUID(int=1)
+
+
+def make_pal(i, character_id, nickname="", level=1, passives=(), **kwargs):
+    return Pal(
+        instance_id=uuid.UUID(int=100 + i),
+        owner_uid=OWNER,
+        character_id=character_id,
+        nickname=nickname,
+        gender=PalGender.FEMALE,
+        level=level,
+        passive_skills=list(passives),
+        elements=[Element.NEUTRAL],
+        storage_slot=i,
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def index():
+    pals = [
+        make_pal(0, "SheepBall", "Wool", level=5, passives=["Legend"]),
+        make_pal(1, "SheepBall", "Woolly", level=15),
+        make_pal(2, "PinkCat", "", level=25, passives=["Legend", "Rare"]),
+        make_pal(3, "BOSS_PinkCat", "Boss", level=35, is_boss=True),
+        make_pal(4, "Sheep", "Cat", level=45, passives=["Rare"]),
+    ]
+    index = PalIndex()
+    index.rebuild({pal.instance_id: pal for pal in pals})
+    return index
+
+
+def nicknames(index, query, **kwargs):
+    _, pals = index.search(query, sort="slot", **kwargs)
+    return [pal.nickname or pal.character_id for pal in pals]
+
+
+def test_parse_precedence():
+    node = parse_query("level > 10 or passive = Legend and not boss = true")
+    assert node == Or(
+        (
+            Comparison("level", ">", 10),
+            And(
+                (
+                    Comparison("passive", "=", "legend"),
+                    Not(Comparison("boss", "=", True)),
+                )
+            ),
+        )
+    )
+    grouped = parse_query('(level > 10 or passive = Legend) and name ~ "wo"')
+    assert isinstance(grouped, And) and isinstance(grouped.operands[0], Or)
+
+
+def test_parse_normalizes_values():
+    assert parse_query("species = BOSS_PinkCat") == Comparison(
+        "species", "=", "pinkcat"
+    )
+    assert parse_query("nickname = Wool") == Comparison("name", "=", "wool")
+    assert parse_query("lucky != TRUE") == Comparison("lucky", "!=", True)
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "",
+        "level >",
+        "level > ten",
+        "passive > Legend",
+        "name != Wool",
+        "color = red",
+        "(level > 1",
+        "level > 1 level < 5",
+        "element = plasma",
+        "owner = nobody",
+    ],
+)
+def test_parse_rejects_malformed_queries(query):
+    with pytest.raises(ValueError):
+        parse_query(query)
+
+
+def test_name_equals_is_exact_and_tilde_is_substring(index):
+    assert nicknames(index, "name = wool") == ["Wool"]
+    assert nicknames(index, "name ~ wool") == ["Wool", "Woolly"]
+    # = also matches the species, but not a species containing the value
+    assert nicknames(index, "name = sheep") == ["Cat"]
+    assert nicknames(index, "name ~ cat") == ["PinkCat", "Boss", "Cat"]
+
+
+def test_not_inside_and(index):
+    assert nicknames(index, "passive = legend and not species = pinkcat") == ["Wool"]
+    assert nicknames(index, "not boss = true and not passive = rare") == [
+        "Wool",
+        "Woolly",
+    ]
+
+
+def test_range_only_and(index):
+    assert nicknames(index, "level >= 15 and level < 35") == ["Woolly", "PinkCat"]
+    assert nicknames(index, "level > 10 and level <= 40 and rank = 1") == [
+        "Woolly",
+        "PinkCat",
+        "Boss",
+    ]
+
+
+def test_or_and_precedence(index):
+    assert nicknames(index, "boss = true or passive = rare and level < 30") == [
+        "PinkCat",
+        "Boss",
+    ]
+    assert nicknames(index, "(boss = true or passive = rare) and level < 30") == [
+        "PinkCat"
+    ]
+
+
+def test_search_pages_by_level(index):
+    query = "level >= 1"
+    seen = []
+    for offset in range(0, 5, 2):
+        total, pals = index.search(query, offset=offset, limit=2)
+        assert total == 5
+        seen.extend(pal.level for pal in pals)
+    assert seen == [5, 15, 25, 35, 45]
+
+    total, pals = index.search(query, offset=1, limit=2, descending=True)
+    assert [pal.level for pal in pals] == [35, 25]
+    total, pals = index.search(query, offset=4, limit=2)
+    assert [pal.level for pal in pals] == [45]
+
+
+def test_search_follows_updates(index):
+    pal = index.search("name = wool")[1][0]
+    pal.nickname = "Fluff"
+    pal.level = 50
+    index.update(pal)
+    assert nicknames(index, "name = wool") == []
+    assert nicknames(index, "name = fluff and level = 50") == ["Fluff"]
@@ -0,0 +1,65 @@
+import asyncio
+import math
+
+from palworld_save_pal.editor.preset_profile import DEFAULT_DURABILITY, PresetProfile
+from palworld_save_pal.game.dynamic_item import DynamicItem
+from palworld_save_pal.game.item_container_slot import ItemContainerSlot
+from palworld_save_pal.game.pal_objects import PalObjects
+from palworld_save_pal.game.save_file import SaveFile
+from palworld_save_pal.game.world_generator import generate_world
+from palworld_save_pal.utils.reference_data import get_reference_data
+
+
+def test_applied_preset_round_trips_through_sav():
+    world = generate_world(players=1, pals=1, items=5, seed=4)
+    save_file = SaveFile().load_sav_files(world.level_sav, dict(world.player_savs))
+    player = next(iter(save_file.get_players().values()))
+    preset = PresetProfile(
+        name="Loadout",
+        type="inventory",
+        common_container=[
+            # A weapon with no durability in items.json
+            ItemContainerSlot(slot_index=0, count=1, static_id="DecalGun_1"),
+            # Not in items.json, its stored dynamic item is kept
+            ItemContainerSlot(
+                slot_index=1,
+                count=1,
+                static_id="Modded_Armor",
+                dynamic_item=DynamicItem(
+                    local_id=PalObjects.EMPTY_UUID, type="armor", durability=42.0
+                ),
+            ),
+        ],
+    )
+    containers = preset.container_slots(get_reference_data().get("items", "en"))
+    asyncio.run(save_file.apply_inventory([player], containers))
+
+    reloaded = SaveFile().load_sav_files(save_file.sav(), dict(world.player_savs))
+    slots = {
+        slot.static_id: slot
+        for slot in reloaded.get_players()[player.uid].common_container.slots
+    }
+    gun = slots["DecalGun_1"].dynamic_item
+    assert gun.type == "weapon" and gun.remaining_bullets == 99
+    assert not math.isnan(gun.durability)
+    assert gun.durability == DEFAULT_DURABILITY
+    armor = slots["Modded_Armor"].dynamic_item
+    assert armor.type == "armor" and armor.durability == 42.0
+    assert reloaded.validate().ok
+
+
+def test_accessories_drop_dynamic_items():
+    preset = PresetProfile(
+        name="Accessory",
+        type="inventory",
+        common_container=[
+            ItemContainerSlot(
+                slot_index=0,
+                count=1,
+                static_id="Accessory_AT_1",
+                dynamic_item=DynamicItem(local_id=PalObjects.EMPTY_UUID, type="armor"),
+            )
+        ],
+    )
+    containers = preset.container_slots(get_reference_data().get("items", "en"))
+    assert containers["common_container"][0].dynamic_item is None
@@ -0,0 +1,93 @@
+import json
+import os
+
+import pytest
+
+from palworld_save_pal.editor import preset_store as preset_store_module
+from palworld_save_pal.editor.preset_store import PresetStore
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "presets.json")
+
+
+def journal_lines(store):
+    with open(store.journal_path, "r", encoding="utf-8") as f:
+        return f.readlines()
+
+
+def test_changes_survive_reload(path):
+    store = PresetStore(path)
+    first, second = store.add_many([{"name": "A"}, {"name": "B"}])
+    assert store.rename(first, "A2")
+    assert store.delete([second, "missing"]) == [second]
+    assert len(journal_lines(store)) == 3
+
+    reloaded = PresetStore(path)
+    assert reloaded.all() == {first: {"name": "A2"}}
+
+
+def test_rename_and_delete_unknown_ids(path):
+    store = PresetStore(path)
+    assert store.rename("missing", "Name") is False
+    assert store.delete(["missing"]) == []
+    assert store.all() == {}
+
+
+def test_replay_skips_torn_last_line(path):
+    store = PresetStore(path)
+    preset_id = store.add({"name": "Kept"})
+    with open(store.journal_path, "a", encoding="utf-8") as f:
+        f.write('{"op":"rename","id":"%s","na' % preset_id)
+
+    reloaded = PresetStore(path)
+    assert reloaded.all() == {preset_id: {"name": "Kept"}}
+    # Loading folded the journal into the snapshot and dropped the torn record
+    with open(path, "r", encoding="utf-8") as f:
+        assert json.load(f) == {preset_id: {"name": "Kept"}}
+    assert reloaded.rename(preset_id, "Renamed")
+    assert PresetStore(path).get(preset_id) == {"name": "Renamed"}
+
+
+def test_append_after_torn_only_record(path):
+    store = PresetStore(path)
+    preset_id = store.add({"name": "Kept"})
+    store.compact()
+    with open(store.journal_path, "w", encoding="utf-8") as f:
+        f.write('{"op":"put","pre')
+
+    store = PresetStore(path)
+    added = store.add({"name": "Added"})
+    assert store.rename(preset_id, "Renamed")
+
+    assert PresetStore(path).all() == {
+        preset_id: {"name": "Renamed"},
+        added: {"name": "Added"},
+    }
+
+
+def test_compacts_after_threshold(path, monkeypatch):
+    monkeypatch.setattr(preset_store_module, "COMPACT_AFTER", 3)
+    store = PresetStore(path)
+    ids = [store.add({"name": f"Preset {i}"}) for i in range(3)]
+
+    with open(path, "r", encoding="utf-8") as f:
+        snapshot = json.load(f)
+    assert list(snapshot) == ids
+    assert not os.path.exists(store.journal_path)
+
+    store.delete(ids[:1])
+    assert len(journal_lines(store)) == 1
+    assert list(PresetStore(path).all()) == ids[1:]
+
+
+def test_compact_writes_snapshot_and_clears_journal(path):
+    store = PresetStore(path)
+    preset_id = store.add({"name": "A"})
+    store.compact()
+
+    assert not os.path.exists(store.journal_path)
+    with open(path, "r", encoding="utf-8") as f:
+        assert json.load(f) == {preset_id: {"name": "A"}}
+
@@ -0,0 +1,65 @@
+import math
+import uuid
+
+from palworld_save_pal.utils.save_diff import diff_objects, format_path
+
+
+def pal(instance_id, level, passives=("Legend",)):
+    return {
+        "key": {
+            "PlayerUId": {"value": uuid.UUID(int=0)},
+            "InstanceId": {"value": instance_id},
+        },
+        "value": {
+            "Level": {"value": level},
+            "Rate": {"value": float("nan")},
+            "PassiveSkillList": {"value": {"values": list(passives)}},
+        },
+    }
+
+
+def test_keyed_entries_match_regardless_of_order():
+    ids = [uuid.uuid4() for _ in range(4)]
+    original = {"value": [pal(i, 10) for i in ids]}
+    modified = {"value": [pal(i, 10) for i in reversed(ids)]}
+    modified["value"][0]["value"]["Level"]["value"] = 11
+    modified["value"][1]["value"]["PassiveSkillList"]["value"]["values"] = ["Swift"]
+
+    report = diff_objects(original, modified)
+
+    assert report["Added"] == [] and report["Deleted"] == []
+    updated = {entry["path"]: entry for entry in report["Updated"]}
+    assert updated[format_path(("value", 3, "value", "Level", "value"))] == {
+        "path": "['value'][3]['value']['Level']['value']",
+        "old_value": 10,
+        "new_value": 11,
+    }
+    skills = updated["['value'][2]['value']['PassiveSkillList']['value']['values']"]
+    assert skills["old_value"] == ["Legend"] and skills["new_value"] == ["Swift"]
+
+
+def test_added_and_deleted_entries_are_reported():
+    kept, removed, added = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    original = {"value": [pal(kept, 1), pal(removed, 2)]}
+    modified = {"value": [pal(added, 3), pal(kept, 1)]}
+
+    report = diff_objects(original, modified)
+
+    assert [entry["path"] for entry in report["Added"]] == ["['value'][0]"]
+    assert [entry["path"] for entry in report["Deleted"]] == ["['value'][1]"]
+    assert report["Deleted"][0]["value"]["key"]["InstanceId"]["value"] == str(removed)
+    assert math.isnan(report["Added"][0]["value"]["value"]["Rate"]["value"])
+    assert report["Updated"] == []
+
+
+def test_unkeyed_lists_compare_as_multisets():
+    original = {"values": [{"a": 1}, {"a": 2}, {"a": 2}]}
+    modified = {"values": [{"a": 2}, {"a": 3}]}
+
+    report = diff_objects(original, modified)
+
+    assert report["Added"] == [{"path": "['values'][1]", "value": {"a": 3}}]
+    assert sorted(entry["path"] for entry in report["Deleted"]) == [
+        "['values'][0]",
+        "['values'][1]",
+    ]
@@ -0,0 +1,180 @@
+import uuid
+
+from palworld_save_pal.game.save_validator import (
+    ReferenceSets,
+    Severity,
+    validate_world_save_data,
+)
+
+REFERENCE = ReferenceSets(
+    species=frozenset({"sheepball", "pinkcat"}),
+    items=frozenset({"Wood", "Stone", "AssaultRifle_Default1"}),
+    active_skills=frozenset({"EPalWazaID::AirCanon"}),
+    passive_skills=frozenset({"Legend"}),
+)
+
+
+def character(instance_id, container_id, character_id="SheepBall", **overrides):
+    save_parameter = {
+        "CharacterID": {"value": character_id},
+        "Gender": {"value": {"value": overrides.get("gender", "EPalGenderType::Male")}},
+        "EquipWaza": {"value": {"values": overrides.get("actives", [])}},
+        "PassiveSkillList": {"value": {"values": overrides.get("passives", [])}},
+        "SlotID": {"value": {"ContainerId": {"value": {"ID": {"value": container_id}}}}},
+    }
+    return {
+        "key": {"InstanceId": {"value": instance_id}},
+        "value": {
+            "RawData": {"value": {"object": {"SaveParameter": {"value": save_parameter}}}}
+        },
+    }
+
+
+def character_container(container_id, slot_num, pal_ids):
+    slots = [
+        {"SlotIndex": {"value": index}, "RawData": {"value": {"instance_id": pal_id}}}
+        for index, pal_id in pal_ids
+    ]
+    return {
+        "key": {"ID": {"value": container_id}},
+        "value": {"SlotNum": {"value": slot_num}, "Slots": {"value": {"values": slots}}},
+    }
+
+
+def item_slot(index, static_id, local_id=None):
+    return {
+        "RawData": {
+            "value": {
+                "slot_index": index,
+                "static_id": static_id,
+                "local_id": local_id or uuid.UUID(int=0),
+            }
+        }
+    }
+
+
+def dynamic_item(local_id, static_id):
+    return {
+        "RawData": {
+            "value": {"id": {"local_id_in_created_world": local_id, "static_id": static_id}}
+        }
+    }
+
+
+def make_world():
+    box, party = uuid.uuid4(), uuid.uuid4()
+    good, odd, missing, stray = (uuid.uuid4() for _ in range(4))
+    rifle, lost, unused = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    world = {
+        "CharacterSaveParameterMap": {
+            "value": [
+                character(good, box, actives=["EPalWazaID::AirCanon"], passives=["Legend"]),
+                character(
+                    odd,
+                    box,
+                    "BOSS_Dragon9000",
+                    gender="EPalGenderType::None",
+                    actives=["EPalWazaID::Nope"],
+                    passives=["Nope"],
+                ),
+                character(stray, party),
+            ]
+        },
+        "CharacterContainerSaveData": {
+            "value": [
+                character_container(box, 2, [(0, good), (0, odd), (1, missing)]),
+                character_container(party, 5, []),
+            ]
+        },
+        "ItemContainerSaveData": {
+            "value": [
+                {
+                    "key": {"ID": {"value": uuid.uuid4()}},
+                    "value": {
+                        "SlotNum": {"value": 2},
+                        "Slots": {
+                            "value": {
+                                "values": [
+                                    item_slot(0, "Wood"),
+                                    item_slot(1, "AssaultRifle_Default1", rifle),
+                                    item_slot(1, "Mystery"),
+                                    item_slot(4, "Stone", lost),
+                                ]
+                            }
+                        },
+                    },
+                }
+            ]
+        },
+        "DynamicItemSaveData": {
+            "value": {
+                "values": [
+                    dynamic_item(rifle, "AssaultRifle_Default1"),
+                    dynamic_item(unused, "Stone"),
+                ]
+            }
+        },
+        "GroupSaveDataMap": {
+            "value": [
+                {
+                    "key": uuid.uuid4(),
+                    "value": {
+                        "RawData": {
+                            "value": {
+                                "individual_character_handle_ids": [
+                                    {"guid": uuid.UUID(int=0), "instance_id": good},
+                                    {"guid": uuid.UUID(int=0), "instance_id": missing},
+                                ]
+                            }
+                        }
+                    },
+                }
+            ]
+        },
+    }
+    return world, {"odd": odd, "missing": missing, "stray": stray, "lost": lost, "unused": unused}
+
+
+def test_reports_each_kind_of_issue_once():
+    world, ids = make_world()
+
+    report = validate_world_save_data(world, REFERENCE)
+
+    assert report.counts() == {
+        "unknown_character_id": 1,
+        "unexpected_gender": 1,
+        "unknown_active_skill": 1,
+        "unknown_passive_skill": 1,
+        "duplicate_character_container_slot": 1,
+        "orphaned_pal_id": 1,
+        "character_container_overflow": 1,
+        "pal_not_in_container": 1,
+        "unknown_static_id": 1,
+        "duplicate_item_container_slot": 1,
+        "item_container_slot_out_of_range": 1,
+        "dangling_dynamic_item": 1,
+        "unreferenced_dynamic_item": 1,
+        "dangling_guild_handle": 1,
+    }
+    assert not report.ok
+    by_code = {issue.code: issue for issue in report.issues}
+    assert by_code["unknown_character_id"].value == "BOSS_Dragon9000"
+    assert by_code["orphaned_pal_id"].value == str(ids["missing"])
+    assert by_code["pal_not_in_container"].subject == str(ids["stray"])
+    assert by_code["dangling_dynamic_item"].value == str(ids["lost"])
+    assert by_code["unreferenced_dynamic_item"].severity == Severity.WARNING
+    assert report.checked["characters"] == 3
+
+
+def test_clean_world_is_ok():
+    box, pal = uuid.uuid4(), uuid.uuid4()
+    world = {
+        "CharacterSaveParameterMap": {"value": [character(pal, box)]},
+        "CharacterContainerSaveData": {
+            "value": [character_container(box, 1, [(0, pal)])]
+        },
+    }
+
+    report = validate_world_save_data(world, REFERENCE)
+
+    assert report.ok and report.issues == []
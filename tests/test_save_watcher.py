@@ -0,0 +1,104 @@
+import asyncio
+import os
+import uuid
+
+import pytest
+
+from palworld_save_pal.utils.save_watcher import MIN_INTERVAL, SaveWatcher
+
+
+@pytest.fixture
+def save_dir(tmp_path):
+    players_dir = tmp_path / "Players"
+    players_dir.mkdir()
+    (tmp_path / "Level.sav").write_bytes(b"level")
+    player_id = uuid.UUID(int=1)
+    (players_dir / f"{player_id.hex.upper()}.sav").write_bytes(b"player")
+    return tmp_path, player_id
+
+
+def rewrite(path, data: bytes):
+    path.write_bytes(data)
+    # Make sure the stat moves even on filesystems with coarse mtimes
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def make_watcher(save_dir) -> SaveWatcher:
+    directory, _ = save_dir
+    watcher = SaveWatcher(
+        str(directory / "Level.sav"), str(directory / "Players"), MIN_INTERVAL
+    )
+    watcher.rebaseline()
+    return watcher
+
+
+def test_reports_settled_changes(save_dir):
+    directory, player_id = save_dir
+    watcher = make_watcher(save_dir)
+    assert watcher.scan().empty
+
+    rewrite(directory / "Level.sav", b"level 2")
+    player_sav = directory / "Players" / f"{player_id.hex.upper()}.sav"
+    rewrite(player_sav, b"player 2")
+    # First sighting only marks the files pending until their stat settles
+    assert watcher.scan().empty
+
+    changes = watcher.scan()
+    assert changes.level_changed
+    assert changes.changed_players == {player_id: b"player 2"}
+    assert watcher.scan().empty
+
+
+def test_ignores_touch_without_content_change(save_dir):
+    directory, _ = save_dir
+    watcher = make_watcher(save_dir)
+
+    rewrite(directory / "Level.sav", b"level")
+    watcher.scan()
+    assert watcher.scan().empty
+
+
+def test_reports_removed_players(save_dir):
+    directory, player_id = save_dir
+    watcher = make_watcher(save_dir)
+
+    (directory / "Players" / f"{player_id.hex.upper()}.sav").unlink()
+    assert watcher.scan().removed_players == [player_id]
+
+
+def test_rebaseline_after_own_save_reports_nothing(save_dir):
+    directory, _ = save_dir
+    watcher = make_watcher(save_dir)
+
+    rewrite(directory / "Level.sav", b"level 2")
+    watcher.scan()
+    # Saved by us between two polls
+    watcher.rebaseline()
+    assert watcher.scan().empty
+    assert watcher.scan().empty
+
+
+def test_running_watcher_skips_own_save_and_reports_external_one(save_dir):
+    directory, _ = save_dir
+    reported = []
+
+    async def on_changes(changes):
+        reported.append(changes)
+
+    async def run():
+        watcher = make_watcher(save_dir)
+        watcher.start(on_changes)
+        try:
+            rewrite(directory / "Level.sav", b"saved by us")
+            await asyncio.to_thread(watcher.rebaseline)
+            await asyncio.sleep(MIN_INTERVAL * 3)
+            assert reported == []
+
+            rewrite(directory / "Level.sav", b"saved by the server")
+            await asyncio.sleep(MIN_INTERVAL * 3)
+        finally:
+            watcher.stop()
+
+    asyncio.run(run())
+    assert len(reported) == 1 and reported[0].level_changed
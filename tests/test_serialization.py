@@ -0,0 +1,56 @@
+import json
+import uuid
+
+from fastapi.encoders import jsonable_encoder
+
+from palworld_save_pal.game.item_container import ItemContainer, ItemContainerType
+from palworld_save_pal.game.item_container_slot import ItemContainerSlot
+from palworld_save_pal.game.pal import Pal
+from palworld_save_pal.game.pal_objects import PalGender
+from palworld_save_pal.game.player import Player
+from palworld_save_pal.ws.messages import MessageType
+from palworld_save_pal.ws.utils import build_response
+
+
+def make_players(player_count: int, pals_per_player: int):
+    players = {}
+    for p in range(player_count):
+        uid = uuid.uuid4()
+        pals = {}
+        for i in range(pals_per_player):
+            pal_id = uuid.uuid4()
+            pals[pal_id] = Pal(
+                instance_id=pal_id,
+                owner_uid=uid,
+                character_id="SheepBall",
+                gender=PalGender.MALE,
+                nickname=f"Pal {i}",
+                level=i % 60,
+                passive_skills=["Legend", "Rare"],
+                active_skills=["EPalWazaID::Unique_SheepBall_Roll"],
+                storage_id=uuid.uuid4(),
+                storage_slot=i,
+            )
+        players[uid] = Player(
+            uid=uid,
+            nickname=f"Player {p}",
+            level=50,
+            exp=1000,
+            pals=pals,
+            common_container=ItemContainer(
+                id=uuid.uuid4(),
+                type=ItemContainerType.COMMON,
+                slots=[
+                    ItemContainerSlot(slot_index=i, count=1, static_id="Wood")
+                    for i in range(42)
+                ],
+            ),
+        )
+    return players
+
+
+def test_build_response_matches_jsonable_encoder():
+    players = make_players(2, 5)
+    legacy = jsonable_encoder({"type": MessageType.GET_PLAYERS.value, "data": players})
+    assert json.loads(build_response(MessageType.GET_PLAYERS, players)) == legacy
+
@@ -0,0 +1,85 @@
+import csv
+import uuid
+
+from palworld_save_pal.game.dynamic_item import DynamicItem
+from palworld_save_pal.game.guild import Guild
+from palworld_save_pal.game.item_container import ItemContainer, ItemContainerType
+from palworld_save_pal.game.item_container_slot import ItemContainerSlot
+from palworld_save_pal.game.pal import Pal
+from palworld_save_pal.game.pal_objects import PalGender
+from palworld_save_pal.game.player import Player
+from palworld_save_pal.game.save_file import SaveFile
+from palworld_save_pal.game.table_export import TableFormat, export_tables
+
+
+def make_save_file(pal_count):
+    guild = Guild(id=uuid.uuid4(), name="Ranch", players=[])
+    rifle = uuid.uuid4()
+    container = ItemContainer(
+        id=uuid.uuid4(),
+        type=ItemContainerType.COMMON,
+        slots=[
+            ItemContainerSlot(slot_index=0, count=10, static_id="Wood"),
+            ItemContainerSlot(
+                slot_index=1,
+                count=1,
+                static_id="AssaultRifle_Default1",
+                dynamic_item=DynamicItem(local_id=rifle, type="weapon", durability=0.5),
+            ),
+        ],
+    )
+    player = Player(
+        uid=uuid.uuid4(),
+        nickname="Tester",
+        level=10,
+        exp=100,
+        guild=guild,
+        common_container=container,
+    )
+    guild.players.append(player.uid)
+    save_file = SaveFile()
+    save_file._players = {player.uid: player}
+    save_file._guilds = {guild.id: guild}
+    save_file._pals = {}
+    for i in range(pal_count):
+        pal = Pal(
+            instance_id=uuid.uuid4(),
+            character_id="SheepBall",
+            nickname=f"Pal, {i}",
+            gender=PalGender.FEMALE,
+            level=i % 50 + 1,
+            passive_skills=["Legend", "Rare"],
+        )
+        save_file._pals[pal.instance_id] = pal
+    return save_file, player, rifle
+
+
+def read_csv(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+def test_export_tables_writes_csv_in_chunks(tmp_path):
+    save_file, player, rifle = make_save_file(25)
+
+    result = export_tables(save_file, str(tmp_path), TableFormat.CSV, chunk_rows=10)
+
+    assert result.rows == {
+        "pals": 25,
+        "players": 1,
+        "guilds": 1,
+        "item_slots": 2,
+        "dynamic_items": 1,
+    }
+    pals = read_csv(tmp_path / "pals.csv")
+    assert len(pals) == 25
+    assert pals[3]["nickname"] == "Pal, 3"
+    assert pals[3]["gender"] == "Female"
+    assert pals[3]["passive_skills"] == "Legend|Rare"
+    players = read_csv(tmp_path / "players.csv")
+    assert players[0]["guild_id"] == str(save_file.get_guilds().popitem()[0])
+    slots = read_csv(tmp_path / "item_slots.csv")
+    assert [slot["local_id"] for slot in slots] == ["", str(rifle)]
+    items = read_csv(tmp_path / "dynamic_items.csv")
+    assert items[0]["player_uid"] == str(player.uid)
+    assert float(items[0]["durability"]) == 0.5
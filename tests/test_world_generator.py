@@ -0,0 +1,27 @@
+from palworld_save_pal.game.save_file import SaveFile
+from palworld_save_pal.game.world_generator import WEAPON_EVERY, generate_world
+
+
+def test_generated_world_loads_validates_and_saves():
+    world = generate_world(players=2, pals=7, items=WEAPON_EVERY * 2, seed=3)
+
+    save_file = SaveFile(name="synthetic").load_sav_files(
+        world.level_sav, dict(world.player_savs)
+    )
+
+    assert save_file.pal_count() == 7
+    assert set(save_file.get_pals()) == set(world.pal_ids)
+    players = list(save_file.get_players().values())
+    assert sorted(len(player.pals) for player in players) == [3, 4]
+    assert all(player.guild.id == world.guild_id for player in players)
+    slots = players[0].common_container.slots
+    assert len(slots) == WEAPON_EVERY * 2
+    assert sum(1 for slot in slots if slot.dynamic_item) == 2
+    assert save_file.validate().ok
+
+    reloaded = SaveFile().load_sav_files(save_file.sav(), dict(world.player_savs))
+    assert set(reloaded.get_pals()) == set(world.pal_ids)
+
+
+def test_same_seed_same_world():
+    assert generate_world(pals=3, seed=5) == generate_world(pals=3, seed=5)